@@ -0,0 +1,188 @@
+"""
+Match server load generator.
+
+Opens hundreds of concurrent matches against a match server and reports
+how steadily each shard held its tick rate. Starts its own server on a
+free local port unless ``--connect`` points at a running one.
+
+Usage:
+    python benchmarks/bench_match_server.py [--matches N] [--remote FRACTION]
+        [--round-time SECONDS] [--shards N] [--connect HOST:PORT]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.chdir(project_root)
+
+from config import MATCH_SERVER_STATS_INTERVAL
+from src.core.match_server import MatchServer
+from src.entities.main_character import MainCharacter
+
+INPUT_INTERVAL = 0.2  # seconds between random inputs in remote matches
+
+
+async def play_match(host: str, port: int, mode: str, round_time: float, seed: int,
+                     results: List[dict]) -> None:
+    """
+    Play one match on its own connection and record the outcome.
+
+    Remote matches send a random action every ``INPUT_INTERVAL`` seconds
+    and count the states received.
+
+    Args:
+        host (str): Server address.
+        port (int): Server port.
+        mode (str): "ai" or "remote".
+        round_time (float): Round length in seconds.
+        seed (int): Seed for the AI-driven player and the random inputs.
+        results (List[dict]): The outcome is appended here.
+    """
+    started = time.perf_counter()
+    result = {"mode": mode, "states": 0, "error": None}
+    sender = None
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+        request = {"op": "start", "mode": mode, "round_time": round_time, "seed": seed}
+        writer.write(json.dumps(request).encode() + b"\n")
+
+        if mode == "remote":
+            async def send_inputs():
+                rng = random.Random(seed)
+                while True:
+                    await asyncio.sleep(INPUT_INTERVAL)
+                    action = rng.choice(MainCharacter.ACTIONS)
+                    writer.write(json.dumps({"op": "input", "action": action}).encode() + b"\n")
+            sender = asyncio.create_task(send_inputs())
+
+        while True:
+            line = await reader.readline()
+            if not line:
+                result["error"] = "connection closed"
+                break
+            message = json.loads(line)
+            if message["type"] == "state":
+                result["states"] += 1
+            elif message["type"] == "started":
+                result["shard"] = message["shard"]
+            elif message["type"] == "end":
+                result.update(winner=message["winner"], ticks=message["ticks"])
+                break
+            elif message["type"] == "error":
+                result["error"] = message["message"]
+                break
+        writer.close()
+    except OSError as e:
+        result["error"] = str(e)
+    finally:
+        if sender is not None:
+            sender.cancel()
+    result["seconds"] = time.perf_counter() - started
+    results.append(result)
+
+
+async def monitor(host: str, port: int, interval: float, reports: Dict[int, List[dict]]) -> None:
+    """
+    Poll shard statistics until cancelled.
+
+    Args:
+        host (str): Server address.
+        port (int): Server port.
+        interval (float): Seconds between polls.
+        reports (Dict[int, List[dict]]): Reports are appended per shard.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    seen = set()
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            writer.write(b'{"op": "stats"}\n')
+            message = json.loads(await reader.readline())
+            for stats in message["shards"]:
+                # Skip reports already recorded and windows with no matches
+                if stats is None or (stats["shard"], stats["report"]) in seen:
+                    continue
+                seen.add((stats["shard"], stats["report"]))
+                if stats["matches"]:
+                    reports[stats["shard"]].append(stats)
+    finally:
+        writer.close()
+
+
+async def run(args) -> None:
+    """Run the load test and print the report."""
+    server = None
+    if args.connect:
+        host, port = args.connect.rsplit(":", 1)
+        port = int(port)
+    else:
+        server = MatchServer("127.0.0.1", 0, args.shards)
+        await server.start()
+        host, port = server.host, server.port
+        # Let every shard decode its sprites before the load starts
+        await asyncio.sleep(2.0)
+
+    reports: Dict[int, List[dict]] = defaultdict(list)
+    watcher = asyncio.create_task(monitor(host, port, MATCH_SERVER_STATS_INTERVAL, reports))
+
+    results: List[dict] = []
+    rng = random.Random(0)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        play_match(host, port, "remote" if rng.random() < args.remote else "ai",
+                   args.round_time, index, results)
+        for index in range(args.matches)
+    ))
+    elapsed = time.perf_counter() - started
+    watcher.cancel()
+    if server is not None:
+        await server.close()
+
+    failed = [result for result in results if result["error"]]
+    remote = [result for result in results if result["mode"] == "remote" and not result["error"]]
+    print(f"{len(results) - len(failed)}/{len(results)} matches finished in {elapsed:.1f}s "
+          f"({len(remote)} remote)")
+    for result in failed[:5]:
+        print(f"  failed: {result['error']}")
+    if remote:
+        expected = sum(result["ticks"] for result in remote)
+        received = sum(result["states"] for result in remote)
+        print(f"Remote states received: {received}/{expected}")
+
+    print(f"\n{'shard':>5} {'reports':>7} {'matches':>7} {'tick/s':>7} {'min':>7} "
+          f"{'lag p99':>8} {'lag max':>8} {'step p99':>8} {'overruns':>8}")
+    for shard in sorted(reports):
+        window = reports[shard]
+        rates = [stats["tick_rate"] for stats in window]
+        print(f"{shard:>5} {len(window):>7} {max(s['matches'] for s in window):>7} "
+              f"{sum(rates) / len(rates):>7.2f} {min(rates):>7.2f} "
+              f"{max(s['lag_p99_ms'] for s in window):>6.2f}ms "
+              f"{max(s['lag_max_ms'] for s in window):>6.2f}ms "
+              f"{max(s['step_p99_ms'] for s in window):>6.2f}ms {window[-1]['overruns']:>8}")
+
+
+def main() -> None:
+    """Parse arguments and run the load generator."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--matches", type=int, default=300, help="concurrent matches")
+    parser.add_argument("--remote", type=float, default=0.25,
+                        help="fraction of matches driven by remote input")
+    parser.add_argument("--round-time", type=float, default=20, help="round length in seconds")
+    parser.add_argument("--shards", type=int, default=None,
+                        help="shards for the bundled server (default: one per CPU core)")
+    parser.add_argument("--connect", help="HOST:PORT of a running server")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Render backend benchmark.
+
+Compares the frame time of ``Game.render`` on the software surface path
+against the SDL2 texture path at 800x600 and 1920x1080. Runs against the
+dummy video driver and SDL's software renderer unless told otherwise, so
+it works on machines without a display or GPU.
+
+Usage:
+    python benchmarks/bench_render_backends.py [--frames N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.chdir(project_root)
+
+from src.core.game import Game
+
+RESOLUTIONS = [(800, 600), (1920, 1080)]
+BACKENDS = ["surface", "texture"]
+
+
+def bench_backend(backend: str, size, frames: int) -> float:
+    """
+    Measure the mean render time of one backend.
+
+    Args:
+        backend (str): Render backend name.
+        size: Frame size (width, height).
+        frames (int): Number of frames to time.
+
+    Returns:
+        float: Mean frame time in milliseconds.
+    """
+    game = Game(*size, render_backend=backend)
+    game.update()
+
+    # Warm up so texture uploads are not counted
+    for _ in range(10):
+        game.render()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.update()
+        game.render()
+    elapsed = time.perf_counter() - start
+
+    game.close()
+    return elapsed * 1000 / frames
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200, help="frames to time per run")
+    args = parser.parse_args()
+
+    print(f"{'resolution':>12} {'backend':>8} {'ms/frame':>9}")
+    for size in RESOLUTIONS:
+        results = {}
+        for backend in BACKENDS:
+            results[backend] = bench_backend(backend, size, args.frames)
+            print(f"{size[0]:>5}x{size[1]:<6} {backend:>8} {results[backend]:>9.3f}")
+        speedup = results["surface"] / results["texture"]
+        print(f"{'':>12} {'speedup':>8} {speedup:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
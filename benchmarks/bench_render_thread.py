@@ -0,0 +1,114 @@
+"""
+Render thread benchmark.
+
+Compares unpaced throughput of the single-threaded loop (update, then
+render, on one thread) against the render-thread mode (updates on a
+simulation thread publishing snapshots, the main thread drawing them) at
+800x600 and 1920x1080. Snapshots are double buffered here, so every tick
+is drawn and both modes do the same work; the threaded mode wins by
+simulating the next tick while SDL blits and presents the current one
+with the GIL released, which needs more than one CPU core.
+
+Usage:
+    python benchmarks/bench_render_thread.py [--ticks N] [--backend surface|texture]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.chdir(project_root)
+
+from src.core.game import Game
+
+RESOLUTIONS = [(800, 600), (1920, 1080)]
+
+
+def _tick(game: Game) -> None:
+    """Run one simulation tick, restarting the match when it ends."""
+    game.update()
+    if game.game_over:
+        game.restart_game()
+
+
+def bench_single(game: Game, ticks: int) -> float:
+    """
+    Update and render in turn on one thread.
+
+    Returns:
+        float: Ticks drawn per second.
+    """
+    start = time.perf_counter()
+    for _ in range(ticks):
+        _tick(game)
+        game.render()
+    return ticks / (time.perf_counter() - start)
+
+
+def bench_threaded(game: Game, ticks: int) -> float:
+    """
+    Update on a simulation thread while the main thread renders each snapshot.
+
+    Returns:
+        float: Ticks drawn per second.
+    """
+    def simulate():
+        for _ in range(ticks):
+            _tick(game)
+            game.snapshots.publish(game.snapshot(), wait=True)
+        game.snapshots.close()
+
+    simulation = threading.Thread(target=simulate, name="simulation")
+    start = time.perf_counter()
+    simulation.start()
+    while True:
+        snapshot = game.snapshots.take()
+        if snapshot is None:
+            break
+        game.render(snapshot)
+    simulation.join()
+    return ticks / (time.perf_counter() - start)
+
+
+def run(mode: str, size, backend: str, ticks: int) -> float:
+    """Measure one mode on a fresh game after a short warm-up."""
+    game = Game(*size, render_backend=backend, render_thread=mode == "thread")
+    for _ in range(10):
+        _tick(game)
+        game.render()
+    result = (bench_threaded if mode == "thread" else bench_single)(game, ticks)
+
+    game.close()
+    return result
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=300, help="simulation ticks per run")
+    parser.add_argument("--backend", choices=("surface", "texture"), default="surface",
+                        help="render backend (default: surface)")
+    args = parser.parse_args()
+
+    print(f"CPU cores: {os.cpu_count()}, backend: {args.backend}")
+    print(f"{'resolution':>12} {'mode':>7} {'frames/s':>9}")
+    for size in RESOLUTIONS:
+        results = {}
+        for mode in ("single", "thread"):
+            results[mode] = run(mode, size, args.backend, args.ticks)
+            print(f"{size[0]:>5}x{size[1]:<6} {mode:>7} {results[mode]:>9.0f}")
+        speedup = results["thread"] / results["single"]
+        print(f"{'':>12} {'speedup':>7} {speedup:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+Performance benchmark suite.
+
+Times the hot paths of the game against the dummy video driver and compares
+the results with stored JSON baselines. Each benchmark reports the mean and
+p95 time per operation and the peak bytes allocated per operation (traced
+with ``tracemalloc`` in a separate pass so tracing does not skew timings).
+
+Usage:
+    python benchmarks/run_benchmarks.py                     # compare with baselines
+    python benchmarks/run_benchmarks.py --update-baselines  # record new baselines
+    python benchmarks/run_benchmarks.py --tolerance 0.5 --only collision_update
+
+Exits with status 1 when any benchmark's mean or p95 exceeds its baseline
+by more than the tolerance.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.chdir(project_root)
+
+import pygame
+
+from config import PLAYER_START_X, PLAYER_START_Y
+from src.core.game import Game
+from src.core.match_env import VectorMatchEnv
+from src.entities.main_character import MainCharacter
+from src.entities.villain import Villain
+from src.systems.collision_handler import CollisionHandler
+from src.utils.sprite_manifest import clear_clip_cache
+from src.utils.sprite_utils import SpriteSheet
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+DEFAULT_TOLERANCE = 0.25
+
+# A benchmark setup returns the operation to time and a teardown callback
+Setup = Callable[[], Tuple[Callable[[], None], Callable[[], None]]]
+
+
+def _init_display() -> None:
+    """Make sure a display surface exists for entity sprite loading."""
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((800, 600))
+
+
+def _shutdown_game(game: Game) -> None:
+    """Release a game's worker threads and the display."""
+    game.close()
+
+
+def setup_sprite_sheet_get_frames():
+    """Load a sprite sheet and slice a full animation row."""
+    _init_display()
+    path = "assets/sprites/Scorpian/Sstance1.png"
+
+    def op():
+        SpriteSheet(path).get_frames(0, 8, MainCharacter.SPRITE_WIDTH_STANCE,
+                                     MainCharacter.SPRITE_HEIGHT_STANCE)
+
+    return op, pygame.quit
+
+
+def setup_game_init_cold():
+    """Construct a Game from scratch, decoding every image (disk caches off)."""
+    def op():
+        clear_clip_cache()
+        _shutdown_game(Game(disk_cache=False))
+
+    return op, lambda: None
+
+
+def setup_game_init_warm():
+    """Construct a Game from scratch, mapping images from the populated disk caches."""
+    def op():
+        clear_clip_cache()
+        _shutdown_game(Game())
+
+    return op, lambda: None
+
+
+def setup_main_character_update_frame():
+    """Advance the player's animation while running."""
+    _init_display()
+    player = MainCharacter(PLAYER_START_X, PLAYER_START_Y)
+    player.x_change = 5
+
+    def op():
+        player.update_frame(600)
+
+    return op, pygame.quit
+
+
+def setup_villain_update_frame():
+    """Advance the villain's animation while walking."""
+    _init_display()
+    villain = Villain(600, PLAYER_START_Y)
+    villain.state = "WALK"
+    villain.x_change = -1
+
+    def op():
+        villain.update_frame(PLAYER_START_X)
+
+    return op, pygame.quit
+
+
+def setup_collision_update():
+    """Resolve collisions between two overlapping, attacking fighters."""
+    _init_display()
+    player = MainCharacter(300, PLAYER_START_Y)
+    villain = Villain(350, PLAYER_START_Y)
+    handler = CollisionHandler()
+
+    def op():
+        player.is_punching = True
+        villain.is_kicking = True
+        handler.update(player, villain)
+
+    return op, pygame.quit
+
+
+def setup_game_update():
+    """Run full simulation ticks of a live round."""
+    game = Game()
+    game.update()
+    game.villain.state = "WALK"
+
+    def op():
+        game.update()
+        if not game.round_active or game.game_over:
+            game.restart_game()
+
+    return op, lambda: _shutdown_game(game)
+
+
+def setup_game_render():
+    """Render a full frame, including HUD, on the surface backend."""
+    game = Game()
+    game.update()
+
+    def op():
+        game.render()
+
+    return op, lambda: _shutdown_game(game)
+
+
+def setup_vector_env_step():
+    """Step 16 headless training environments in lockstep."""
+    envs = VectorMatchEnv(16)
+    envs.reset(seed=0)
+    actions = [index % len(envs.actions) for index in range(envs.num_envs)]
+
+    def op():
+        envs.step(actions)
+
+    return op, envs.close
+
+
+# name -> (setup, timed iterations)
+BENCHMARKS: Dict[str, Tuple[Setup, int]] = {
+    "sprite_sheet_get_frames": (setup_sprite_sheet_get_frames, 50),
+    "game_init_cold": (setup_game_init_cold, 5),
+    "game_init_warm": (setup_game_init_warm, 5),
+    "main_character_update_frame": (setup_main_character_update_frame, 20000),
+    "villain_update_frame": (setup_villain_update_frame, 20000),
+    "collision_update": (setup_collision_update, 20000),
+    "game_update": (setup_game_update, 5000),
+    "game_render": (setup_game_render, 300),
+    "vector_env_step": (setup_vector_env_step, 2000),
+}
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_benchmark(setup: Setup, iterations: int) -> Dict[str, float]:
+    """
+    Time one benchmark and measure its allocations.
+
+    Args:
+        setup (Setup): Benchmark setup function.
+        iterations (int): Number of timed operations.
+
+    Returns:
+        Dict[str, float]: mean_us, p95_us and alloc_bytes per operation.
+    """
+    op, teardown = setup()
+    try:
+        # Warm up caches and lazy initialization
+        for _ in range(max(1, iterations // 10)):
+            op()
+
+        timings = []
+        perf_counter = time.perf_counter
+        for _ in range(iterations):
+            start = perf_counter()
+            op()
+            timings.append(perf_counter() - start)
+
+        # Separate pass for allocations: peak traced bytes above the baseline
+        alloc_runs = max(1, min(iterations, 200))
+        tracemalloc.start()
+        allocated = 0
+        for _ in range(alloc_runs):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            op()
+            allocated += tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+    finally:
+        teardown()
+
+    return {
+        "mean_us": sum(timings) / len(timings) * 1e6,
+        "p95_us": _percentile(timings, 0.95) * 1e6,
+        "alloc_bytes": allocated / alloc_runs,
+    }
+
+
+def compare(name: str, result: Dict[str, float], baseline: Dict[str, float],
+            tolerance: float) -> List[str]:
+    """
+    Compare a result with its baseline.
+
+    Args:
+        name (str): Benchmark name.
+        result (Dict[str, float]): Measured values.
+        baseline (Dict[str, float]): Stored baseline values.
+        tolerance (float): Allowed relative slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        List[str]: Descriptions of regressions; empty if within tolerance.
+    """
+    regressions = []
+    for metric in ("mean_us", "p95_us"):
+        limit = baseline[metric] * (1 + tolerance)
+        if result[metric] > limit:
+            regressions.append(
+                f"{name}: {metric} {result[metric]:.1f} > {baseline[metric]:.1f} (+{tolerance:.0%})"
+            )
+    return regressions
+
+
+def main() -> None:
+    """Run the suite, print results and check or update the baselines."""
+    parser = argparse.ArgumentParser(description="Serial Killer performance benchmarks")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--update-baselines", action="store_true",
+                        help="store the results as the new baselines")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed relative slowdown (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), metavar="NAME",
+                        help="run only the named benchmarks")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiply every benchmark's iteration count")
+    args = parser.parse_args()
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+
+    results = {}
+    regressions = []
+    print(f"{'benchmark':<28} {'mean us':>10} {'p95 us':>10} {'alloc B/op':>11} {'vs base':>8}")
+    for name in args.only or BENCHMARKS:
+        setup, iterations = BENCHMARKS[name]
+        result = run_benchmark(setup, max(1, int(iterations * args.scale)))
+        results[name] = result
+
+        ratio = ""
+        if name in baselines:
+            ratio = f"{result['mean_us'] / baselines[name]['mean_us']:.2f}x"
+            regressions.extend(compare(name, result, baselines[name], args.tolerance))
+        print(f"{name:<28} {result['mean_us']:>10.2f} {result['p95_us']:>10.2f} "
+              f"{result['alloc_bytes']:>11.0f} {ratio:>8}")
+
+    if args.update_baselines:
+        baselines.update({name: {k: round(v, 3) for k, v in r.items()} for name, r in results.items()})
+        with open(args.baseline, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baselines written to {args.baseline}")
+        return
+
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,12 @@ SCREEN_HEIGHT = 600
 FPS = 30
 BACKGROUND_COLOR = (0, 0, 0)
 
+# ===== Render Backend =====
+RENDER_BACKEND = "surface"  # "surface" (software blits) or "texture" (SDL2 renderer)
+RENDER_SCALING = "linear"  # "linear" or "integer" scaling of the frame to the window
+WINDOW_SIZE = None  # window size for the texture backend; None matches the screen size
+RENDER_THREAD = False  # simulate on a separate thread; the main thread draws its latest snapshot
+
 # ===== Game Constants =====
 GAME_TITLE = "Serial Killer - Fighting Game"
 
@@ -20,14 +26,103 @@ GAME_TITLE = "Serial Killer - Fighting Game"
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 SPRITES_DIR = os.path.join(ASSETS_DIR, "sprites")
+IMAGE_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "images")  # decoded images for later launches; None disables
 
 # Background image path
 BACKGROUND_IMAGE = os.path.join(ASSETS_DIR, "palacegrounds.png")
 
+# Stage backgrounds, cycled between rounds
+STAGE_IMAGES = [
+    BACKGROUND_IMAGE,
+    os.path.join(ASSETS_DIR, "backgroundLevel1.jpg"),
+    os.path.join(ASSETS_DIR, "backgrounLevel1.png"),
+]
+STAGE_MEMORY_BUDGET = 8 * 1024 * 1024  # bytes of decoded stage backgrounds kept resident
+STAGE_WIDTH = 1600  # stage width in pixels; the camera scrolls when wider than the screen
+STAGE_TILE_SIZE = 256  # backgrounds are split into tiles of this size for culling
+CAMERA_ZOOM_LEVELS = (1.0, 1.25, 1.5)  # zoom factors; pick ones that scale STAGE_TILE_SIZE to whole pixels
+CAMERA_ZOOM_MARGIN = 120  # stage pixels kept between the fighters and the view edges
+ZOOM_CACHE_BUDGET = 16 * 1024 * 1024  # bytes of scaled sprite frames and tiles kept for zooming
+
 # Character sprite paths
 SCORPION_SPRITES_DIR = os.path.join(SPRITES_DIR, "Scorpian")
 SONYA_SPRITES_DIR = os.path.join(SPRITES_DIR, "sonya")
 
+# ===== Costumes =====
+# Palette swaps: (source color, per-channel tolerance, target color) rules;
+# the target is shaded by the brightness of the pixels it replaces
+COSTUMES = {
+    "frost": [  # Scorpion in blue; low blue tolerances leave the skin alone
+        ((215, 175, 10), (41, 71, 24), (70, 150, 255)),
+        ((140, 95, 10), (60, 45, 24), (50, 110, 230)),
+        ((240, 220, 75), (16, 20, 40), (80, 160, 255)),
+        ((245, 240, 130), (14, 16, 50), (120, 190, 255)),
+    ],
+    "crimson": [  # Sonya in red
+        ((60, 90, 10), (40, 40, 20), (230, 50, 40)),
+        ((125, 165, 20), (35, 40, 30), (255, 60, 50)),
+        ((135, 180, 65), (25, 30, 25), (255, 70, 60)),
+        ((170, 215, 80), (30, 40, 40), (255, 90, 80)),
+    ],
+}
+PLAYER_COSTUME = None  # name in COSTUMES, or None for the original colors
+ENEMY_COSTUME = None
+COSTUME_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "costumes")  # None disables the disk cache
+
+# ===== Input =====
+INPUT_BUFFER_SIZE = 256  # key events kept in the input ring buffer
+COMMAND_INPUT_GAP_MS = 300  # longest pause between inputs of one command
+COMMAND_CHARGE_MS = 800  # hold time that charges a direction
+COMMAND_CHORD_MS = 50  # window for pressing buttons together
+
+# ===== AI =====
+AI_DIFFICULTY = "normal"  # "easy", "normal" or "hard"; hard adds look-ahead search
+AI_TICK_BUDGET_US = 200  # CPU budget per tick for the villain AI
+AI_DECISION_INTERVAL_MS = 200  # minimum time between villain decisions
+
+# ===== Audio =====
+AUDIO_DIR = os.path.join(ASSETS_DIR, "audio")
+SOUND_FILES = {
+    "hit": AUDIO_DIR,  # a single WAV shipped as assets/audio
+    "whoosh": None,  # None or a missing file uses a synthesized effect
+    "block": None,
+    "ko": None,
+}
+MUSIC_FILE = None  # background music streamed from disk, e.g. an .ogg file
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER_SIZE = 256  # mixer buffer in samples; ~6 ms at 44.1 kHz
+AUDIO_CHANNELS = 8  # channel pool shared by all effects
+AUDIO_VOLUME = 0.8
+
+# ===== Telemetry =====
+TELEMETRY_PATH = os.path.join(BASE_DIR, ".cache", "combat_log.jsonl")  # None disables the combat event log
+TELEMETRY_MAX_BYTES = 1024 * 1024  # rotate the log at this size
+TELEMETRY_BACKUPS = 3  # rotated logs kept
+TELEMETRY_FLUSH_INTERVAL = 0.5  # seconds between background writes
+
+# ===== Video Capture =====
+CAPTURE_DIR = "captures"  # recordings are written here (F5 toggles recording)
+CAPTURE_FORMAT = "auto"  # "ffmpeg" (mp4), "png" or "raw"; "auto" uses ffmpeg if installed
+CAPTURE_BUFFERS = 8  # frames the encoder may fall behind before captures are dropped
+
+# ===== Frame Pacing =====
+FRAME_PACING = "tick"  # "tick" (sleep), "busy" (tick_busy_loop, exact) or "vsync" (wait on display refresh)
+MAX_FRAME_SKIP = 2  # renders skipped in a row so the simulation keeps FPS under load
+DYNAMIC_QUALITY = True  # drop costly effects while frames keep missing the budget
+QUALITY_MISS_LIMIT = 10  # missed frames within the window that lower quality
+QUALITY_WINDOW = 60  # frames the miss count covers; this many on-budget frames restore quality
+
+# ===== Match Server =====
+MATCH_SERVER_HOST = "127.0.0.1"
+MATCH_SERVER_PORT = 8765
+MATCH_SERVER_SHARDS = None  # worker processes; None uses one per CPU core
+MATCH_SERVER_TICK_RATE = 30  # simulation ticks per second in every match
+MATCH_SERVER_STATS_INTERVAL = 1.0  # seconds between shard tick-rate reports
+
+# ===== Profiling =====
+PROFILER_HISTORY = 300  # frames kept by the frame-time profiler
+PROFILER_CSV_PATH = "frame_times.csv"
+
 # ===== Collision Detection =====
 COLLISION_COOLDOWN = 500  # milliseconds
 
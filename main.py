@@ -2,8 +2,16 @@
 Main entry point for the Serial Killer Fighting Game.
 
 This script initializes and runs the game.
+
+Usage:
+    python main.py                          # Play the game
+    python main.py --profile 3000           # Profile a 3000-frame scripted match
+    python main.py --profile 3000 --no-render
+    python main.py --crowd 2,16,128,1024    # Time the update pipeline against crowd size
+    python main.py --assets                 # Report asset memory by sheet, clip and character
 """
 
+import argparse
 import sys
 import os
 
@@ -15,13 +23,110 @@ if project_root not in sys.path:
 from src.core.game import Game
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    
+    Args:
+        argv: Argument list; defaults to sys.argv.
+        
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Serial Killer - Fighting Game")
+    parser.add_argument("--profile", type=int, metavar="N",
+                        help="profile N frames of a scripted match headless and exit")
+    parser.add_argument("--no-render", action="store_true",
+                        help="skip rendering while profiling")
+    parser.add_argument("--profile-output", default="profile", metavar="PREFIX",
+                        help="output prefix for the .pstats and .txt files (default: profile)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed for the scripted match or crowd scene (default: 0)")
+    parser.add_argument("--crowd", metavar="COUNTS",
+                        help="run the crowd stress scene headless at comma-separated fighter counts")
+    parser.add_argument("--crowd-frames", type=int, default=120, metavar="N",
+                        help="frames timed per crowd size (default: 120)")
+    parser.add_argument("--crowd-render", action="store_true",
+                        help="render the crowd scene")
+    parser.add_argument("--crowd-collision", choices=("pairs", "all"), default="pairs",
+                        help="check each pair, or every player against every villain (default: pairs)")
+    parser.add_argument("--assets", action="store_true",
+                        help="print the asset memory report headless and exit")
+    return parser.parse_args(argv)
+
+
+def profile(args: argparse.Namespace) -> None:
+    """
+    Run the scripted profiling harness against the dummy video driver.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    
+    from src.core.profiling import run_profile
+    
+    summary = run_profile(args.profile, render=not args.no_render,
+                          output=args.profile_output, seed=args.seed)
+    print(summary)
+    print(f"Profile written to {args.profile_output}.pstats and {args.profile_output}.txt")
+
+
+def crowd(args: argparse.Namespace) -> None:
+    """
+    Run the crowd stress scene against the dummy video driver.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    
+    from src.core.crowd_scene import run_crowd
+    
+    counts = [int(count) for count in args.crowd.split(",")]
+    print(run_crowd(counts, args.crowd_frames, args.crowd_render, args.crowd_collision, args.seed))
+
+
+def assets(args: argparse.Namespace) -> None:
+    """
+    Load the game against the dummy video driver and report its asset memory.
+    
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    
+    from src.core.asset_memory import format_report
+    
+    game = Game()
+    try:
+        print(format_report(game))
+    finally:
+        game.close()
+
+
 def main():
     """
     Main entry point for the game.
     
     Initializes and runs the game engine.
     """
+    args = parse_args()
+    
     try:
+        if args.profile:
+            profile(args)
+            return
+        if args.crowd:
+            crowd(args)
+            return
+        if args.assets:
+            assets(args)
+            return
+        
         game = Game()
         game.run()
     except Exception as e:
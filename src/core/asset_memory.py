@@ -0,0 +1,254 @@
+"""
+Asset memory accounting.
+
+This module measures the pixel memory held by loaded assets: sprite frames
+by sheet, clip and character, stage backgrounds and the zoom cache. A frame
+that is a subsurface keeps its whole sheet alive, so memory is counted per
+pixel owner, once, however many frames, clips or characters share it.
+
+Usage:
+    python main.py --assets
+"""
+
+import os
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import pygame
+
+from src.utils.palette_swap import palette_key
+from src.utils.sprite_manifest import MANIFEST_NAME, cached_clips, load_manifest, manifest_sheets
+
+MB = 1024 * 1024
+
+
+def pixel_owner(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Get the surface that owns a surface's pixels.
+
+    Args:
+        surface (pygame.Surface): A surface or subsurface.
+
+    Returns:
+        pygame.Surface: The top-level parent of a subsurface, else the surface.
+    """
+    return surface.get_abs_parent()
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """
+    Get the bytes of pixel data a surface keeps alive.
+
+    Args:
+        surface (pygame.Surface): A surface or subsurface.
+
+    Returns:
+        int: Size of the pixel owner's pixel data.
+    """
+    owner = pixel_owner(surface)
+    return owner.get_pitch() * owner.get_height()
+
+
+def owned_bytes(surfaces: Iterable[pygame.Surface]) -> int:
+    """
+    Get the bytes of pixel data a group of surfaces keeps alive, counting shared owners once.
+
+    Args:
+        surfaces (Iterable[pygame.Surface]): Surfaces or subsurfaces.
+
+    Returns:
+        int: Total size of their distinct pixel owners.
+    """
+    owners = {pixel_owner(surface) for surface in surfaces}
+    return sum(owner.get_pitch() * owner.get_height() for owner in owners)
+
+
+class ClipMemory(NamedTuple):
+    """
+    Pixel memory of one animation clip.
+
+    Attributes:
+        name (str): Clip name from the manifest.
+        sheet (str): Sheet the clip is sliced from.
+        frames (int): Frame count.
+        nbytes (int): Bytes kept alive by the frames.
+    """
+
+    name: str
+    sheet: str
+    frames: int
+    nbytes: int
+
+
+class SheetMemory(NamedTuple):
+    """
+    Pixel memory of the frames sliced from one sheet.
+
+    Attributes:
+        name (str): Sheet file name.
+        clips (int): Clips sliced from the sheet.
+        frames (int): Frames sliced from the sheet.
+        nbytes (int): Bytes kept alive by those frames.
+        whole_sheet (bool): Whether frames are subsurfaces keeping the whole sheet alive.
+    """
+
+    name: str
+    clips: int
+    frames: int
+    nbytes: int
+    whole_sheet: bool
+
+
+class CharacterMemory(NamedTuple):
+    """
+    Pixel memory of a character's loaded clips.
+
+    Attributes:
+        name (str): Label for the report.
+        sprites_dir (str): Directory the clips were loaded from.
+        palette (Optional[str]): Costume palette key, None for the original colors.
+        clips (Tuple[ClipMemory, ...]): Every clip, by name.
+        sheets (Tuple[SheetMemory, ...]): Every sheet in use, by name.
+        facings (Dict[str, int]): Bytes of "left" and "right" facing clips.
+        unreferenced (Tuple[str, ...]): Sheet files in the directory that no
+            clip uses; they cost disk space, not memory.
+        nbytes (int): Bytes kept alive by all the clips.
+    """
+
+    name: str
+    sprites_dir: str
+    palette: Optional[str]
+    clips: Tuple[ClipMemory, ...]
+    sheets: Tuple[SheetMemory, ...]
+    facings: Dict[str, int]
+    unreferenced: Tuple[str, ...]
+    nbytes: int
+
+
+def character_memory(character, name: Optional[str] = None) -> CharacterMemory:
+    """
+    Account for the clips a character loaded.
+
+    Args:
+        character: A ``MainCharacter`` or ``Villain``.
+        name (Optional[str]): Label for the report; the class name if omitted.
+
+    Returns:
+        CharacterMemory: Bytes by clip, sheet and facing.
+    """
+    sprites_dir = character.sprites_dir
+    try:
+        manifest = load_manifest(os.path.join(sprites_dir, MANIFEST_NAME))
+    except (OSError, ValueError):
+        manifest = {"clips": {}}
+    specs = manifest.get("clips") if isinstance(manifest, dict) else None
+    if not isinstance(specs, dict):
+        specs = {}
+
+    clips = []
+    by_sheet: Dict[str, List[pygame.Surface]] = {}
+    clip_counts: Dict[str, int] = {}
+    facings = {"left": [], "right": []}
+    for clip_name, frames in sorted(character.clips.items()):
+        spec = specs.get(clip_name)
+        sheet = spec.get("sheet", "?") if isinstance(spec, dict) else "?"
+        clips.append(ClipMemory(clip_name, sheet, len(frames), owned_bytes(frames)))
+        by_sheet.setdefault(sheet, []).extend(frames)
+        clip_counts[sheet] = clip_counts.get(sheet, 0) + 1
+        for facing, group in facings.items():
+            if clip_name.endswith(f"_{facing}"):
+                group.extend(frames)
+
+    sheets = tuple(
+        SheetMemory(sheet, clip_counts[sheet], len(frames), owned_bytes(frames),
+                    any(pixel_owner(frame) is not frame for frame in frames))
+        for sheet, frames in sorted(by_sheet.items())
+    )
+
+    used = set(manifest_sheets(manifest))
+    try:
+        files = os.listdir(sprites_dir)
+    except OSError:
+        files = []
+    unreferenced = tuple(sorted(
+        file for file in files if file.lower().endswith(".png") and file not in used
+    ))
+
+    all_frames = [frame for frames in character.clips.values() for frame in frames]
+    palette = getattr(character, "palette", None)
+    return CharacterMemory(
+        name or type(character).__name__, sprites_dir, palette_key(palette) if palette else None,
+        tuple(clips), sheets, {facing: owned_bytes(group) for facing, group in facings.items()},
+        unreferenced, owned_bytes(all_frames)
+    )
+
+
+def summary(game) -> Dict[str, int]:
+    """
+    Get the bytes held by each kind of asset in a running game.
+
+    Cheap enough to call every tick while the debug overlay is shown.
+
+    Args:
+        game: The ``Game``.
+
+    Returns:
+        Dict[str, int]: Bytes of "sprites" (both fighters' frames),
+        "clip_cache" (every clip set kept for reuse, including costume
+        variants no fighter uses now), "stages" (cached backgrounds),
+        "zoom_cache" (scaled copies) and "total" (all of them, with frames
+        counted once).
+    """
+    fighter_frames = [frame for character in (game.player, game.villain)
+                      for frames in character.clips.values() for frame in frames]
+    cached_frames = [frame for clips in cached_clips().values()
+                     for frames in clips.values() for frame in frames]
+    totals = {
+        "sprites": owned_bytes(fighter_frames),
+        "clip_cache": owned_bytes(cached_frames),
+        "stages": game.stage_manager.cached_bytes,
+        "zoom_cache": game.view.cache.nbytes,
+    }
+    totals["total"] = owned_bytes(fighter_frames + cached_frames) + totals["stages"] + totals["zoom_cache"]
+    return totals
+
+
+def format_report(game) -> str:
+    """
+    Format a full asset memory report for a game.
+
+    Args:
+        game: The ``Game``.
+
+    Returns:
+        str: The report.
+    """
+    lines = ["Asset memory (decoded pixel data)", ""]
+    for character, label in ((game.player, "Player"), (game.villain, "Villain")):
+        usage = character_memory(character, f"{label} ({type(character).__name__})")
+        costume = f", palette {usage.palette}" if usage.palette else ""
+        lines.append(f"{usage.name}: {usage.nbytes / MB:.2f} MB from {usage.sprites_dir}{costume}")
+        lines.append(f"  {'sheet':<24} {'clips':>5} {'frames':>6} {'KB':>9}")
+        for sheet in usage.sheets:
+            note = "  whole sheet kept by subsurfaces" if sheet.whole_sheet else ""
+            lines.append(f"  {sheet.name:<24} {sheet.clips:>5} {sheet.frames:>6} {sheet.nbytes / 1024:>9.1f}{note}")
+        lines.append(f"  {'clip':<24} {'sheet':>20} {'frames':>6} {'KB':>9}")
+        for clip in usage.clips:
+            lines.append(f"  {clip.name:<24} {clip.sheet:>20} {clip.frames:>6} {clip.nbytes / 1024:>9.1f}")
+        lines.append("  facings: " + ", ".join(
+            f"{facing} {nbytes / MB:.2f} MB" for facing, nbytes in usage.facings.items()
+        ))
+        if usage.unreferenced:
+            lines.append(f"  unreferenced sheets ({len(usage.unreferenced)}, not loaded): "
+                         + ", ".join(usage.unreferenced))
+        lines.append("")
+
+    totals = summary(game)
+    stages = game.stage_manager
+    zoom_cache = game.view.cache
+    lines.append(f"Clip cache: {len(cached_clips())} clip sets, {totals['clip_cache'] / MB:.2f} MB")
+    lines.append(f"Stages: {totals['stages'] / MB:.2f} MB cached of {stages.memory_budget / MB:.2f} MB budget, "
+                 f"current {game.background.nbytes / MB if game.background else 0:.2f} MB")
+    lines.append(f"Zoom cache: {len(zoom_cache)} copies, {totals['zoom_cache'] / MB:.2f} MB "
+                 f"of {zoom_cache.memory_budget / MB:.2f} MB budget")
+    lines.append(f"Total: {totals['total'] / MB:.2f} MB")
+    return "\n".join(lines)
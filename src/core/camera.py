@@ -0,0 +1,196 @@
+"""
+Camera.
+
+This module maps a stage wider than the screen onto the viewport: it
+follows both fighters, zooms in on close exchanges, keeps the fighters in
+view, and culls background tiles and sprites that fall outside it.
+"""
+
+import pygame
+from typing import Optional, Sequence, Tuple
+
+from src.systems.stage_manager import TiledBackground
+from src.utils.scaled_cache import ScaledSurfaceCache
+
+
+class Camera:
+    """
+    Horizontal scrolling, zooming view onto the stage.
+
+    The camera exposes ``blit(source, dest)`` taking stage coordinates, so
+    entity ``draw`` methods draw through it unchanged: it shifts each draw
+    into screen coordinates and skips the ones entirely outside the view
+    before they reach the render backend.
+
+    Zoom is quantized to ``zoom_levels`` and anchored at the bottom of the
+    stage so the floor stays in place. When zoomed, the software backend
+    draws pre-scaled copies of frames and tiles from a ``ScaledSurfaceCache``;
+    a backend with ``scales_on_draw`` stretches its textures instead. Scaled
+    sizes only depend on the source and the level, never on the camera
+    position, so every copy is reused while the camera pans.
+
+    Attributes:
+        view_size (Tuple[int, int]): Viewport size in pixels.
+        stage_size (Tuple[int, int]): Stage size in pixels.
+        zoom_levels (Tuple[float, ...]): Allowed zoom factors, ascending.
+        zoom_margin (int): Stage pixels kept between the fighters and the view edges.
+        zoom (float): Current zoom factor.
+        cache (ScaledSurfaceCache): Scaled copies used while zoomed.
+        x (int): Stage X coordinate of the viewport's left edge.
+        drawn (int): Blits passed to the backend in the current frame.
+        culled (int): Blits skipped in the current frame.
+    """
+
+    def __init__(self, view_size: Tuple[int, int], stage_size: Tuple[int, int], backend=None,
+                 zoom_levels: Sequence[float] = (1.0,), zoom_margin: int = 0,
+                 cache: Optional[ScaledSurfaceCache] = None):
+        """
+        Initialize the camera at the left edge of the stage.
+
+        Args:
+            view_size (Tuple[int, int]): Viewport size in pixels.
+            stage_size (Tuple[int, int]): Stage size in pixels.
+            backend: Render backend draws are forwarded to.
+            zoom_levels (Sequence[float]): Allowed zoom factors; values below 1 are ignored.
+            zoom_margin (int): Stage pixels kept between the fighters and the view edges.
+            cache (Optional[ScaledSurfaceCache]): Cache for scaled copies; an
+                unbounded one is created if omitted.
+        """
+        self.view_size = view_size
+        self.stage_size = stage_size
+        self.backend = backend
+        self.zoom_levels = tuple(sorted({1.0, *(level for level in zoom_levels if level >= 1.0)}))
+        self.zoom_margin = zoom_margin
+        # Stage width in view at each zoom level, narrowing as the zoom grows
+        self._level_widths = tuple((level, view_size[0] / level) for level in self.zoom_levels)
+        self.zoom = 1.0
+        self.cache = cache if cache is not None else ScaledSurfaceCache(float("inf"))
+        self.x = 0
+        self.drawn = 0
+        self.culled = 0
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Area of the stage in view."""
+        width = -(-self.view_size[0] // self.zoom)
+        height = -(-self.view_size[1] // self.zoom)
+        return pygame.Rect(self.x, max(0, self.stage_size[1] - height), width, height)
+
+    def center_on(self, stage_x: float) -> None:
+        """
+        Center the view on a stage X coordinate, stopping at the stage edges.
+
+        Args:
+            stage_x (float): Stage X coordinate to center on.
+        """
+        width = self.view_size[0] / self.zoom
+        max_x = max(0, self.stage_size[0] - width)
+        self.x = int(min(max(stage_x - width / 2, 0), max_x))
+
+    def follow(self, *fighters: Tuple[object, int]) -> None:
+        """
+        Zoom to fit the fighters, center on them and pull any that is out of view back in.
+
+        Zooming in needs ``zoom_margin`` on both sides of the fighters.
+        Zooming out waits until less than half of it is left and then steps
+        out only as far as needed, so the zoom does not flicker when the
+        fighters hover around a threshold.
+
+        Args:
+            *fighters (Tuple[object, int]): Each entity with its sprite width.
+        """
+        # Runs every tick, so this avoids generators and repeated divisions
+        left = right = None
+        for entity, width in fighters:
+            x = entity.x
+            if left is None or x < left:
+                left = x
+            if right is None or x + width > right:
+                right = x + width
+        span = right - left
+        needed = span + 2 * self.zoom_margin
+        zoom = 1.0
+        for level, level_width in self._level_widths:
+            if needed > level_width:
+                break
+            zoom = level
+        if zoom < self.zoom:
+            # Zoom out only as far as needed to keep half the margin
+            needed = span + self.zoom_margin
+            for level, level_width in self._level_widths:
+                if zoom < level <= self.zoom and needed <= level_width:
+                    zoom = level
+        self.zoom = zoom
+
+        view_width = self.view_size[0] / zoom
+        max_x = max(0, self.stage_size[0] - view_width)
+        self.x = camera_x = int(min(max((left + right) / 2 - view_width / 2, 0), max_x))
+        for entity, width in fighters:
+            x = entity.x
+            if x < camera_x:
+                entity.x = camera_x
+            elif x > camera_x + view_width - width:
+                entity.x = camera_x + view_width - width
+
+    def begin_frame(self, background: Optional[TiledBackground], color: Tuple[int, int, int]) -> None:
+        """
+        Start a frame and draw the background tiles under the view.
+
+        Args:
+            background (Optional[TiledBackground]): Stage background, or None.
+            color (Tuple[int, int, int]): Fill color behind the background.
+        """
+        self.drawn = 0
+        self.culled = 0
+        view = self.rect
+        covered = background is not None and background.get_width() >= view.right \
+            and background.get_height() >= view.bottom
+        # Skip the fill when the tiles cover every pixel of the view
+        self.backend.begin_frame(None, None if covered else color)
+        if background is None:
+            return
+        for tile, tile_x, tile_y in background.visible(view):
+            self._draw(tile, tile_x, tile_y, view, snap_edges=True)
+
+    def blit(self, source: pygame.Surface, dest) -> None:
+        """
+        Draw a surface at a stage position if any of it is in view.
+
+        Args:
+            source (pygame.Surface): Surface to draw.
+            dest: Stage position (x, y).
+        """
+        view = self.rect
+        width, height = source.get_size()
+        if dest[0] >= view.right or dest[0] + width <= view.x \
+                or dest[1] >= view.bottom or dest[1] + height <= view.y:
+            self.culled += 1
+            return
+        self._draw(source, dest[0], dest[1], view)
+
+    def _draw(self, source: pygame.Surface, x: float, y: float, view: pygame.Rect,
+              snap_edges: bool = False) -> None:
+        """
+        Draw a surface at a stage position, scaled by the current zoom.
+
+        Sprites are scaled to a fixed size per level so moving never creates
+        new copies. Tiles sit at fixed positions, so they scale their edges
+        instead and neighbouring tiles meet without gaps.
+        """
+        self.drawn += 1
+        if self.zoom == 1.0:
+            self.backend.blit(source, (x - view.x, y - view.y))
+            return
+
+        zoom = self.zoom
+        left, top = round(x * zoom), round(y * zoom)
+        width, height = source.get_size()
+        if snap_edges:
+            size = (round((x + width) * zoom) - left, round((y + height) * zoom) - top)
+        else:
+            size = (round(width * zoom), round(height * zoom))
+        screen_x, screen_y = left - round(view.x * zoom), top - round(view.y * zoom)
+        if getattr(self.backend, "scales_on_draw", False):
+            self.backend.blit(source, (screen_x, screen_y, *size))
+        else:
+            self.backend.blit(self.cache.get(source, size), (screen_x, screen_y))
@@ -0,0 +1,226 @@
+"""
+Crowd stress scene.
+
+This module fills the arena with many fighters and runs them through the
+game's per-tick pipeline (AI, movement, animation, collision and, when
+enabled, rendering) to measure how each phase scales with the number of
+fighters. It runs headless against the dummy video driver.
+
+Usage:
+    python main.py --crowd 2,16,128,1024 [--crowd-frames N] [--crowd-render]
+        [--crowd-collision pairs|all]
+"""
+
+import random
+import time
+from typing import Dict, List, Sequence
+
+import pygame
+
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BACKGROUND_COLOR, PLAYER_START_Y, ENEMY_START_Y,
+    AI_TICK_BUDGET_US, AI_DECISION_INTERVAL_MS
+)
+from src.core.render_backend import create_backend
+from src.entities.main_character import MainCharacter
+from src.entities.villain import Villain
+from src.systems.ai_controller import AIController, DIFFICULTY_LEVELS
+from src.systems.collision_handler import CollisionHandler
+
+COLLISION_MODES = ("pairs", "all")
+
+
+class CrowdScene:
+    """
+    Many fighters running the normal update pipeline at once.
+
+    Fighters are spawned as player/villain pairs at random positions. Each
+    villain is driven by its own ``AIController`` at a random difficulty
+    (without look-ahead search) against its paired player, and each player
+    picks a random action at its own random interval. Fighters that are
+    knocked out are revived so the crowd stays the same size.
+
+    Collision either checks each pair, as a match does (``"pairs"``), or
+    every player against every villain (``"all"``), which shows where naive
+    rect checks stop scaling.
+
+    Attributes:
+        players (List[MainCharacter]): Player-side fighters.
+        villains (List[Villain]): Villain-side fighters, paired by index.
+        collision (str): One of ``COLLISION_MODES``.
+        render (bool): Whether frames are drawn.
+        tick (int): Ticks run so far.
+    """
+
+    PHASES = ("ai", "physics", "animation", "collision", "render", "flip")
+
+    def __init__(self, count: int, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT,
+                 render: bool = False, collision: str = "pairs", seed: int = 0):
+        """
+        Spawn the crowd.
+
+        Args:
+            count (int): Number of fighters; rounded up to an even number.
+            width (int): Arena width in pixels.
+            height (int): Arena height in pixels.
+            render (bool): Draw every frame.
+            collision (str): One of ``COLLISION_MODES``.
+            seed (int): Seed for positions, difficulties and actions.
+
+        Raises:
+            ValueError: If the collision mode is unknown.
+        """
+        if collision not in COLLISION_MODES:
+            raise ValueError(f"Unknown collision mode: {collision}")
+
+        pygame.init()
+        self.backend = create_backend("surface", (width, height))
+        self.render = render
+        self.collision = collision
+        self.tick = 0
+        self._now = 0
+        self._rng = random.Random(seed)
+        random.seed(seed)  # entities and the AI draw from the global generator
+
+        difficulties = [name for name, level in DIFFICULTY_LEVELS.items() if not level["search"]]
+        self.players: List[MainCharacter] = []
+        self.villains: List[Villain] = []
+        self.controllers: List[AIController] = []
+        self._action_intervals: List[int] = []
+        for _ in range((count + 1) // 2):
+            player = MainCharacter(self._rng.uniform(0, width - MainCharacter.SPRITE_WIDTH_STANCE),
+                                   PLAYER_START_Y)
+            villain = Villain(self._rng.uniform(0, width - Villain.SPRITE_WIDTH_WALKING), ENEMY_START_Y)
+            player.MAX_X = width - player.SPRITE_WIDTH_STANCE
+            villain.MAX_X = width - villain.SPRITE_WIDTH_WALKING
+            self.players.append(player)
+            self.villains.append(villain)
+            self.controllers.append(AIController(
+                villain, self._rng.choice(difficulties), AI_TICK_BUDGET_US, FPS, AI_DECISION_INTERVAL_MS
+            ))
+            self._action_intervals.append(self._rng.randint(4, 20))
+
+        # One handler per player so hit cooldowns stay per fighter
+        self.collision_handlers = [CollisionHandler(clock=lambda: self._now) for _ in self.players]
+        self.totals: Dict[str, float] = dict.fromkeys(self.PHASES, 0.0)
+        self.frames = 0
+
+    @property
+    def count(self) -> int:
+        """Number of fighters in the scene."""
+        return len(self.players) + len(self.villains)
+
+    def step(self) -> None:
+        """Run one tick and, when enabled, render it, adding each phase's time to ``totals``."""
+        players, villains, totals = self.players, self.villains, self.totals
+        start = time.perf_counter()
+
+        for index, (player, controller) in enumerate(zip(players, self.controllers)):
+            if self.tick % self._action_intervals[index] == 0:
+                player.perform_action(self._rng.choice(MainCharacter.ACTIONS), controller.villain.x)
+            controller.update(player)
+        mark = time.perf_counter()
+        totals["ai"] += mark - start
+        start = mark
+
+        for player, villain in zip(players, villains):
+            player.update_position()
+            villain.update_position(player.x)
+        mark = time.perf_counter()
+        totals["physics"] += mark - start
+        start = mark
+
+        for player, villain in zip(players, villains):
+            player.update_frame(villain.x)
+            villain.update_frame(player.x)
+        mark = time.perf_counter()
+        totals["animation"] += mark - start
+        start = mark
+
+        if self.collision == "pairs":
+            for handler, player, villain in zip(self.collision_handlers, players, villains):
+                handler.update(player, villain)
+        else:
+            for handler, player in zip(self.collision_handlers, players):
+                for villain in villains:
+                    handler.update(player, villain)
+        for fighter in (*players, *villains):
+            if not fighter.is_alive():
+                fighter.health = fighter.max_health
+        mark = time.perf_counter()
+        totals["collision"] += mark - start
+        start = mark
+
+        if self.render:
+            self.backend.begin_frame(None, BACKGROUND_COLOR)
+            for player, villain in zip(players, villains):
+                player.draw(self.backend)
+                villain.draw(self.backend)
+            mark = time.perf_counter()
+            totals["render"] += mark - start
+            start = mark
+
+            self.backend.present()
+            totals["flip"] += time.perf_counter() - start
+
+        self.tick += 1
+        self._now += 1000 // FPS
+        self.frames += 1
+
+    def report(self) -> Dict[str, float]:
+        """
+        Get the mean time per frame of each phase.
+
+        Returns:
+            Dict[str, float]: Phase name, plus "frame", to milliseconds.
+        """
+        frames = max(1, self.frames)
+        result = {phase: total * 1000 / frames for phase, total in self.totals.items()}
+        result["frame"] = sum(result.values())
+        return result
+
+
+def run_crowd(counts: Sequence[int], frames: int = 120, render: bool = False,
+              collision: str = "pairs", seed: int = 0, warmup: int = 10) -> str:
+    """
+    Run the crowd scene at several sizes and tabulate phase times.
+
+    Args:
+        counts (Sequence[int]): Fighter counts to measure.
+        frames (int): Frames timed per count.
+        render (bool): Whether to render each frame.
+        collision (str): One of ``COLLISION_MODES``.
+        seed (int): Seed for the scene.
+        warmup (int): Untimed frames run first at each count.
+
+    Returns:
+        str: The report table.
+    """
+    phases = CrowdScene.PHASES if render else CrowdScene.PHASES[:4]
+    lines = [
+        f"Crowd scene: {frames} frames per count, render={'on' if render else 'off'}, "
+        f"collision={collision}, seed={seed}",
+        "",
+        f"{'fighters':>8} " + " ".join(f"{phase:>10}" for phase in phases)
+        + f" {'frame ms':>10} {'us/fighter':>10} {'max fps':>8}",
+    ]
+    for count in counts:
+        scene = CrowdScene(count, render=render, collision=collision, seed=seed)
+        for _ in range(warmup):
+            scene.step()
+        scene.totals = dict.fromkeys(scene.PHASES, 0.0)
+        scene.frames = 0
+        for _ in range(frames):
+            scene.step()
+
+        result = scene.report()
+        frame_ms = result["frame"]
+        lines.append(
+            f"{scene.count:>8} " + " ".join(f"{result[phase]:>10.3f}" for phase in phases)
+            + f" {frame_ms:>10.3f} {frame_ms * 1000 / scene.count:>10.2f} "
+            f"{1000 / frame_ms if frame_ms else float('inf'):>8.0f}"
+        )
+    lines.append("")
+    lines.append("Phase columns are mean milliseconds per frame.")
+    pygame.quit()
+    return "\n".join(lines)
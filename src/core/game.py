@@ -6,17 +6,45 @@ This module manages the overall game flow, rendering, and event handling.
 
 import pygame
 import sys
-from typing import Tuple
+import threading
+from typing import Optional
 
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BACKGROUND_COLOR, GAME_TITLE,
     PLAYER_START_X, PLAYER_START_Y, ENEMY_START_X, ENEMY_START_Y,
-    BACKGROUND_IMAGE
+    IMAGE_CACHE_DIR, COSTUMES, PLAYER_COSTUME, ENEMY_COSTUME, COSTUME_CACHE_DIR,
+    STAGE_IMAGES, STAGE_MEMORY_BUDGET, STAGE_WIDTH, STAGE_TILE_SIZE,
+    CAMERA_ZOOM_LEVELS, CAMERA_ZOOM_MARGIN, ZOOM_CACHE_BUDGET,
+    RENDER_BACKEND, RENDER_SCALING, WINDOW_SIZE, RENDER_THREAD,
+    PROFILER_HISTORY, PROFILER_CSV_PATH, INPUT_BUFFER_SIZE,
+    COMMAND_INPUT_GAP_MS, COMMAND_CHARGE_MS, COMMAND_CHORD_MS,
+    AI_DIFFICULTY, AI_TICK_BUDGET_US, AI_DECISION_INTERVAL_MS,
+    SOUND_FILES, MUSIC_FILE, AUDIO_FREQUENCY, AUDIO_BUFFER_SIZE, AUDIO_CHANNELS, AUDIO_VOLUME,
+    TELEMETRY_PATH, TELEMETRY_MAX_BYTES, TELEMETRY_BACKUPS, TELEMETRY_FLUSH_INTERVAL,
+    CAPTURE_DIR, CAPTURE_FORMAT, CAPTURE_BUFFERS,
+    FRAME_PACING, MAX_FRAME_SKIP, DYNAMIC_QUALITY, QUALITY_MISS_LIMIT, QUALITY_WINDOW
 )
 from src.entities.main_character import MainCharacter
 from src.entities.villain import Villain
+from src.systems.ai_controller import AIController, ATTACK_ACTIONS
+from src.systems.audio_manager import AudioManager
 from src.systems.collision_handler import CollisionHandler
+from src.systems.input_handler import InputHandler
+from src.systems import command_recognizer
+from src.systems.command_recognizer import CommandRecognizer
+from src.systems.stage_manager import StageManager
+from src.systems.telemetry import Telemetry
+from src.core import asset_memory
+from src.core.camera import Camera
 from src.core.game_state import GameState, GameStateManager
+from src.core.render_backend import create_backend
+from src.core.render_snapshot import RenderSnapshot, SnapshotBuffer
+from src.utils.frame_pacer import FramePacer
+from src.utils.frame_profiler import FrameProfiler
+from src.utils import image_cache, palette_swap
+from src.utils.scaled_cache import ScaledSurfaceCache
+from src.utils.scheduler import Scheduler
+from src.utils.video_capture import VideoCapture
 
 
 class Game:
@@ -24,57 +52,134 @@ class Game:
     Main game engine managing game loop, rendering, and game logic.
     
     Attributes:
-        screen (pygame.Surface): The game display surface.
-        clock (pygame.time.Clock): Clock for FPS management.
+        backend: Render backend the frame is drawn through.
+        screen (pygame.Surface): Surface UI elements are drawn on.
+        pacer (FramePacer): Keeps the simulation at FPS and paces frames.
         running (bool): Whether the game loop is active.
         player (MainCharacter): The player character entity.
         villain (Villain): The villain character entity.
         collision_handler (CollisionHandler): Handles collision detection.
         state_manager (GameStateManager): Manages game state transitions.
+        stage_manager (StageManager): Holds and streams stage backgrounds.
+        profiler (FrameProfiler): Per-phase frame timer and overlay.
+        input (InputHandler): Timestamped input buffer sampled once per tick.
+        command_recognizer (CommandRecognizer): Turns key presses into player commands.
+        ai_controller (AIController): Drives the villain every tick.
+        audio (AudioManager): Sound effects and music.
+        telemetry (Telemetry): Background combat event log.
+        capture (VideoCapture): Gameplay recorder.
+        scheduler (Scheduler): Tick-driven timers for round pauses and intros.
+        camera (Camera): Follows the fighters as part of the simulation.
+        view (Camera): Draws snapshots at the camera position they captured.
+        render_thread (bool): Whether the simulation runs on its own thread.
+        snapshots (SnapshotBuffer): Hands snapshots to the renderer in that mode.
+        closed (bool): Whether ``close`` has released the subsystems.
     """
     
-    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT):
+    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT,
+                 render_backend: str = RENDER_BACKEND, render_thread: bool = RENDER_THREAD,
+                 disk_cache: bool = True):
         """
         Initialize the game.
         
         Args:
             width (int): Screen width in pixels.
             height (int): Screen height in pixels.
+            render_backend (str): "surface" or "texture".
+            render_thread (bool): Run the simulation on its own thread and
+                render its snapshots on the main thread.
+            disk_cache (bool): Use the on-disk decoded image and costume
+                caches; off, every image is decoded and recolored again.
         """
+        # Small mixer buffer for low audio latency; must precede pygame.init()
+        pygame.mixer.pre_init(AUDIO_FREQUENCY, -16, 2, AUDIO_BUFFER_SIZE)
         pygame.init()
         
-        self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption(GAME_TITLE)
-        
-        self.clock = pygame.time.Clock()
+        self.backend = create_backend(
+            render_backend, (width, height), WINDOW_SIZE, RENDER_SCALING, FRAME_PACING == "vsync"
+        )
+        self.screen = self.backend.hud
+        
+        pacing = FRAME_PACING
+        if pacing == "vsync" and not self.backend.vsync:
+            pacing = "busy"
+        elif pacing == "vsync" and render_thread:
+            pacing = "tick"  # the display refresh paces the render thread, not the simulation
+        self.render_thread = render_thread
+        self.snapshots = SnapshotBuffer()
+        self.pacer = FramePacer(FPS, pacing, MAX_FRAME_SKIP, DYNAMIC_QUALITY, QUALITY_MISS_LIMIT, QUALITY_WINDOW)
         self.running = False
         
-        # Load background image
-        try:
-            self.background = pygame.image.load(BACKGROUND_IMAGE)
-            self.background = pygame.transform.scale(self.background, (width, height))
-        except pygame.error as e:
-            print(f"Warning: Could not load background image: {e}")
-            self.background = None
-        
-        # Initialize game entities
-        self.player = MainCharacter(PLAYER_START_X, PLAYER_START_Y)
-        self.villain = Villain(ENEMY_START_X, ENEMY_START_Y)
-        
-        # Initialize game systems
-        self.collision_handler = CollisionHandler()
+        # Decoded images are cached on disk, so warm starts skip decoding
+        image_cache.set_cache_dir(IMAGE_CACHE_DIR if disk_cache else None)
+        
+        # Load the first stage; the next one is decoded in the background
+        self.stage_width = max(STAGE_WIDTH, width)
+        self.stage_manager = StageManager(
+            STAGE_IMAGES, (self.stage_width, height), STAGE_MEMORY_BUDGET, STAGE_TILE_SIZE
+        )
+        self.background = self.stage_manager.select(0)
+        self.camera = Camera((width, height), (self.stage_width, height), None,
+                             CAMERA_ZOOM_LEVELS, CAMERA_ZOOM_MARGIN)
+        self.view = Camera(
+            (width, height), (self.stage_width, height), self.backend,
+            CAMERA_ZOOM_LEVELS, CAMERA_ZOOM_MARGIN, ScaledSurfaceCache(ZOOM_CACHE_BUDGET)
+        )
+        self.stage_offset = (self.stage_width - width) // 2  # spawn positions are screen-relative
+        
+        # Initialize game entities; costumes recolor the sheets once at load
+        palette_swap.set_cache_dir(COSTUME_CACHE_DIR if disk_cache else None)
+        self.player = MainCharacter(PLAYER_START_X, PLAYER_START_Y, palette=self._costume(PLAYER_COSTUME))
+        self.villain = Villain(ENEMY_START_X, ENEMY_START_Y, palette=self._costume(ENEMY_COSTUME))
+        # Fighters the camera frames each tick, with their sprite widths
+        self._framed = (
+            (self.player, self.player.SPRITE_WIDTH_STANCE), (self.villain, self.villain.SPRITE_WIDTH_WALKING)
+        )
+        
+        # Initialize game systems; timed events and cooldowns run on simulation ticks
+        self.scheduler = Scheduler()
+        self.collision_handler = CollisionHandler(clock=self._simulation_ms)
         self.state_manager = GameStateManager()
+        self.ai_controller = AIController(
+            self.villain, AI_DIFFICULTY, AI_TICK_BUDGET_US, FPS, AI_DECISION_INTERVAL_MS
+        )
+        self.profiler = FrameProfiler(PROFILER_HISTORY)
+        # With a simulation thread, tick phases would interleave with the
+        # render thread's marks, so they go to a profiler that stays off
+        self._tick_profiler = FrameProfiler(PROFILER_HISTORY) if render_thread else self.profiler
+        
+        # Audio: effects are decoded once here, music streams during play
+        self.audio = AudioManager(
+            SOUND_FILES, MUSIC_FILE, AUDIO_CHANNELS, AUDIO_FREQUENCY, AUDIO_BUFFER_SIZE, AUDIO_VOLUME
+        )
+        self.collision_handler.add_hit_listener(self._on_hit)
+        self._attacking = {self.player: False, self.villain: False}
+        
+        # Combat telemetry, written off the frame loop
+        self.telemetry = Telemetry(
+            TELEMETRY_PATH, TELEMETRY_MAX_BYTES, TELEMETRY_BACKUPS, TELEMETRY_FLUSH_INTERVAL
+        )
+        self.villain.action_listeners.append(self._on_villain_action)
+        
+        # Gameplay recording, encoded in a background process
+        self.capture = VideoCapture(CAPTURE_DIR, CAPTURE_FORMAT, CAPTURE_BUFFERS, FPS)
+        self.closed = False
         
         # Input state tracking
-        self.keys_pressed = set()
+        self.input = InputHandler(INPUT_BUFFER_SIZE)
         
-        # Double-click detection for D key
-        self.last_d_press_time = 0
-        self.double_click_threshold = 300  # milliseconds
+        # Command recognition (double taps, motions, charges, chords)
+        self.command_recognizer = CommandRecognizer(
+            self.player.COMMANDS, COMMAND_INPUT_GAP_MS, COMMAND_CHARGE_MS, COMMAND_CHORD_MS
+        )
+        self._command_symbols = {}  # key -> symbol it was pressed as
         
         # Round and timer system
         self.round_time = 90  # 90 seconds per round
-        self.round_start_time = 0
+        self.round_start_tick = 0
+        self.round_timer = None  # ends the round when time runs out
+        self.round_pending = False  # next round is scheduled to start
         self.current_round = 1
         self.max_rounds = 3
         self.player_round_wins = 0
@@ -82,20 +187,25 @@ class Game:
         self.round_active = False
         self.game_over = False
         self.winner = None
+        self.round_pause_ms = 2000  # pause between rounds
+        self.round_intro_ms = 1000  # how long the round banner shows
+        self.banner = None  # centered announcement ("ROUND 2", "K.O.")
+        self._banner_timer = None
         
         # Game configuration
         self.width = width
         self.height = height
         
         # Set entity boundary constraints
-        self.player.MAX_X = width - self.player.SPRITE_WIDTH_STANCE
-        
-        # Set up AI behavior timer
-        pygame.time.set_timer(pygame.USEREVENT + 1, 1000)  # AI decision every 1 second
+        self.player.MAX_X = self.stage_width - self.player.SPRITE_WIDTH_STANCE
+        self.villain.MAX_X = self.stage_width - self.villain.SPRITE_WIDTH_WALKING
     
     def handle_events(self) -> bool:
         """
-        Handle all input events.
+        Handle all pending window events.
+        
+        Key events are only recorded here; they are applied to the game
+        when the next update samples the input buffer.
         
         Returns:
             bool: False if quit event received, True otherwise.
@@ -105,16 +215,15 @@ class Game:
                 return False
             
             elif event.type == pygame.KEYDOWN:
-                self.keys_pressed.add(event.key)
-                self._handle_keydown(event.key)
+                self._handle_frontend_key(event.key)
+                self.input.record(event.key, True)
             
             elif event.type == pygame.KEYUP:
-                self.keys_pressed.discard(event.key)
-                self._handle_keyup(event.key)
+                self.input.record(event.key, False)
             
-            elif event.type == pygame.USEREVENT + 1:
-                # AI behavior timer
-                self.villain.random_behavior(self.player.x)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # Key ups are not delivered while unfocused
+                self.input.release_all()
         
         return True
     
@@ -125,34 +234,33 @@ class Game:
         Args:
             key (int): The key code pressed.
         """
-        if key == pygame.K_LEFT:
-            self.player.x_change = -5
-        elif key == pygame.K_RIGHT:
-            self.player.x_change = 5
-        elif key == pygame.K_UP:  # Jump
+        if key == pygame.K_UP:  # Jump
             self.player.jump()
         elif key == pygame.K_DOWN:  # Crouch
             self.player.crouch()
         elif key == pygame.K_s:  # Block
             self.player.block()
-        elif key == pygame.K_d:  # Punch or Double punch (depends on double-click)
-            current_time = pygame.time.get_ticks()
-            time_since_last_press = current_time - self.last_d_press_time
-            
-            # Check if this is a double-click
-            if time_since_last_press < self.double_click_threshold:
-                # Double-click detected - Double punch
-                self.player.double_punch(self.villain.x)
-                self.last_d_press_time = 0  # Reset to prevent triple-click
-            else:
-                # Single click - Regular punch
-                self.player.punch(self.villain.x)
-                self.last_d_press_time = current_time
-        elif key == pygame.K_c:  # Kick
-            self.player.kick(self.villain.x)
         elif key == pygame.K_RETURN and self.game_over:  # Restart after game over
             self.restart_game()
     
+    def _handle_frontend_key(self, key: int) -> None:
+        """
+        Handle keys for the profiler and recorder as soon as they are pumped.
+        
+        These touch the window and the render side, so they run on the main
+        thread rather than on a simulation tick.
+        
+        Args:
+            key (int): The key code pressed.
+        """
+        if key == pygame.K_F3:  # Toggle profiler overlay
+            self.profiler.toggle()
+        elif key == pygame.K_F4 and self.profiler.enabled:  # Dump frame timings
+            self.profiler.dump_csv(PROFILER_CSV_PATH)
+            print(f"Frame timings written to {PROFILER_CSV_PATH}")
+        elif key == pygame.K_F5:  # Start/stop recording
+            self.capture.toggle(self.backend.read_frame())
+    
     def _handle_keyup(self, key: int) -> None:
         """
         Handle keyboard key release events.
@@ -160,48 +268,96 @@ class Game:
         Args:
             key (int): The key code released.
         """
-        if key == pygame.K_LEFT or key == pygame.K_RIGHT:
-            self.player.x_change = 0
-        elif key == pygame.K_s:  # Stop blocking
+        if key == pygame.K_s:  # Stop blocking
             self.player.stop_blocking()
         elif key == pygame.K_DOWN:  # Stand up from crouch
             self.player.stand_up()
     
+    def _command_symbol(self, key: int):
+        """
+        Map a key to its command input symbol, relative to the player's facing.
+        
+        Args:
+            key (int): The key code.
+            
+        Returns:
+            Optional[str]: The input symbol, or None for keys commands ignore.
+        """
+        facing_right = self.player.x < self.villain.x
+        if key == pygame.K_RIGHT:
+            return command_recognizer.FORWARD if facing_right else command_recognizer.BACK
+        if key == pygame.K_LEFT:
+            return command_recognizer.BACK if facing_right else command_recognizer.FORWARD
+        return {
+            pygame.K_UP: command_recognizer.UP,
+            pygame.K_DOWN: command_recognizer.DOWN,
+            pygame.K_d: command_recognizer.PUNCH,
+            pygame.K_c: command_recognizer.KICK,
+            pygame.K_s: command_recognizer.BLOCK,
+        }.get(key)
+    
+    def _process_input(self) -> None:
+        """Apply every key event recorded since the previous tick."""
+        for key, pressed, timestamp in self.input.sample():
+            if pressed:
+                self._handle_keydown(key)
+                symbol = self._command_symbol(key)
+                if symbol is not None:
+                    self._command_symbols[key] = symbol
+                    command = self.command_recognizer.press(symbol, timestamp * 1000)
+                    if command is not None and not self.game_over:
+                        self.player.perform_command(command.name, self.villain.x)
+            else:
+                self._handle_keyup(key)
+                symbol = self._command_symbols.pop(key, None)
+                if symbol is not None:
+                    self.command_recognizer.release(symbol)
+    
     def update(self) -> None:
         """Update game logic for the current frame."""
+        self.stage_manager.poll()
+        
+        # Run timers due this tick (round start, time out, banners)
+        self.scheduler.advance()
+        
+        # Sample input as late as possible before simulating
+        self._process_input()
+        
         if self.game_over:
             return
         
-        # Start round if not active
-        if not self.round_active:
+        # Start the first round; later ones start when their pause is over
+        if not self.round_active and not self.round_pending:
             self.start_round()
-        
-        # Check timer
-        elapsed_time = (pygame.time.get_ticks() - self.round_start_time) / 1000
-        if elapsed_time >= self.round_time:
-            self.end_round_by_time()
+        if not self.round_active:
             return
         
-        # Handle continuous key presses
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self.player.x_change = -5
-        elif keys[pygame.K_RIGHT]:
-            self.player.x_change = 5
-        else:
-            if not (keys[pygame.K_d] or keys[pygame.K_c]):
-                self.player.x_change = 0
+        # Handle held movement keys
+        if self.input.is_held(pygame.K_LEFT):
+            self.player.x_change = -self.player.WALK_SPEED
+        elif self.input.is_held(pygame.K_RIGHT):
+            self.player.x_change = self.player.WALK_SPEED
+        elif not (self.input.is_held(pygame.K_d) or self.input.is_held(pygame.K_c)):
+            self.player.x_change = 0
+        
+        # Villain AI decides on this tick's state
+        self.ai_controller.update(self.player)
         
         # Update entity positions
         self.player.update_position()
         self.villain.update_position(self.player.x)
+        self.camera.follow(*self._framed)
+        self._tick_profiler.mark("physics")
         
         # Update animations
         self.player.update_frame(self.villain.x)
         self.villain.update_frame(self.player.x)
+        self._tick_profiler.mark("animation")
         
         # Handle collisions
+        self._play_attack_sounds()
         self.collision_handler.update(self.player, self.villain)
+        self._tick_profiler.mark("collision")
         
         # Check if anyone is defeated
         if not self.player.is_alive():
@@ -218,35 +374,152 @@ class Game:
                 self.state_manager.villain_hit_first,
                 self.state_manager.character_hit_first
             )
+        self._tick_profiler.mark("state")
     
-    def render(self) -> None:
-        """Render the game frame."""
-        # Draw background
-        if self.background:
-            self.screen.blit(self.background, (0, 0))
-        else:
-            self.screen.fill(BACKGROUND_COLOR)
+    def _play_attack_sounds(self) -> None:
+        """Play a whoosh when either fighter starts an attack."""
+        for entity, was_attacking in self._attacking.items():
+            attacking = entity.get_current_action() in ATTACK_ACTIONS
+            if attacking and not was_attacking:
+                self.audio.play("whoosh")
+            self._attacking[entity] = attacking
+    
+    def _on_hit(self, kind: str, attacker, defender, damage: int) -> None:
+        """
+        Play the impact sound for a landed attack.
         
-        # Draw game entities
-        self.player.draw(self.screen)
-        self.villain.draw(self.screen)
+        Args:
+            kind (str): "punch" or "kick".
+            attacker: The attacking entity.
+            defender: The entity that was hit.
+            damage (int): Damage dealt before blocking.
+        """
+        self.audio.play("block" if defender.is_blocking else "hit")
+        self.telemetry.record(
+            "hit", self.scheduler.tick, attacker=self._side(attacker), move=kind, damage=damage,
+            blocked=defender.is_blocking, **self._combat_state()
+        )
+    
+    def _on_villain_action(self, action: str) -> None:
+        """
+        Log a villain AI decision.
+        
+        Args:
+            action (str): The chosen action.
+        """
+        self.telemetry.record("ai_decision", self.scheduler.tick, attacker="villain", move=action,
+                              **self._combat_state())
+    
+    def _side(self, entity) -> str:
+        """Name an entity as "player" or "villain" for telemetry."""
+        return "player" if entity is self.player else "villain"
+    
+    def _combat_state(self) -> dict:
+        """Positions and health of both fighters for telemetry events."""
+        player, villain = self.player, self.villain
+        return {
+            "player_x": player.x, "player_y": player.y, "player_health": player.health,
+            "villain_x": villain.x, "villain_y": villain.y, "villain_health": villain.health,
+        }
+    
+    def snapshot(self) -> RenderSnapshot:
+        """
+        Capture what a frame draws from the current simulation state.
+        
+        Returns:
+            RenderSnapshot: The snapshot.
+        """
+        player, villain = self.player, self.villain
+        time_left = None
+        if self.round_active:
+            elapsed_time = (self.scheduler.tick - self.round_start_tick) // FPS
+            time_left = max(0, self.round_time - elapsed_time)
+        
+        # Debug text is only formatted while the overlay is shown
+        debug = ()
+        if self.profiler.enabled:
+            debug = (
+                f"Player: {player.get_current_action()} HP:{player.health}",
+                f"Villain: {villain.get_current_action()} HP:{villain.health}",
+                f"State: {self.state_manager.current_state.value}",
+            )
+            if self.ai_controller.search is not None:
+                debug += (f"AI search: {self.ai_controller.rollouts_per_second:.0f} rollouts/s",)
+            # Summed here since the stage cache only changes on this thread
+            assets = asset_memory.summary(self)
+            debug += ("Assets " + " ".join(
+                f"{key}:{assets[key] / asset_memory.MB:.1f}MB"
+                for key in ("total", "sprites", "clip_cache", "stages", "zoom_cache")
+            ),)
+        
+        return RenderSnapshot(
+            tick=self.scheduler.tick,
+            background=self.background,
+            camera_x=self.camera.x,
+            camera_zoom=self.camera.zoom,
+            sprites=tuple(sprite for sprite in (player.sprite(), villain.sprite()) if sprite is not None),
+            player_health=player.health / player.max_health,
+            villain_health=villain.health / villain.max_health,
+            time_left=time_left,
+            current_round=self.current_round,
+            player_round_wins=self.player_round_wins,
+            villain_round_wins=self.villain_round_wins,
+            banner=self.banner,
+            winner=self.winner if self.game_over else None,
+            debug=debug,
+            input_samples=self.input.samples,
+        )
+    
+    def render(self, snapshot: Optional[RenderSnapshot] = None) -> None:
+        """
+        Render the game frame.
+        
+        Everything drawn comes from the snapshot, never from live game
+        state, so this can run while the simulation thread is mid-tick.
+        
+        Args:
+            snapshot (Optional[RenderSnapshot]): State to draw; taken from
+                the game now if omitted.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        
+        # Draw the background tiles under the camera
+        view = self.view
+        view.x, view.zoom = snapshot.camera_x, snapshot.camera_zoom
+        view.begin_frame(snapshot.background, BACKGROUND_COLOR)
+        
+        # Draw game entities in stage coordinates; off-screen ones are culled
+        for frame, x, y in snapshot.sprites:
+            view.blit(frame, (x, y))
         
         # Draw UI elements
-        self._draw_health_bars()
-        self._draw_timer()
-        self._draw_round_info()
+        self._draw_health_bars(snapshot)
+        self._draw_timer(snapshot)
+        self._draw_round_info(snapshot)
+        self._draw_banner(snapshot)
         
         # Draw game over screen if needed
-        if self.game_over:
-            self._draw_game_over()
+        if snapshot.winner is not None:
+            self._draw_game_over(snapshot)
+        
+        # Draw debug info and frame timings when the profiler is on
+        if self.profiler.enabled:
+            self._draw_debug_info(snapshot)
+            # Phase table below the extra simulation lines
+            self.profiler.draw(self.screen, (10, 220 + 25 * len(snapshot.debug[3:])))
+        self.profiler.mark("render")
         
-        # Draw debug info (optional)
-        # self._draw_debug_info()
+        # Hand the finished frame to the recorder
+        if self.capture.recording:
+            self.capture.capture(self.backend.read_frame())
         
         # Update display
-        pygame.display.flip()
+        self.backend.present()
+        self.input.mark_presented(samples=snapshot.input_samples)
+        self.profiler.mark("flip")
     
-    def _draw_health_bars(self) -> None:
+    def _draw_health_bars(self, snapshot: RenderSnapshot) -> None:
         """Draw health bars for both characters."""
         # Player health bar (left side)
         bar_width = 300
@@ -258,7 +531,7 @@ class Game:
         pygame.draw.rect(self.screen, (200, 0, 0), (bar_x, bar_y, bar_width, bar_height))
         
         # Current health (green)
-        current_width = int((self.player.health / self.player.max_health) * bar_width)
+        current_width = int(snapshot.player_health * bar_width)
         pygame.draw.rect(self.screen, (0, 200, 0), (bar_x, bar_y, current_width, bar_height))
         
         # Border
@@ -276,7 +549,7 @@ class Game:
         pygame.draw.rect(self.screen, (200, 0, 0), (villain_bar_x, bar_y, bar_width, bar_height))
         
         # Current health (green)
-        current_width = int((self.villain.health / self.villain.max_health) * bar_width)
+        current_width = int(snapshot.villain_health * bar_width)
         pygame.draw.rect(self.screen, (0, 200, 0), (villain_bar_x, bar_y, current_width, bar_height))
         
         # Border
@@ -286,16 +559,13 @@ class Game:
         name_text = font.render("SONYA", True, (255, 255, 255))
         self.screen.blit(name_text, (villain_bar_x, bar_y - 25))
     
-    def _draw_timer(self) -> None:
+    def _draw_timer(self, snapshot: RenderSnapshot) -> None:
         """Draw round timer."""
-        if not self.round_active:
+        if snapshot.time_left is None:
             return
         
-        elapsed_time = (pygame.time.get_ticks() - self.round_start_time) / 1000
-        remaining_time = max(0, self.round_time - int(elapsed_time))
-        
         font = pygame.font.Font(None, 48)
-        timer_text = font.render(str(remaining_time), True, (255, 255, 0))
+        timer_text = font.render(str(snapshot.time_left), True, (255, 255, 0))
         text_rect = timer_text.get_rect(center=(self.width // 2, 40))
         
         # Draw background circle
@@ -304,18 +574,26 @@ class Game:
         
         self.screen.blit(timer_text, text_rect)
     
-    def _draw_round_info(self) -> None:
+    def _draw_round_info(self, snapshot: RenderSnapshot) -> None:
         """Draw round number and wins."""
         font = pygame.font.Font(None, 32)
         
         # Round number
-        round_text = font.render(f"Round {self.current_round}", True, (255, 255, 255))
+        round_text = font.render(f"Round {snapshot.current_round}", True, (255, 255, 255))
         text_rect = round_text.get_rect(center=(self.width // 2, 90))
         self.screen.blit(round_text, text_rect)
         
         # Win indicators (circles below names)
-        self._draw_win_indicators(70, 70, self.player_round_wins)  # Player
-        self._draw_win_indicators(self.width - 120, 70, self.villain_round_wins)  # Villain
+        self._draw_win_indicators(70, 70, snapshot.player_round_wins)  # Player
+        self._draw_win_indicators(self.width - 120, 70, snapshot.villain_round_wins)  # Villain
+    
+    def _draw_banner(self, snapshot: RenderSnapshot) -> None:
+        """Draw the current announcement, if any, across the middle of the screen."""
+        if snapshot.banner is None or snapshot.winner is not None:
+            return
+        font = pygame.font.Font(None, 96)
+        banner_text = font.render(snapshot.banner, True, (255, 215, 0))
+        self.screen.blit(banner_text, banner_text.get_rect(center=(self.width // 2, self.height // 2 - 50)))
     
     def _draw_win_indicators(self, x: int, y: int, wins: int) -> None:
         """Draw win indicator circles."""
@@ -326,19 +604,20 @@ class Game:
             else:
                 pygame.draw.circle(self.screen, (100, 100, 100), (circle_x, y), 10, 2)  # Gray outline
     
-    def _draw_game_over(self) -> None:
+    def _draw_game_over(self, snapshot: RenderSnapshot) -> None:
         """Draw game over screen."""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay; a full-screen alpha blend, so skipped under load
+        if self.pacer.high_quality:
+            overlay = pygame.Surface((self.width, self.height))
+            overlay.set_alpha(200)
+            overlay.fill((0, 0, 0))
+            self.screen.blit(overlay, (0, 0))
         
         # Winner text
         font_large = pygame.font.Font(None, 72)
         font_small = pygame.font.Font(None, 36)
         
-        if self.winner == "player":
+        if snapshot.winner == "player":
             winner_text = font_large.render("SCORPION WINS!", True, (255, 215, 0))
         else:
             winner_text = font_large.render("SONYA WINS!", True, (255, 215, 0))
@@ -351,39 +630,130 @@ class Game:
         restart_rect = restart_text.get_rect(center=(self.width // 2, self.height // 2 + 50))
         self.screen.blit(restart_text, restart_rect)
     
-    def _draw_debug_info(self) -> None:
+    def _draw_debug_info(self, snapshot: RenderSnapshot) -> None:
         """Draw debug information on screen."""
         font = pygame.font.Font(None, 24)
         
-        # Player info
-        player_text = font.render(f"Player: {self.player.get_current_action()} HP:{self.player.health}", True, (0, 255, 0))
-        self.screen.blit(player_text, (10, 120))
-        
-        # Villain info
-        villain_text = font.render(f"Villain: {self.villain.get_current_action()} HP:{self.villain.health}", True, (255, 0, 0))
-        self.screen.blit(villain_text, (10, 145))
+        # Player, villain and game state, formatted by the simulation;
+        # empty for the first frame after the overlay is turned on
+        colors = ((0, 255, 0), (255, 0, 0), (255, 255, 255))
+        for index, (line, color) in enumerate(zip(snapshot.debug, colors)):
+            self.screen.blit(font.render(line, True, color), (10, 120 + index * 25))
+        
+        # Input-to-display latency
+        p50, p99 = self.input.latency_percentiles()
+        latency_text = font.render(f"Input latency p50:{p50:.1f}ms p99:{p99:.1f}ms", True, (255, 255, 255))
+        self.screen.blit(latency_text, (10, 195))
+        
+        # Look-ahead search throughput and asset memory
+        for index, line in enumerate(snapshot.debug[3:]):
+            self.screen.blit(font.render(line, True, (255, 255, 255)), (10, 220 + index * 25))
+        
+        # Recording counters
+        if self.capture.recording:
+            capture_text = font.render(
+                f"REC captured:{self.capture.captured} dropped:{self.capture.dropped}", True, (255, 80, 80)
+            )
+            self.screen.blit(capture_text, (self.width - capture_text.get_width() - 10, 110))
+        
+        # Frame pacing
+        pacing = self.pacer.stats()
+        pacing_text = font.render(
+            f"{pacing['mode']} {pacing['fps']:.0f}fps skipped:{pacing['skipped']} late:{pacing['late']} "
+            f"dropped:{pacing['dropped']}{'' if pacing['high_quality'] else ' LOW'}", True, (255, 255, 255)
+        )
+        self.screen.blit(pacing_text, (self.width - pacing_text.get_width() - 10, 135))
+        
+        # Camera and culling
+        zoom_cache = self.view.cache.stats()
+        camera_text = font.render(
+            f"Camera x:{snapshot.camera_x} zoom:{snapshot.camera_zoom:.2f} drawn:{self.view.drawn} "
+            f"culled:{self.view.culled} scaled:{zoom_cache['entries']}/{zoom_cache['bytes'] // 1024}KB",
+            True, (255, 255, 255)
+        )
+        self.screen.blit(camera_text, (self.width - camera_text.get_width() - 10, 160))
+        
+        # Snapshot hand-off between the simulation and render threads
+        if self.render_thread:
+            snapshot_text = font.render(
+                f"Render thread tick:{snapshot.tick} published:{self.snapshots.published} "
+                f"skipped:{self.snapshots.skipped}", True, (255, 255, 255)
+            )
+            self.screen.blit(snapshot_text, (self.width - snapshot_text.get_width() - 10, 185))
+    
+    def _simulation_ms(self) -> int:
+        """Simulated time in milliseconds, from the scheduler's tick count."""
+        return self.scheduler.tick * 1000 // FPS
+    
+    def _ms_to_ticks(self, ms: float) -> int:
+        """Convert a duration to simulation ticks."""
+        return round(ms * FPS / 1000)
+    
+    @staticmethod
+    def _costume(name: Optional[str]):
+        """Look up a costume palette by name; None or an unknown name keeps the original colors."""
+        if name is None:
+            return None
+        if name not in COSTUMES:
+            print(f"Warning: Unknown costume '{name}'")
+            return None
+        return COSTUMES[name]
+    
+    def show_banner(self, text: str, duration_ms: float) -> None:
+        """
+        Show a centered announcement for a while.
         
-        # Game state
-        state_text = font.render(f"State: {self.state_manager.current_state.value}", True, (255, 255, 255))
-        self.screen.blit(state_text, (10, 170))
+        Args:
+            text (str): Text to show.
+            duration_ms (float): How long to show it.
+        """
+        if self._banner_timer is not None:
+            self._banner_timer.cancel()
+        self.banner = text
+        self._banner_timer = self.scheduler.call_later(self._ms_to_ticks(duration_ms), self._clear_banner)
+    
+    def _clear_banner(self) -> None:
+        """Hide the announcement."""
+        self.banner = None
+        self._banner_timer = None
+    
+    def _schedule_round(self) -> None:
+        """Start the next round once the pause between rounds is over."""
+        self.round_pending = True
+        self.scheduler.call_later(self._ms_to_ticks(self.round_pause_ms), self.start_round)
     
     def start_round(self) -> None:
         """Start a new round."""
         self.round_active = True
-        self.round_start_time = pygame.time.get_ticks()
+        self.round_pending = False
         
-        # Reset character positions and health
-        self.player.x = PLAYER_START_X
+        # Switch stage; it was prefetched during the previous round
+        self.background = self.stage_manager.select(self.current_round - 1)
+        self.round_start_tick = self.scheduler.tick
+        self.round_timer = self.scheduler.call_later(self.round_time * FPS, self.end_round_by_time)
+        self.show_banner(f"ROUND {self.current_round}", self.round_intro_ms)
+        
+        # Reset character positions and health, centered on the stage
+        self.player.x = PLAYER_START_X + self.stage_offset
         self.player.y = PLAYER_START_Y
         self.player.health = self.player.max_health
         
-        self.villain.x = ENEMY_START_X
+        self.villain.x = ENEMY_START_X + self.stage_offset
         self.villain.y = ENEMY_START_Y
         self.villain.health = self.villain.max_health
+        self.ai_controller.reset()
+        self.camera.center_on(self.stage_width / 2)
     
     def end_round(self, winner: str) -> None:
         """End the current round and update wins."""
         self.round_active = False
+        self.round_timer.cancel()
+        knockout = not (self.player.is_alive() and self.villain.is_alive())
+        if knockout:
+            self.audio.play("ko")
+        self.show_banner("K.O." if knockout else "TIME", self.round_pause_ms)
+        self.telemetry.record("round_end", self.scheduler.tick, round=self.current_round, winner=winner,
+                              knockout=knockout, **self._combat_state())
         
         if winner == "player":
             self.player_round_wins += 1
@@ -398,9 +768,9 @@ class Game:
             self.game_over = True
             self.winner = "villain"
         else:
-            # Next round
+            # Next round, after a pause
             self.current_round += 1
-            pygame.time.wait(2000)  # 2 second pause between rounds
+            self._schedule_round()
     
     def end_round_by_time(self) -> None:
         """End round when time runs out - winner is who has more health."""
@@ -411,7 +781,8 @@ class Game:
         else:
             # Tie - restart round
             self.round_active = False
-            pygame.time.wait(2000)
+            self.show_banner("DRAW", self.round_pause_ms)
+            self._schedule_round()
     
     def restart_game(self) -> None:
         """Restart the entire game."""
@@ -421,26 +792,118 @@ class Game:
         self.game_over = False
         self.winner = None
         self.round_active = False
+        self.round_pending = False
+        self.scheduler.clear()
+        self._clear_banner()
+        self.command_recognizer.reset()
     
     def run(self) -> None:
         """
         Main game loop.
         
-        This method runs the game until the quit event is received.
+        This method runs the game until the quit event is received. If a
+        tick raises, every subsystem is still released before the error
+        propagates.
         """
         self.running = True
+        self.audio.play_music()
         
-        while self.running:
-            self.running = self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+        try:
+            if self.render_thread:
+                self._run_threaded()
+            else:
+                while self.running:
+                    self.profiler.begin_frame()
+                    self.running = self.handle_events()
+                    self.profiler.mark("events")
+                    # Run every tick that is due; under load this skips renders, not ticks
+                    for _ in range(self.pacer.ticks_due()):
+                        self.update()
+                    self.render()
+                    self.profiler.end_frame()
+                    self.pacer.wait()
+        finally:
+            # Not quit(): its sys.exit() would replace a propagating error
+            self.close()
         
         self.quit()
     
+    def _run_threaded(self) -> None:
+        """
+        Run the simulation on its own thread and draw its snapshots here.
+        
+        The main thread owns the window, so it keeps pumping events,
+        drawing and presenting; the simulation thread only touches game
+        state. Much of blitting and presenting runs in SDL without the GIL,
+        so drawing one snapshot overlaps with simulating the next tick.
+        
+        Raises:
+            Exception: Whatever a simulation tick raised, once both threads stopped.
+        """
+        self._simulation_error: Optional[BaseException] = None
+        simulation = threading.Thread(target=self._simulate, name="simulation", daemon=True)
+        simulation.start()
+        
+        while self.running:
+            # Keep pumping events while waiting for the next tick, so key
+            # presses are already buffered when the simulation samples them
+            snapshot = self.snapshots.take(0.005)
+            if snapshot is None:
+                if not self.handle_events():
+                    self.running = False
+                continue
+            
+            self.profiler.begin_frame()
+            if not self.handle_events():
+                self.running = False
+            self.profiler.mark("events")
+            self.render(snapshot)
+            self.profiler.end_frame()
+        
+        simulation.join()
+        if self._simulation_error is not None:
+            raise self._simulation_error
+    
+    def _simulate(self) -> None:
+        """Simulation thread: run the ticks that are due and publish a snapshot after each batch."""
+        try:
+            while self.running:
+                ticks = self.pacer.ticks_due()
+                for _ in range(ticks):
+                    self.update()
+                if ticks:
+                    self.snapshots.publish(self.snapshot())
+                self.pacer.wait(rendered=False)
+        except BaseException as e:
+            # Re-raised on the main thread after the join
+            self._simulation_error = e
+        finally:
+            # Stop the render loop too if a tick raised
+            self.running = False
+            self.snapshots.close()
+    
+    def close(self) -> None:
+        """
+        Release every subsystem without exiting the process.
+        
+        Stops the stage loader and AI search workers, the audio, the
+        telemetry writer and any recording (waiting until it is written),
+        then shuts pygame down. Calling it again does nothing.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.stage_manager.shutdown()
+        self.ai_controller.shutdown()
+        self.audio.stop()
+        self.telemetry.close()
+        self.capture.stop()
+        self.capture.wait()
+        pygame.quit()
+    
     def quit(self) -> None:
         """Quit the game and cleanup resources."""
-        pygame.quit()
+        self.close()
         sys.exit()
 
 
@@ -0,0 +1,322 @@
+"""
+Training environment.
+
+This module wraps the match logic of ``Game.update`` in a gym-style
+``reset()/step(action)`` API with fixed-size numeric observations, and
+steps many matches in lockstep without a window or any rendering.
+"""
+
+import random
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, PLAYER_START_X, PLAYER_START_Y,
+    ENEMY_START_X, ENEMY_START_Y, AI_TICK_BUDGET_US, AI_DECISION_INTERVAL_MS
+)
+from src.entities.main_character import MainCharacter
+from src.entities.villain import Villain
+from src.systems.ai_controller import AIController
+from src.systems.collision_handler import CollisionHandler
+
+
+# Observation layout; every value is scaled to roughly [-1, 1]
+PLAYER_FLAGS = (
+    "on_ground", "is_hit", "is_falling", "is_blocking", "is_jumping", "is_crouching",
+    "is_punching", "is_double_punching", "is_kicking", "is_und_kicking",
+)
+VILLAIN_FLAGS = (
+    "is_hit", "is_falling_down", "is_getting_up", "is_blocking",
+    "is_double_punching", "is_kicking",
+)
+OBSERVATION_FIELDS = (
+    ("player_x", "player_y", "player_x_change", "player_velocity_y", "player_health", "player_frame_index")
+    + tuple(f"player_{flag}" for flag in PLAYER_FLAGS)
+    + ("villain_x", "villain_y", "villain_x_change", "villain_health", "villain_frame_index", "villain_walking")
+    + tuple(f"villain_{flag}" for flag in VILLAIN_FLAGS)
+    + ("distance", "time_remaining")
+)
+OBSERVATION_SIZE = len(OBSERVATION_FIELDS)
+
+FRAME_INDEX_SCALE = 10  # longer than any animation in the sprite sheets
+WIN_REWARD = 1.0
+
+
+class MatchEnv:
+    """
+    One round of the fight as a reinforcement learning environment.
+
+    The agent controls either the player or the villain; the other side is
+    driven by the game's own AI (``AIController`` for the villain, a random
+    policy for the player). Each ``step`` is one game tick with the same
+    order of updates as ``Game.update``. Collision cooldowns and the round
+    timer run on simulated time, so matches run as fast as the CPU allows.
+
+    The reward is the agent's damage dealt minus damage taken as a fraction
+    of max health, plus ``WIN_REWARD`` for winning the round (or minus it for
+    losing), decided by knockout or on health when time runs out.
+
+    Attributes:
+        agent (str): "player" or "villain".
+        actions (Tuple[str, ...]): Action names; ``step`` takes an index.
+        player (MainCharacter): The player entity.
+        villain (Villain): The villain entity.
+        tick (int): Ticks since the round started.
+        round_ticks (int): Length of the round in ticks.
+    """
+
+    def __init__(self, agent: str = "player", tick_rate: int = FPS, round_time: float = 90,
+                 opponent_difficulty: str = "normal", opponent_interval: int = 6,
+                 width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT):
+        """
+        Initialize the environment.
+
+        Args:
+            agent (str): Side the agent controls, "player" or "villain".
+            tick_rate (int): Simulation ticks per second.
+            round_time (float): Round length in seconds.
+            opponent_difficulty (str): Villain AI difficulty when the agent is the player.
+            opponent_interval (int): Ticks between random player moves when
+                the agent is the villain.
+            width (int): Arena width in pixels.
+            height (int): Arena height in pixels.
+
+        Raises:
+            ValueError: If the agent side is unknown.
+        """
+        if agent not in ("player", "villain"):
+            raise ValueError(f"Unknown agent side: {agent}")
+
+        self.agent = agent
+        self.actions = MainCharacter.ACTIONS if agent == "player" else Villain.ACTIONS
+        self.tick_ms = 1000 / tick_rate
+        self.round_ticks = int(round_time * tick_rate)
+        self.opponent_interval = opponent_interval
+        self.width = width
+        self.height = height
+
+        self._now = 0.0
+        self.player = MainCharacter(PLAYER_START_X, PLAYER_START_Y)
+        self.villain = Villain(ENEMY_START_X, ENEMY_START_Y)
+        self.player.MAX_X = width - self.player.SPRITE_WIDTH_STANCE
+        self.collision_handler = CollisionHandler(clock=lambda: int(self._now))
+        self.ai_controller = None
+        if agent == "player":
+            self.ai_controller = AIController(
+                self.villain, opponent_difficulty, AI_TICK_BUDGET_US, tick_rate, AI_DECISION_INTERVAL_MS
+            )
+
+        self._player_start = self.player.snapshot()
+        self._villain_start = self.villain.snapshot()
+        self.tick = 0
+
+    def reset(self, seed: Optional[int] = None) -> List[float]:
+        """
+        Start a new round.
+
+        Args:
+            seed (Optional[int]): Seed for the AI's random decisions.
+
+        Returns:
+            List[float]: The first observation.
+        """
+        if seed is not None:
+            random.seed(seed)
+
+        self.player.restore(self._player_start)
+        self.villain.restore(self._villain_start)
+        self.collision_handler.reset_timers()
+        if self.ai_controller is not None:
+            self.ai_controller.reset()
+        self._now = 0.0
+        self.tick = 0
+        return self.observe()
+
+    def step(self, action: int) -> Tuple[List[float], float, bool, Dict[str, object]]:
+        """
+        Apply an action and advance the match by one tick.
+
+        Args:
+            action (int): Index into ``actions``.
+
+        Returns:
+            Tuple[List[float], float, bool, Dict[str, object]]: Observation,
+            reward, whether the round is over, and info with the winner
+            (None until the round ends) and the tick count.
+        """
+        reward, done, info = self._advance(action)
+        return self.observe(), reward, done, info
+
+    def _advance(self, action: int) -> Tuple[float, bool, Dict[str, object]]:
+        """Run one tick; ``step`` without building the observation."""
+        player, villain = self.player, self.villain
+        player_health, villain_health = player.health, villain.health
+
+        self._act(self.actions[action])
+
+        player.update_position()
+        villain.update_position(player.x)
+        player.update_frame(villain.x)
+        villain.update_frame(player.x)
+        self.collision_handler.update(player, villain)
+
+        self.tick += 1
+        self._now += self.tick_ms
+
+        winner = None
+        if not player.is_alive():
+            winner = "villain"
+        elif not villain.is_alive():
+            winner = "player"
+        elif self.tick >= self.round_ticks:
+            winner = "player" if player.health > villain.health else "villain"
+
+        dealt = villain_health - villain.health
+        taken = player_health - player.health
+        if self.agent == "villain":
+            dealt, taken = taken, dealt
+        reward = (dealt - taken) / player.max_health
+        if winner is not None:
+            reward += WIN_REWARD if winner == self.agent else -WIN_REWARD
+
+        return reward, winner is not None, {"winner": winner, "tick": self.tick}
+
+    def _act(self, action: str) -> None:
+        """Apply the agent's action and let the opponent decide."""
+        player, villain = self.player, self.villain
+        if self.agent == "player":
+            player.perform_action(action, villain.x)
+            self.ai_controller.update(player)
+        else:
+            # Like the AI, the villain can only act once its animation ends
+            if not villain.is_busy():
+                villain.perform_action(action)
+            if self.tick % self.opponent_interval == 0:
+                player.perform_action(random.choice(MainCharacter.ACTIONS), villain.x)
+
+    def observe(self, out: Optional[array] = None, offset: int = 0) -> List[float]:
+        """
+        Build the observation vector described by ``OBSERVATION_FIELDS``.
+
+        Args:
+            out (Optional[array]): Buffer to write into instead of returning a new list.
+            offset (int): Position in ``out`` to write at.
+
+        Returns:
+            List[float]: The observation, or an empty list when ``out`` is given.
+        """
+        player, villain = self.player, self.villain
+        width, height = self.width, self.height
+        values = [
+            player.x / width,
+            player.y / height,
+            player.x_change / player.WALK_SPEED,
+            player.velocity_y / -player.jump_power,
+            player.health / player.max_health,
+            player.frame_index / FRAME_INDEX_SCALE,
+        ]
+        values += [float(getattr(player, flag)) for flag in PLAYER_FLAGS]
+        values += [
+            villain.x / width,
+            villain.y / height,
+            float(villain.x_change),
+            villain.health / villain.max_health,
+            villain.frame_index / FRAME_INDEX_SCALE,
+            float(villain.state == "WALK"),
+        ]
+        values += [float(getattr(villain, flag)) for flag in VILLAIN_FLAGS]
+        values += [
+            (villain.x - player.x) / width,
+            1 - self.tick / self.round_ticks,
+        ]
+
+        if out is None:
+            return values
+        out[offset:offset + OBSERVATION_SIZE] = array("f", values)
+        return []
+
+    def close(self) -> None:
+        """Release the opponent AI."""
+        if self.ai_controller is not None:
+            self.ai_controller.shutdown()
+
+
+class VectorMatchEnv:
+    """
+    Many ``MatchEnv`` instances stepped in lockstep in one process.
+
+    Observations for all environments live in one flat float32 buffer of
+    ``num_envs * OBSERVATION_SIZE`` values that is rewritten on every step,
+    so no per-step allocation is made for them; with numpy available,
+    ``numpy.frombuffer(obs, dtype=numpy.float32).reshape(num_envs, -1)``
+    views it without copying. Environments whose round ends are reset
+    immediately, and the returned observation is the first of the new round.
+
+    Attributes:
+        envs (List[MatchEnv]): The environments.
+        observations (array): Flat float32 observation buffer.
+    """
+
+    def __init__(self, num_envs: int, **kwargs):
+        """
+        Initialize the environments.
+
+        Args:
+            num_envs (int): Number of environments.
+            **kwargs: Passed through to ``MatchEnv``.
+        """
+        self.envs = [MatchEnv(**kwargs) for _ in range(num_envs)]
+        self.actions = self.envs[0].actions
+        self.observations = array("f", bytes(4 * num_envs * OBSERVATION_SIZE))
+
+    @property
+    def num_envs(self) -> int:
+        """Number of environments."""
+        return len(self.envs)
+
+    def reset(self, seed: Optional[int] = None) -> array:
+        """
+        Start a new round in every environment.
+
+        Args:
+            seed (Optional[int]): Seed for the AI's random decisions.
+
+        Returns:
+            array: The observation buffer.
+        """
+        if seed is not None:
+            random.seed(seed)
+        for index, env in enumerate(self.envs):
+            env.reset()
+            env.observe(self.observations, index * OBSERVATION_SIZE)
+        return self.observations
+
+    def step(self, actions: Sequence[int]) -> Tuple[array, List[float], List[bool], List[Dict[str, object]]]:
+        """
+        Step every environment with its action.
+
+        Args:
+            actions (Sequence[int]): One action index per environment.
+
+        Returns:
+            Tuple[array, List[float], List[bool], List[Dict[str, object]]]:
+            The observation buffer and per-environment rewards, done flags
+            and infos.
+        """
+        rewards = []
+        dones = []
+        infos = []
+        for index, (env, action) in enumerate(zip(self.envs, actions)):
+            reward, done, info = env._advance(action)
+            if done:
+                env.reset()
+            env.observe(self.observations, index * OBSERVATION_SIZE)
+            rewards.append(reward)
+            dones.append(done)
+            infos.append(info)
+        return self.observations, rewards, dones, infos
+
+    def close(self) -> None:
+        """Close every environment."""
+        for env in self.envs:
+            env.close()
@@ -0,0 +1,550 @@
+"""
+Match server.
+
+This module hosts many headless matches at once. An asyncio front end on a
+local TCP port accepts match requests and routes each match to one of
+several shard processes, which step their matches at a fixed tick.
+
+Start a server with:
+    python -m src.core.match_server --port 8765
+
+Clients speak newline-delimited JSON. Requests:
+    {"op": "start", "mode": "ai" | "remote", "difficulty": "normal",
+     "round_time": 90, "seed": 1}
+    {"op": "input", "action": "PUNCH"}      (remote matches; held until changed)
+    {"op": "stats"}
+Replies:
+    {"type": "started", "match": id, "shard": index}
+    {"type": "state", "tick": n, "observation": [...]}   (remote matches, every tick)
+    {"type": "end", "winner": "player" | "villain", "ticks": n, ...}
+    {"type": "stats", "shards": [...]}
+    {"type": "error", "message": "..."}
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from config import (
+    MATCH_SERVER_HOST, MATCH_SERVER_PORT, MATCH_SERVER_SHARDS, MATCH_SERVER_TICK_RATE,
+    MATCH_SERVER_STATS_INTERVAL
+)
+from src.core.match_env import MatchEnv
+from src.entities.main_character import MainCharacter
+from src.systems.ai_controller import DIFFICULTY_LEVELS
+
+
+MATCH_MODES = ("ai", "remote")
+MAX_ROUND_TIME = 600  # seconds
+
+# Ticks the AI-driven player holds each random action
+AI_PLAYER_INTERVAL = 6
+
+# Client write buffer above which per-tick states are skipped for that client
+STATE_BUFFER_LIMIT = 64 * 1024
+
+
+class ShardMatch:
+    """One match running in a shard."""
+
+    def __init__(self, env: MatchEnv, mode: str, difficulty: str, seed: Optional[int]):
+        """
+        Initialize the match.
+
+        Args:
+            env (MatchEnv): Environment reset for this match.
+            mode (str): "ai" or "remote".
+            difficulty (str): Villain AI difficulty.
+            seed (Optional[int]): Seed for the AI-driven player.
+        """
+        self.env = env
+        self.mode = mode
+        self.difficulty = difficulty
+        self.action = 0
+        self.rng = random.Random(seed)
+
+
+class Shard:
+    """
+    The matches of one worker process.
+
+    Environments are reused from a pool when matches end, so starting a
+    match only resets entity state.
+
+    Attributes:
+        index (int): Shard number.
+        tick_rate (int): Simulation ticks per second.
+        matches (Dict[int, ShardMatch]): Running matches by id.
+    """
+
+    def __init__(self, index: int, tick_rate: int):
+        """
+        Initialize an empty shard.
+
+        Args:
+            index (int): Shard number.
+            tick_rate (int): Simulation ticks per second.
+        """
+        self.index = index
+        self.tick_rate = tick_rate
+        self.matches: Dict[int, ShardMatch] = {}
+        self._pool: Dict[str, List[MatchEnv]] = {}
+
+    def start(self, match_id: int, mode: str, difficulty: str, round_time: float,
+              seed: Optional[int]) -> None:
+        """
+        Start a match.
+
+        Args:
+            match_id (int): Id assigned by the front end.
+            mode (str): "ai" or "remote".
+            difficulty (str): Villain AI difficulty.
+            round_time (float): Round length in seconds.
+            seed (Optional[int]): Seed for the AI-driven player.
+        """
+        pool = self._pool.setdefault(difficulty, [])
+        env = pool.pop() if pool else MatchEnv(
+            tick_rate=self.tick_rate, opponent_difficulty=difficulty
+        )
+        env.round_ticks = int(round_time * self.tick_rate)
+        env.reset()
+        self.matches[match_id] = ShardMatch(env, mode, difficulty, seed)
+
+    def warm(self, difficulty: str) -> None:
+        """
+        Create a pooled environment ahead of time.
+
+        The first environment of a process decodes the sprite sheets; doing
+        that before the first tick keeps it from stalling running matches.
+
+        Args:
+            difficulty (str): Villain AI difficulty.
+        """
+        self._pool.setdefault(difficulty, []).append(
+            MatchEnv(tick_rate=self.tick_rate, opponent_difficulty=difficulty)
+        )
+
+    def finish(self, match_id: int) -> None:
+        """
+        Remove a match and return its environment to the pool.
+
+        Args:
+            match_id (int): Match id.
+        """
+        match = self.matches.pop(match_id, None)
+        if match is not None:
+            self._pool[match.difficulty].append(match.env)
+
+    def step(self, out: list) -> None:
+        """
+        Advance every match by one tick.
+
+        Args:
+            out (list): Messages for the front end are appended here.
+        """
+        actions = MainCharacter.ACTIONS
+        for match_id, match in list(self.matches.items()):
+            env = match.env
+            if match.mode == "ai" and env.tick % AI_PLAYER_INTERVAL == 0:
+                match.action = match.rng.randrange(len(actions))
+            _, done, info = env._advance(match.action)
+
+            if match.mode == "remote":
+                observation = [round(value, 4) for value in env.observe()]
+                out.append(("state", match_id, env.tick, observation))
+            if done:
+                out.append(("end", match_id, {
+                    "winner": info["winner"], "ticks": info["tick"],
+                    "player_health": env.player.health, "villain_health": env.villain.health,
+                }))
+                self.finish(match_id)
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _send_batches(conn, outbox: queue.Queue) -> None:
+    """Shard writer thread: send queued message batches to the front end in order."""
+    while True:
+        batch = outbox.get()
+        try:
+            conn.send(batch)
+        except OSError:
+            return
+
+
+def run_shard(index: int, conn, tick_rate: int, stats_interval: float) -> None:
+    """
+    Shard process loop: apply commands, step every match once per tick.
+
+    Commands are read while waiting for the next tick deadline. When a tick
+    starts more than a whole tick late, it is counted as an overrun and the
+    schedule restarts from now instead of running catch-up ticks. Message
+    batches are sent by a writer thread, so a full pipe never stops this
+    loop from reading the front end's commands, which would deadlock two
+    sides each waiting for the other to read.
+
+    Args:
+        index (int): Shard number.
+        conn: Pipe end shared with the front end.
+        tick_rate (int): Simulation ticks per second.
+        stats_interval (float): Seconds between tick-rate reports.
+    """
+    shard = Shard(index, tick_rate)
+    shard.warm("normal")
+    tick_time = 1.0 / tick_rate
+    next_tick = time.perf_counter()
+    window_start = next_tick
+    window_ticks = 0
+    lags: List[float] = []
+    step_times: List[float] = []
+    overruns = 0
+    reports = 0
+    outbox: queue.Queue = queue.Queue()
+    threading.Thread(target=_send_batches, args=(conn, outbox), name="shard-writer", daemon=True).start()
+
+    while True:
+        remaining = next_tick - time.perf_counter()
+        while conn.poll(max(0.0, remaining)):
+            command = conn.recv()
+            if command is None:
+                return
+            if command[0] == "start":
+                shard.start(*command[1:])
+            elif command[0] == "input":
+                match = shard.matches.get(command[1])
+                if match is not None:
+                    match.action = command[2]
+            elif command[0] == "cancel":
+                shard.finish(command[1])
+            remaining = next_tick - time.perf_counter()
+
+        started = time.perf_counter()
+        lag = started - next_tick
+        if lag > tick_time:
+            overruns += 1
+            next_tick = started
+        next_tick += tick_time
+
+        out: list = []
+        shard.step(out)
+        window_ticks += 1
+        lags.append(lag * 1000)
+        step_times.append((time.perf_counter() - started) * 1000)
+
+        elapsed = started - window_start
+        if elapsed >= stats_interval:
+            reports += 1
+            out.append(("stats", index, {
+                "shard": index,
+                "report": reports,
+                "pid": os.getpid(),
+                "matches": len(shard.matches),
+                "tick_rate": window_ticks / elapsed,
+                "target_tick_rate": tick_rate,
+                "lag_p99_ms": _percentile(lags, 0.99),
+                "lag_max_ms": max(lags),
+                "step_p99_ms": _percentile(step_times, 0.99),
+                "overruns": overruns,
+            }))
+            window_start = started
+            window_ticks = 0
+            lags = []
+            step_times = []
+
+        if out:
+            outbox.put(out)
+
+
+class MatchServer:
+    """
+    Asyncio front end routing matches to shard processes.
+
+    Each new match goes to the shard with the fewest running matches, so
+    load spreads across cores. Shards send their messages back in one batch
+    per tick; the front end forwards them to the owning connections. A
+    client that cannot keep up skips per-tick states rather than buffering
+    them without bound. One match runs per connection at a time; closing the
+    connection cancels it. Commands are sent to each shard by its own
+    sender thread, in order, so a full pipe never blocks the event loop.
+
+    Attributes:
+        host (str): Address listened on.
+        port (int): Port listened on; the real port once started if 0 was given.
+        num_shards (int): Number of shard processes.
+        shard_stats (List[Optional[dict]]): Latest tick-rate report of each shard.
+    """
+
+    def __init__(self, host: str = MATCH_SERVER_HOST, port: int = MATCH_SERVER_PORT,
+                 shards: Optional[int] = MATCH_SERVER_SHARDS, tick_rate: int = MATCH_SERVER_TICK_RATE,
+                 stats_interval: float = MATCH_SERVER_STATS_INTERVAL):
+        """
+        Initialize the server.
+
+        Args:
+            host (str): Address to listen on.
+            port (int): Port to listen on; 0 picks a free one.
+            shards (Optional[int]): Shard processes; None uses one per CPU core.
+            tick_rate (int): Simulation ticks per second.
+            stats_interval (float): Seconds between shard tick-rate reports.
+        """
+        self.host = host
+        self.port = port
+        self.num_shards = shards or os.cpu_count() or 1
+        self.tick_rate = tick_rate
+        self.stats_interval = stats_interval
+        self.shard_stats: List[Optional[dict]] = [None] * self.num_shards
+
+        self._server = None
+        self._processes = []
+        self._conns = []
+        self._senders: List[ThreadPoolExecutor] = []
+        self._loads = [0] * self.num_shards
+        self._clients: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._matches: Dict[int, asyncio.StreamWriter] = {}
+        self._match_shard: Dict[int, int] = {}
+        self._next_match_id = 0
+
+    async def start(self) -> None:
+        """Start the shard processes and begin accepting connections."""
+        loop = asyncio.get_running_loop()
+        # Spawn rather than fork so shards do not inherit the event loop
+        context = multiprocessing.get_context("spawn")
+        for index in range(self.num_shards):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=run_shard, args=(index, child, self.tick_rate, self.stats_interval),
+                name=f"match-shard-{index}", daemon=True,
+            )
+            process.start()
+            child.close()
+            self._processes.append(process)
+            self._conns.append(parent)
+            self._senders.append(ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"shard-{index}-sender"))
+            loop.add_reader(parent.fileno(), self._on_shard_readable, index)
+
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start the server if needed and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Disconnect every client and shut the shards down."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for writer in self._clients.values():
+            writer.close()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+
+        loop = asyncio.get_running_loop()
+        for conn in self._conns:
+            loop.remove_reader(conn.fileno())
+        stops = [asyncio.wrap_future(self._to_shard(index, None)) for index in range(len(self._conns))]
+        await asyncio.wait(stops, timeout=5)
+        for process in self._processes:
+            process.join(timeout=5)
+        for sender in self._senders:
+            sender.shutdown(wait=False, cancel_futures=True)
+        for conn in self._conns:
+            conn.close()
+        self._processes = []
+        self._conns = []
+        self._senders = []
+
+    def _to_shard(self, index: int, command: Optional[tuple]):
+        """
+        Queue a command for a shard without blocking the event loop.
+
+        Args:
+            index (int): Shard number.
+            command (Optional[tuple]): The command; None stops the shard.
+
+        Returns:
+            concurrent.futures.Future: Done once the command is written.
+        """
+        return self._senders[index].submit(self._write_command, self._conns[index], command)
+
+    @staticmethod
+    def _write_command(conn, command: Optional[tuple]) -> None:
+        """Write one command to a shard pipe. Runs on the shard's sender thread."""
+        try:
+            conn.send(command)
+        except OSError:
+            pass  # a stopped shard is reported by its reader
+
+    def _send(self, writer: asyncio.StreamWriter, message: dict) -> None:
+        """Queue one JSON line to a client."""
+        if not writer.is_closing():
+            writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+    def _on_shard_readable(self, index: int) -> None:
+        """Forward every batch a shard has sent."""
+        conn = self._conns[index]
+        try:
+            while conn.poll():
+                for message in conn.recv():
+                    self._dispatch(message)
+        except (EOFError, OSError) as e:
+            print(f"Warning: Match shard {index} stopped: {e}")
+            asyncio.get_running_loop().remove_reader(conn.fileno())
+            for match_id, shard in list(self._match_shard.items()):
+                if shard == index:
+                    writer = self._matches.pop(match_id)
+                    del self._match_shard[match_id]
+                    self._send(writer, {"type": "error", "message": "match shard stopped"})
+            self._loads[index] = self.num_shards * 1_000_000  # never chosen again
+
+    def _dispatch(self, message: tuple) -> None:
+        """Handle one shard message."""
+        kind = message[0]
+        if kind == "stats":
+            self.shard_stats[message[1]] = message[2]
+            return
+
+        writer = self._matches.get(message[1])
+        if writer is None:
+            return
+        if kind == "state":
+            if writer.transport.get_write_buffer_size() < STATE_BUFFER_LIMIT:
+                self._send(writer, {"type": "state", "tick": message[2], "observation": message[3]})
+        elif kind == "end":
+            self._end_match(message[1])
+            self._send(writer, {"type": "end", **message[2]})
+
+    def _end_match(self, match_id: int) -> None:
+        """Forget a match and release its shard slot."""
+        del self._matches[match_id]
+        self._loads[self._match_shard.pop(match_id)] -= 1
+
+    def _start_match(self, writer: asyncio.StreamWriter, request: dict) -> Optional[int]:
+        """
+        Validate a start request and send the match to the least loaded shard.
+
+        Args:
+            writer (asyncio.StreamWriter): The client connection.
+            request (dict): The start request.
+
+        Returns:
+            Optional[int]: The match id, or None if the request was rejected.
+        """
+        mode = request.get("mode", "ai")
+        difficulty = request.get("difficulty", "normal")
+        round_time = request.get("round_time", 90)
+        seed = request.get("seed")
+
+        error = None
+        if mode not in MATCH_MODES:
+            error = f"unknown mode: {mode}"
+        elif difficulty not in DIFFICULTY_LEVELS:
+            error = f"unknown difficulty: {difficulty}"
+        elif DIFFICULTY_LEVELS[difficulty]["search"]:
+            # Look-ahead search needs a process per match
+            error = f"difficulty not available on the match server: {difficulty}"
+        elif not isinstance(round_time, (int, float)) or not 0 < round_time <= MAX_ROUND_TIME:
+            error = f"round_time must be between 0 and {MAX_ROUND_TIME} seconds"
+        elif seed is not None and not isinstance(seed, int):
+            error = "seed must be an integer"
+        if error is not None:
+            self._send(writer, {"type": "error", "message": error})
+            return None
+
+        shard = min(range(self.num_shards), key=self._loads.__getitem__)
+        match_id = self._next_match_id
+        self._next_match_id += 1
+        self._loads[shard] += 1
+        self._matches[match_id] = writer
+        self._match_shard[match_id] = shard
+        self._to_shard(shard, ("start", match_id, mode, difficulty, round_time, seed))
+        self._send(writer, {"type": "started", "match": match_id, "shard": shard})
+        return match_id
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one connection until it closes."""
+        self._clients[asyncio.current_task()] = writer
+        match_id = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = None
+                op = request.get("op") if isinstance(request, dict) else None
+
+                running = match_id in self._matches
+                if op == "start":
+                    if running:
+                        self._send(writer, {"type": "error", "message": "a match is already running"})
+                    else:
+                        match_id = self._start_match(writer, request)
+                elif op == "input":
+                    action = request.get("action")
+                    if not running:
+                        self._send(writer, {"type": "error", "message": "no match is running"})
+                    elif action not in MainCharacter.ACTIONS:
+                        self._send(writer, {"type": "error", "message": f"unknown action: {action}"})
+                    else:
+                        self._to_shard(self._match_shard[match_id],
+                                       ("input", match_id, MainCharacter.ACTIONS.index(action)))
+                elif op == "stats":
+                    self._send(writer, {"type": "stats", "shards": self.shard_stats})
+                else:
+                    self._send(writer, {"type": "error", "message": "expected a JSON request with an op"})
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if match_id in self._matches:
+                self._to_shard(self._match_shard[match_id], ("cancel", match_id))
+                self._end_match(match_id)
+            writer.close()
+            del self._clients[asyncio.current_task()]
+
+
+def main() -> None:
+    """Command-line entry point: run a match server until interrupted."""
+    parser = argparse.ArgumentParser(description="Host many headless matches over TCP")
+    parser.add_argument("--host", default=MATCH_SERVER_HOST)
+    parser.add_argument("--port", type=int, default=MATCH_SERVER_PORT)
+    parser.add_argument("--shards", type=int, default=MATCH_SERVER_SHARDS,
+                        help="worker processes (default: one per CPU core)")
+    parser.add_argument("--tick-rate", type=int, default=MATCH_SERVER_TICK_RATE)
+    args = parser.parse_args()
+
+    async def serve():
+        server = MatchServer(args.host, args.port, args.shards, args.tick_rate)
+        await server.start()
+        print(f"Serving matches on {server.host}:{server.port} with {server.num_shards} shards")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
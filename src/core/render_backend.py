@@ -0,0 +1,269 @@
+"""
+Render backends.
+
+This module provides the two ways a frame can reach the window: the
+software path that blits onto the display surface, and an SDL2 renderer
+path that uploads sprite frames as textures once and draws through
+``pygame._sdl2.video``.
+
+Both backends expose ``blit(source, dest)`` with the same signature as
+``pygame.Surface.blit`` so entity ``draw`` methods work unchanged, plus a
+``hud`` surface that immediate-mode UI drawing (health bars, text) goes to.
+"""
+
+import os
+import weakref
+import pygame
+from typing import Optional, Tuple
+
+
+class SurfaceBackend:
+    """
+    Software render path drawing straight onto the display surface.
+
+    Attributes:
+        screen (pygame.Surface): The display surface.
+        hud (pygame.Surface): Surface UI elements are drawn on (the screen itself).
+        vsync (bool): Whether presenting waits for the display refresh.
+        scales_on_draw (bool): Whether ``blit`` stretches to a destination rect (no).
+    """
+
+    name = "surface"
+    scales_on_draw = False
+
+    def __init__(self, size: Tuple[int, int], window_size: Optional[Tuple[int, int]] = None,
+                 scaling: str = "linear", vsync: bool = False):
+        """
+        Initialize the software backend.
+
+        Args:
+            size (Tuple[int, int]): Logical frame size.
+            window_size (Optional[Tuple[int, int]]): Ignored; the window matches the frame size.
+            scaling (str): Ignored; the software path does not scale.
+            vsync (bool): Request presenting in step with the display refresh.
+        """
+        self.size = size
+        self.vsync = False
+        if vsync:
+            # pygame only honors vsync for SCALED or OpenGL displays
+            try:
+                self.screen = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+                self.vsync = True
+            except pygame.error as e:
+                print(f"Warning: Could not enable vsync: {e}")
+        if not self.vsync:
+            self.screen = pygame.display.set_mode(size)
+        self.hud = self.screen
+
+    def begin_frame(self, background: Optional[pygame.Surface],
+                    color: Optional[Tuple[int, int, int]]) -> None:
+        """
+        Start a frame by drawing the background.
+
+        Args:
+            background (Optional[pygame.Surface]): Background image, or None.
+            color (Optional[Tuple[int, int, int]]): Fill color used when there is no
+                background; None skips the fill when the caller covers the whole frame.
+        """
+        if background:
+            self.screen.blit(background, (0, 0))
+        elif color is not None:
+            self.screen.fill(color)
+
+    def blit(self, source: pygame.Surface, dest) -> None:
+        """
+        Draw a surface at a position.
+
+        Args:
+            source (pygame.Surface): Surface to draw.
+            dest: Destination position or rect.
+        """
+        self.screen.blit(source, dest)
+
+    def read_frame(self) -> pygame.Surface:
+        """
+        Get the finished frame for capture; call before ``present``.
+
+        Returns:
+            pygame.Surface: The display surface itself (no copy).
+        """
+        return self.screen
+
+    def present(self) -> None:
+        """Show the finished frame."""
+        pygame.display.flip()
+
+
+class TextureBackend:
+    """
+    SDL2 renderer path drawing cached textures through ``Renderer``.
+
+    Every distinct source surface is uploaded once and the texture is reused
+    on later frames, so sprite frames never cross the bus again. Textures
+    are keyed weakly by their surface: once a cache (stage tiles, scaled
+    copies) drops a surface, its texture is released with it. UI elements
+    are drawn onto a transparent ``hud`` surface that is uploaded once per
+    frame. The logical frame is scaled to the window either linearly
+    (``"linear"``, any window size) or by the largest whole factor that fits
+    (``"integer"``, letterboxed).
+
+    Passing ``accelerated=0`` selects SDL's software renderer, which works on
+    machines without a GPU.
+
+    Attributes:
+        window (pygame._sdl2.video.Window): The game window.
+        renderer (pygame._sdl2.video.Renderer): The SDL renderer.
+        hud (pygame.Surface): Transparent surface UI elements are drawn on.
+        vsync (bool): Whether presenting waits for the display refresh.
+        scales_on_draw (bool): Whether ``blit`` stretches to a destination rect (yes).
+    """
+
+    name = "texture"
+    scales_on_draw = True
+
+    def __init__(self, size: Tuple[int, int], window_size: Optional[Tuple[int, int]] = None,
+                 scaling: str = "linear", vsync: bool = False, accelerated: int = -1):
+        """
+        Initialize the texture backend.
+
+        Args:
+            size (Tuple[int, int]): Logical frame size.
+            window_size (Optional[Tuple[int, int]]): Window size; defaults to the frame size.
+            scaling (str): "linear" or "integer".
+            vsync (bool): Present in step with the display refresh.
+            accelerated (int): -1 for any renderer, 0 for software, 1 for GPU.
+        """
+        from pygame._sdl2.video import Renderer, Texture, Window
+
+        if scaling not in ("linear", "integer"):
+            raise ValueError(f"Unknown scaling mode: {scaling}")
+
+        # Must be set before any texture is created
+        os.environ["SDL_RENDER_SCALE_QUALITY"] = "linear" if scaling == "linear" else "nearest"
+
+        self._texture_type = Texture
+        self.size = size
+        self.scaling = scaling
+        caption = pygame.display.get_caption()
+        self.window = Window(caption[0] if caption else "pygame", size=window_size or size)
+        self.renderer = Renderer(self.window, accelerated=accelerated, vsync=vsync)
+        self.vsync = vsync
+        self._apply_scaling()
+
+        self.hud = pygame.Surface(size, pygame.SRCALPHA)
+        self._hud_texture = Texture(self.renderer, size, streaming=True)
+        self._hud_drawn = False
+        self._hud_texture.blend_mode = pygame.BLENDMODE_BLEND
+        self._textures: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._frame: Optional[pygame.Surface] = None  # reused by read_frame
+
+    def _apply_scaling(self) -> None:
+        """Map the logical frame onto the window according to the scaling mode."""
+        if self.scaling == "linear":
+            self.renderer.logical_size = self.size
+            return
+
+        window_w, window_h = self.window.size
+        factor = max(1, min(window_w // self.size[0], window_h // self.size[1]))
+        self.renderer.scale = (factor, factor)
+        offset_x = (window_w - self.size[0] * factor) // (2 * factor)
+        offset_y = (window_h - self.size[1] * factor) // (2 * factor)
+        self.renderer.set_viewport((offset_x, offset_y, self.size[0], self.size[1]))
+
+    def texture_for(self, source: pygame.Surface):
+        """
+        Get the cached texture for a surface, uploading it on first use.
+
+        Args:
+            source (pygame.Surface): Surface to look up.
+
+        Returns:
+            pygame._sdl2.video.Texture: The texture holding the surface pixels.
+        """
+        texture = self._textures.get(source)
+        if texture is None:
+            texture = self._texture_type.from_surface(self.renderer, source)
+            self._textures[source] = texture
+        return texture
+
+    def begin_frame(self, background: Optional[pygame.Surface],
+                    color: Optional[Tuple[int, int, int]]) -> None:
+        """
+        Start a frame by drawing the background and clearing the HUD.
+
+        Args:
+            background (Optional[pygame.Surface]): Background image, or None.
+            color (Optional[Tuple[int, int, int]]): Fill color used when there is no
+                background; None clears to black.
+        """
+        self.renderer.draw_color = (*(color or (0, 0, 0)), 255)
+        self.renderer.clear()
+        if background:
+            self.texture_for(background).draw(dstrect=(0, 0, *background.get_size()))
+        self.hud.fill((0, 0, 0, 0))
+        self._hud_drawn = False
+
+    def blit(self, source: pygame.Surface, dest) -> None:
+        """
+        Draw a surface at a position using its cached texture.
+
+        Args:
+            source (pygame.Surface): Surface to draw.
+            dest: Destination position, or a rect the texture is stretched to.
+        """
+        width, height = (dest[2], dest[3]) if len(dest) == 4 else source.get_size()
+        self.texture_for(source).draw(dstrect=(int(dest[0]), int(dest[1]), width, height))
+
+    def _draw_hud(self) -> None:
+        """Upload the HUD and compose it over the scene, once per frame."""
+        if not self._hud_drawn:
+            self._hud_texture.update(self.hud)
+            self._hud_texture.draw()
+            self._hud_drawn = True
+
+    def read_frame(self) -> pygame.Surface:
+        """
+        Read the finished frame back for capture; call before ``present``.
+
+        The pixels are read into the same surface every frame, so capture
+        costs one read-back and no allocation.
+
+        Returns:
+            pygame.Surface: The render target's pixels; overwritten by the next call.
+        """
+        self._draw_hud()
+        if self._frame is None:
+            self._frame = self.renderer.to_surface()
+        else:
+            self.renderer.to_surface(self._frame)
+        return self._frame
+
+    def present(self) -> None:
+        """Upload the HUD, compose it over the scene and show the frame."""
+        self._draw_hud()
+        self.renderer.present()
+
+
+def create_backend(name: str, size: Tuple[int, int], window_size: Optional[Tuple[int, int]] = None,
+                   scaling: str = "linear", vsync: bool = False):
+    """
+    Create a render backend by name.
+
+    Args:
+        name (str): "surface" or "texture".
+        size (Tuple[int, int]): Logical frame size.
+        window_size (Optional[Tuple[int, int]]): Window size for the texture backend.
+        scaling (str): "linear" or "integer" scaling for the texture backend.
+        vsync (bool): Present in step with the display refresh.
+
+    Returns:
+        The render backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if name == SurfaceBackend.name:
+        return SurfaceBackend(size, window_size, scaling, vsync)
+    if name == TextureBackend.name:
+        return TextureBackend(size, window_size, scaling, vsync)
+    raise ValueError(f"Unknown render backend: {name}")
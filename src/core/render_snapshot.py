@@ -0,0 +1,134 @@
+"""
+Render snapshots.
+
+This module holds the immutable per-tick view of the game that rendering
+draws from, and the buffer that hands snapshots from the simulation thread
+to the render thread when the two run separately.
+"""
+
+import threading
+from typing import NamedTuple, Optional, Tuple
+
+import pygame
+
+from src.systems.stage_manager import TiledBackground
+
+Sprite = Tuple[pygame.Surface, float, float]  # frame, stage x, stage y
+
+
+class RenderSnapshot(NamedTuple):
+    """
+    Everything a frame draws, captured at the end of a simulation tick.
+
+    Snapshots only hold plain values and references to surfaces that are
+    never modified after loading (sprite frames and background tiles), so
+    the simulation can keep running while a snapshot is being drawn.
+
+    Attributes:
+        tick (int): Scheduler tick the snapshot was taken at.
+        background (Optional[TiledBackground]): Stage background.
+        camera_x (int): Stage X coordinate of the view's left edge.
+        camera_zoom (float): Camera zoom factor.
+        sprites (Tuple[Sprite, ...]): Frames to draw, back to front.
+        player_health (float): Player health as a fraction of the maximum.
+        villain_health (float): Villain health as a fraction of the maximum.
+        time_left (Optional[int]): Seconds left in the round, None between rounds.
+        current_round (int): Round number.
+        player_round_wins (int): Rounds won by the player.
+        villain_round_wins (int): Rounds won by the villain.
+        banner (Optional[str]): Centered announcement.
+        winner (Optional[str]): "player" or "villain" once the game is over.
+        debug (Tuple[str, ...]): Debug overlay lines about the simulation.
+        input_samples (int): Input samples taken up to this tick.
+    """
+
+    tick: int
+    background: Optional[TiledBackground]
+    camera_x: int
+    camera_zoom: float
+    sprites: Tuple[Sprite, ...]
+    player_health: float
+    villain_health: float
+    time_left: Optional[int]
+    current_round: int
+    player_round_wins: int
+    villain_round_wins: int
+    banner: Optional[str]
+    winner: Optional[str]
+    debug: Tuple[str, ...]
+    input_samples: int
+
+
+class SnapshotBuffer:
+    """
+    Latest-snapshot mailbox between the simulation and render threads.
+
+    This is triple buffering with the copies made implicit: the simulation
+    builds each snapshot as a new immutable tuple and publishes it by
+    swapping a reference, so it never waits for the renderer, and the
+    renderer always takes the newest complete snapshot. Snapshots the
+    renderer never took are counted as skipped. Publishing with ``wait``
+    turns this into strict double buffering: the simulation waits until the
+    renderer took the previous snapshot, so every tick is drawn.
+
+    Attributes:
+        published (int): Snapshots published.
+        taken (int): Snapshots handed to the renderer.
+        closed (bool): True once the simulation has stopped.
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self.published = 0
+        self.taken = 0
+        self.closed = False
+        self._latest: Optional[RenderSnapshot] = None
+        self._fresh = False
+        self._condition = threading.Condition()
+
+    @property
+    def skipped(self) -> int:
+        """Snapshots replaced by a newer one before the renderer took them."""
+        return self.published - self.taken - self._fresh
+
+    def publish(self, snapshot: RenderSnapshot, wait: bool = False) -> None:
+        """
+        Make a snapshot the latest one.
+
+        Args:
+            snapshot (RenderSnapshot): The snapshot.
+            wait (bool): First wait until the renderer took the previous
+                snapshot, instead of replacing it.
+        """
+        with self._condition:
+            if wait:
+                self._condition.wait_for(lambda: not self._fresh or self.closed)
+            self._latest = snapshot
+            self._fresh = True
+            self.published += 1
+            self._condition.notify_all()
+
+    def take(self, timeout: Optional[float] = None) -> Optional[RenderSnapshot]:
+        """
+        Wait for a snapshot newer than the last one taken.
+
+        Args:
+            timeout (Optional[float]): Most seconds to wait; None waits forever.
+
+        Returns:
+            Optional[RenderSnapshot]: The newest snapshot, or None if none
+            arrived in time or the buffer was closed.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._fresh or self.closed, timeout) or not self._fresh:
+                return None
+            self._fresh = False
+            self.taken += 1
+            self._condition.notify_all()
+            return self._latest
+
+    def close(self) -> None:
+        """Wake the renderer for good; called when the simulation stops."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
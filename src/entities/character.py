@@ -6,7 +6,9 @@ This module provides the abstract base for all character implementations.
 
 import pygame
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+from src.utils.sprite_utils import frame_offset
 
 
 class Character(ABC):
@@ -32,6 +34,13 @@ class Character(ABC):
     MAX_X = None  # Will be set based on screen width
     MIN_X = 0
     
+    # Simulation state captured by snapshot(); subclasses extend this
+    STATE_FIELDS = (
+        "x", "y", "x_change", "velocity_y", "on_ground", "health",
+        "frame_index", "frame_counter",
+        "is_hit", "is_falling", "is_blocking", "is_jumping", "is_crouching",
+    )
+    
     def __init__(self, x: float, y: float):
         """
         Initialize a character.
@@ -115,7 +124,8 @@ class Character(ABC):
         Draw the character on the screen.
         
         Args:
-            screen (pygame.Surface): The game screen surface.
+            screen (pygame.Surface): The game screen surface, or a render
+                backend exposing the same ``blit`` method.
         """
         pass
     
@@ -148,6 +158,44 @@ class Character(ABC):
         self.x = x
         self.y = y
     
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Capture the character's simulation state.
+        
+        The snapshot holds plain values only (no surfaces), so it is cheap to
+        copy and can be sent to another process.
+        
+        Returns:
+            Dict[str, object]: Field name to value for every ``STATE_FIELDS`` entry.
+        """
+        return {name: getattr(self, name) for name in self.STATE_FIELDS}
+    
+    def sprite(self) -> Optional[Tuple[pygame.Surface, float, float]]:
+        """
+        Get the current frame and where it is drawn, for render snapshots.
+        
+        Frames are shared and never modified after loading, so the frame
+        surface itself identifies it.
+        
+        Returns:
+            Optional[Tuple[pygame.Surface, float, float]]: The frame and its
+            stage position including the trim offset, or None without a frame.
+        """
+        if not self.current_frame:
+            return None
+        offset_x, offset_y = frame_offset(self.current_frame)
+        return (self.current_frame, self.x + offset_x, self.y + offset_y)
+    
+    def restore(self, state: Dict[str, object]) -> None:
+        """
+        Restore simulation state captured by ``snapshot``.
+        
+        Args:
+            state (Dict[str, object]): A snapshot of the same character type.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+    
     def get_direction(self, target_x: float) -> str:
         """
         Determine the direction the character should face.
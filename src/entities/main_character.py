@@ -5,9 +5,14 @@ This module defines the player-controlled character for the fighting game.
 """
 
 import pygame
-from typing import List
+from typing import Optional, Sequence
 from src.entities.character import Character
-from src.utils.sprite_utils import SpriteSheet
+from src.utils.sprite_utils import frame_offset
+from src.utils.palette_swap import Rule
+from src.utils.sprite_manifest import ManifestError, load_clips
+from src.systems.command_recognizer import (
+    Command, BACK, DOWN, KICK, PUNCH
+)
 
 
 class MainCharacter(Character):
@@ -38,7 +43,25 @@ class MainCharacter(Character):
     SPRITE_WIDTH_CROUCH = 133
     SPRITE_HEIGHT_CROUCH = 200
     
-    def __init__(self, x: float, y: float, sprites_dir: str = "assets/sprites/Scorpian"):
+    STATE_FIELDS = Character.STATE_FIELDS + (
+        "is_ducking", "is_getting_up", "is_double_punching", "is_punching",
+        "is_kicking", "is_und_kicking", "is_movement_in_progress",
+    )
+    
+    # Discrete actions for AI and training code; see perform_action()
+    ACTIONS = ("IDLE", "FORWARD", "BACK", "PUNCH", "DOUBLE_PUNCH", "KICK", "UND_KICK", "BLOCK", "JUMP")
+    WALK_SPEED = 5
+    
+    # Input commands; names match the methods that perform them
+    COMMANDS = [
+        Command("punch", [PUNCH]),
+        Command("double_punch", [PUNCH, PUNCH], max_duration_ms=300),
+        Command("kick", [KICK]),
+        Command("und_kick", [DOWN, BACK, KICK], max_duration_ms=500),  # Quarter-circle back + kick
+    ]
+    
+    def __init__(self, x: float, y: float, sprites_dir: str = "assets/sprites/Scorpian",
+                 palette: Optional[Sequence[Rule]] = None):
         """
         Initialize the main character.
         
@@ -46,10 +69,12 @@ class MainCharacter(Character):
             x (float): Starting X position.
             y (float): Starting Y position.
             sprites_dir (str): Directory containing character sprites.
+            palette (Optional[Sequence[Rule]]): Costume palette; None keeps the original colors.
         """
         super().__init__(x, y)
         
         self.sprites_dir = sprites_dir
+        self.palette = palette
         
         # Action flags
         self.is_ducking = False
@@ -62,8 +87,6 @@ class MainCharacter(Character):
         self.is_und_kicking = False
         
         # Timing
-        self.last_a_press_time = 0
-        self.last_down_press_time = 0
         self.is_movement_in_progress = False
         self.current_action = None
         
@@ -80,44 +103,29 @@ class MainCharacter(Character):
         self.MAX_X = pygame.display.get_surface().get_width() - self.SPRITE_WIDTH_STANCE if pygame.display.get_surface() else None
     
     def _load_sprites(self) -> None:
-        """Load all sprite animations from sprite sheets."""
+        """Load all sprite animations listed in the sprite manifest."""
+        self.clips = {}  # clip name -> frames, kept for memory accounting
         try:
-            # Load stance sprites
-            stance_sheet = SpriteSheet(f"{self.sprites_dir}/Sstance1.png")
-            self.stance_frames_left = stance_sheet.get_frames(0, 8, self.SPRITE_WIDTH_STANCE, self.SPRITE_HEIGHT_STANCE)
-            self.stance_frames_right = stance_sheet.get_frames(1, 8, self.SPRITE_WIDTH_STANCE, self.SPRITE_HEIGHT_STANCE)
-            
-            # Load running sprites
-            running_sheet = SpriteSheet(f"{self.sprites_dir}/Srunning.png")
-            self.running_frames_left = running_sheet.get_frames(1, 12, self.SPRITE_WIDTH_RUNNING, self.SPRITE_HEIGHT_RUNNING)
-            self.running_frames_right = running_sheet.get_frames(0, 12, self.SPRITE_WIDTH_RUNNING, self.SPRITE_HEIGHT_RUNNING)
-            
-            # Load punch sprites
-            punch_sheet = SpriteSheet(f"{self.sprites_dir}/punch.png")
-            self.punch_frames_left = punch_sheet.get_frames(0, 3, self.SPRITE_WIDTH_PUNCH, self.SPRITE_HEIGHT_PUNCH)
-            self.punch_frames_right = punch_sheet.get_frames(1, 3, self.SPRITE_WIDTH_PUNCH, self.SPRITE_HEIGHT_PUNCH)
+            clips = load_clips(self.sprites_dir, palette=self.palette)
+            self.clips = clips
+            self.stance_frames_left = clips["stance_left"]
+            self.stance_frames_right = clips["stance_right"]
+            self.running_frames_left = clips["running_left"]
+            self.running_frames_right = clips["running_right"]
+            self.punch_frames_left = clips["punch_left"]
+            self.punch_frames_right = clips["punch_right"]
+            self.double_punch_frames_left = clips["double_punch_left"]
+            self.double_punch_frames_right = clips["double_punch_right"]
+            self.kick_frames_left = clips["kick_left"]
+            self.kick_frames_right = clips["kick_right"]
+            self.und_kick_frames_left = clips["und_kick_left"]
+            self.und_kick_frames_right = clips["und_kick_right"]
+            self.hit_frames_left = clips["hit_left"]
+            self.hit_frames_right = clips["hit_right"]
+            self.fall_frames_left = clips["fall_left"]
+            self.fall_frames_right = clips["fall_right"]
             
-            # Load double punch sprites
-            double_punch_sheet = SpriteSheet(f"{self.sprites_dir}/Dpunch.png")
-            self.double_punch_frames_left = double_punch_sheet.get_frames(0, 6, self.SPRITE_WIDTH_PUNCH, self.SPRITE_HEIGHT_PUNCH)
-            self.double_punch_frames_right = double_punch_sheet.get_frames(1, 6, self.SPRITE_WIDTH_PUNCH, self.SPRITE_HEIGHT_PUNCH)
-            
-            # Load kick sprites
-            kick_sheet = SpriteSheet(f"{self.sprites_dir}/bBkick.png")
-            self.kick_frames_left = kick_sheet.get_frames(0, 8, self.SPRITE_WIDTH_KICK, self.SPRITE_HEIGHT_KICK)
-            self.kick_frames_right = kick_sheet.get_frames(1, 8, self.SPRITE_WIDTH_KICK, self.SPRITE_HEIGHT_KICK)
-            
-            # Load hit sprites
-            hit_sheet = SpriteSheet(f"{self.sprites_dir}/smallhit.png")
-            self.hit_frames_left = hit_sheet.get_frames(0, 3, self.SPRITE_WIDTH_HIT, self.SPRITE_HEIGHT_HIT)
-            self.hit_frames_right = hit_sheet.get_frames(1, 3, self.SPRITE_WIDTH_HIT, self.SPRITE_HEIGHT_HIT)
-            
-            # Load fall sprites
-            fall_sheet = SpriteSheet(f"{self.sprites_dir}/falling1.png")
-            self.fall_frames_left = fall_sheet.get_frames(0, 7, self.SPRITE_WIDTH_FALL, self.SPRITE_HEIGHT_FALL)
-            self.fall_frames_right = fall_sheet.get_frames(1, 7, self.SPRITE_WIDTH_FALL, self.SPRITE_HEIGHT_FALL)
-            
-        except FileNotFoundError as e:
+        except (FileNotFoundError, ManifestError) as e:
             print(f"Warning: Could not load some sprites: {e}")
     
     def update_frame(self, target_x: float) -> None:
@@ -136,6 +144,8 @@ class MainCharacter(Character):
             self._update_punch_frame(target_x)
         elif self.is_kicking:
             self._update_kick_frame(target_x)
+        elif self.is_und_kicking:
+            self._update_und_kick_frame(target_x)
         elif self.is_hit:
             self._update_hit_frame()
         elif self.is_falling:
@@ -220,6 +230,20 @@ class MainCharacter(Character):
         frames = self.kick_frames_left if self.x < target_x else self.kick_frames_right
         self.current_frame = frames[min(self.frame_index, len(frames) - 1)]
     
+    def _update_und_kick_frame(self, target_x: float) -> None:
+        """Update under kick animation frame."""
+        if not hasattr(self, 'und_kick_frames_left') or not self.und_kick_frames_left:
+            return
+        
+        if self.frame_counter % 5 == 0:
+            self.frame_index = (self.frame_index + 1) % len(self.und_kick_frames_left)
+            if self.frame_index == 0:
+                self.is_und_kicking = False
+                self.is_movement_in_progress = False
+        
+        frames = self.und_kick_frames_left if self.x < target_x else self.und_kick_frames_right
+        self.current_frame = frames[min(self.frame_index, len(frames) - 1)]
+    
     def _update_hit_frame(self) -> None:
         """Update hit animation frame."""
         if not hasattr(self, 'hit_frames_left') or not self.hit_frames_left:
@@ -252,7 +276,9 @@ class MainCharacter(Character):
             screen (pygame.Surface): The game screen surface.
         """
         if self.current_frame:
-            screen.blit(self.current_frame, (self.x, self.y))
+            # Frames are trimmed to their opaque pixels; shift by the crop
+            offset_x, offset_y = frame_offset(self.current_frame)
+            screen.blit(self.current_frame, (self.x + offset_x, self.y + offset_y))
     
     def punch(self, target_x: float) -> None:
         """
@@ -293,6 +319,56 @@ class MainCharacter(Character):
             self.frame_index = 0
             self.frame_counter = 0
     
+    def und_kick(self, target_x: float) -> None:
+        """
+        Execute an under kick (sweep) attack.
+        
+        Args:
+            target_x (float): Target position for directional kick.
+        """
+        if not self.is_movement_in_progress:
+            self.is_und_kicking = True
+            self.is_movement_in_progress = True
+            self.frame_index = 0
+            self.frame_counter = 0
+    
+    def perform_command(self, name: str, target_x: float) -> None:
+        """
+        Execute a recognized input command.
+        
+        Args:
+            name (str): Name of a command in ``COMMANDS``.
+            target_x (float): Target position for directional attacks.
+        """
+        getattr(self, name)(target_x)
+    
+    def perform_action(self, action: str, target_x: float) -> None:
+        """
+        Apply one discrete action in place of keyboard input.
+        
+        FORWARD and BACK walk towards and away from the target. Every action
+        other than BLOCK releases the block.
+        
+        Args:
+            action (str): One of ``ACTIONS``.
+            target_x (float): Opponent's X position.
+        """
+        toward = self.WALK_SPEED if self.x < target_x else -self.WALK_SPEED
+        self.x_change = 0
+        if action != "BLOCK":
+            self.stop_blocking()
+        
+        if action == "FORWARD":
+            self.x_change = toward
+        elif action == "BACK":
+            self.x_change = -toward
+        elif action == "BLOCK":
+            self.block()
+        elif action == "JUMP":
+            self.jump()
+        elif action != "IDLE":
+            getattr(self, action.lower())(target_x)
+    
     def block(self) -> None:
         """Enter blocking stance to reduce incoming damage."""
         if not self.is_movement_in_progress and self.on_ground:
@@ -330,6 +406,8 @@ class MainCharacter(Character):
             return "punching"
         elif self.is_kicking:
             return "kicking"
+        elif self.is_und_kicking:
+            return "und_kicking"
         elif self.is_hit:
             return "hit"
         elif self.is_falling:
@@ -6,9 +6,11 @@ This module defines the AI-controlled enemy character for the fighting game.
 
 import pygame
 import random
-from typing import List
+from typing import Callable, List, Optional, Sequence
 from src.entities.character import Character
-from src.utils.sprite_utils import SpriteSheet
+from src.utils.sprite_utils import frame_offset
+from src.utils.palette_swap import Rule
+from src.utils.sprite_manifest import ManifestError, load_clips
 
 
 class Villain(Character):
@@ -36,8 +38,15 @@ class Villain(Character):
     # AI constants
     ATTACK_RANGE = 100
     WALK_RANGE = 200
+    ACTIONS = ("IDLE", "WALK", "DOUBLE_PUNCH", "KICK", "BLOCK")
     
-    def __init__(self, x: float, y: float, sprites_dir: str = "assets/sprites/sonya"):
+    STATE_FIELDS = Character.STATE_FIELDS + (
+        "is_falling_down", "is_getting_up", "is_double_punching", "is_kicking",
+        "state", "direction",
+    )
+    
+    def __init__(self, x: float, y: float, sprites_dir: str = "assets/sprites/sonya",
+                 palette: Optional[Sequence[Rule]] = None):
         """
         Initialize the villain character.
         
@@ -45,10 +54,12 @@ class Villain(Character):
             x (float): Starting X position.
             y (float): Starting Y position.
             sprites_dir (str): Directory containing character sprites.
+            palette (Optional[Sequence[Rule]]): Costume palette; None keeps the original colors.
         """
         super().__init__(x, y)
         
         self.sprites_dir = sprites_dir
+        self.palette = palette
         
         # Action flags
         self.is_falling_down = False
@@ -62,6 +73,9 @@ class Villain(Character):
         self.current_action = None
         self.behavior_timer = 0
         
+        # Called with the action name on every AI decision
+        self.action_listeners: List[Callable[[str], None]] = []
+        
         # Load all sprite frames
         self._load_sprites()
         
@@ -72,44 +86,27 @@ class Villain(Character):
             self.current_frame = pygame.Surface((self.SPRITE_WIDTH_STANCE, self.SPRITE_HEIGHT_STANCE))
     
     def _load_sprites(self) -> None:
-        """Load all sprite animations from sprite sheets."""
+        """Load all sprite animations listed in the sprite manifest."""
+        self.clips = {}  # clip name -> frames, kept for memory accounting
         try:
-            # Load walking sprites
-            walking_sheet = SpriteSheet(f"{self.sprites_dir}/Swalking.png")
-            self.walking_frames_right = walking_sheet.get_frames(0, 9, self.SPRITE_WIDTH_WALKING, self.SPRITE_HEIGHT_WALKING)
-            self.walking_frames_left = walking_sheet.get_frames(1, 9, self.SPRITE_WIDTH_WALKING, self.SPRITE_HEIGHT_WALKING)
-            
-            # Load stance sprites
-            stance_sheet = SpriteSheet(f"{self.sprites_dir}/stance1.png")
-            self.stance_frames_left = stance_sheet.get_frames(0, 7, self.SPRITE_WIDTH_STANCE, self.SPRITE_HEIGHT_STANCE)
-            self.stance_frames_right = stance_sheet.get_frames(1, 7, self.SPRITE_WIDTH_STANCE, self.SPRITE_HEIGHT_STANCE)
-            
-            # Load hit sprites
-            hit_sheet = SpriteSheet(f"{self.sprites_dir}/smallhit.png")
-            self.hit_frames_left = hit_sheet.get_frames(0, 3, self.SPRITE_WIDTH_HIT, self.SPRITE_HEIGHT_HIT)
-            self.hit_frames_right = hit_sheet.get_frames(1, 3, self.SPRITE_WIDTH_HIT, self.SPRITE_HEIGHT_HIT)
-            
-            # Load falling sprites
-            falling_sheet = SpriteSheet(f"{self.sprites_dir}/falingdown.png")
-            self.falling_frames_left = falling_sheet.get_frames(1, 7, self.SPRITE_WIDTH_FALLING, self.SPRITE_HEIGHT_FALLING)
-            self.falling_frames_right = falling_sheet.get_frames(0, 7, self.SPRITE_WIDTH_FALLING, self.SPRITE_HEIGHT_FALLING)
-            
-            # Load getup sprites
-            getup_sheet = SpriteSheet(f"{self.sprites_dir}/getup.png")
-            self.getup_frames_left = getup_sheet.get_frames(1, 2, 145, self.SPRITE_HEIGHT_STANCE)
-            self.getup_frames_right = getup_sheet.get_frames(0, 2, 145, self.SPRITE_HEIGHT_STANCE)
+            clips = load_clips(self.sprites_dir, palette=self.palette)
+            self.clips = clips
+            self.walking_frames_left = clips["walking_left"]
+            self.walking_frames_right = clips["walking_right"]
+            self.stance_frames_left = clips["stance_left"]
+            self.stance_frames_right = clips["stance_right"]
+            self.hit_frames_left = clips["hit_left"]
+            self.hit_frames_right = clips["hit_right"]
+            self.falling_frames_left = clips["falling_left"]
+            self.falling_frames_right = clips["falling_right"]
+            self.getup_frames_left = clips["getup_left"]
+            self.getup_frames_right = clips["getup_right"]
+            self.punch_frames_left = clips["punch_left"]
+            self.punch_frames_right = clips["punch_right"]
+            self.kick_frames_left = clips["kick_left"]
+            self.kick_frames_right = clips["kick_right"]
             
-            # Load double punch sprites
-            punch_sheet = SpriteSheet(f"{self.sprites_dir}/doublepunching.png")
-            self.punch_frames_left = punch_sheet.get_frames(0, 7, self.SPRITE_WIDTH_PUNCH, self.SPRITE_HEIGHT_PUNCH)
-            self.punch_frames_right = punch_sheet.get_frames(1, 7, self.SPRITE_WIDTH_PUNCH, self.SPRITE_HEIGHT_PUNCH)
-            
-            # Load kick sprites
-            kick_sheet = SpriteSheet(f"{self.sprites_dir}/kick.png")
-            self.kick_frames_left = kick_sheet.get_frames(0, 6, self.SPRITE_WIDTH_KICK, self.SPRITE_HEIGHT_KICK)
-            self.kick_frames_right = kick_sheet.get_frames(1, 6, self.SPRITE_WIDTH_KICK, self.SPRITE_HEIGHT_KICK)
-            
-        except FileNotFoundError as e:
+        except (FileNotFoundError, ManifestError) as e:
             print(f"Warning: Could not load some villain sprites: {e}")
     
     def update_position(self, target_x: float) -> None:
@@ -132,6 +129,11 @@ class Villain(Character):
             self.x_change = 0
         
         self.x += self.x_change
+        
+        # Enforce stage boundaries
+        self.x = max(self.MIN_X, self.x)
+        if self.MAX_X is not None:
+            self.x = min(self.MAX_X, self.x)
     
     def update_frame(self, target_x: float) -> None:
         """
@@ -266,7 +268,9 @@ class Villain(Character):
             screen (pygame.Surface): The game screen surface.
         """
         if self.current_frame:
-            screen.blit(self.current_frame, (self.x, self.y))
+            # Frames are trimmed to their opaque pixels; shift by the crop
+            offset_x, offset_y = frame_offset(self.current_frame)
+            screen.blit(self.current_frame, (self.x + offset_x, self.y + offset_y))
     
     def get_rect(self) -> pygame.Rect:
         """
@@ -288,19 +292,41 @@ class Villain(Character):
         
         if distance < self.ATTACK_RANGE:
             # Player is in attack range
-            self.state = random.choice(["IDLE", "DOUBLE_PUNCH", "KICK"])
-            
-            if self.state == "DOUBLE_PUNCH":
-                self.is_double_punching = True
-                self.frame_index = 0
-                self.frame_counter = 0
-            elif self.state == "KICK":
-                self.is_kicking = True
-                self.frame_index = 0
-                self.frame_counter = 0
+            self.perform_action(random.choice(["IDLE", "DOUBLE_PUNCH", "KICK"]))
         else:
             # Player is too far, approach them
-            self.state = "WALK"
+            self.perform_action("WALK")
+    
+    def perform_action(self, action: str) -> None:
+        """
+        Switch to an AI action.
+        
+        Args:
+            action (str): One of ``ACTIONS``.
+        """
+        self.state = action
+        self.is_blocking = action == "BLOCK"
+        for listener in self.action_listeners:
+            listener(action)
+        
+        if action == "DOUBLE_PUNCH":
+            self.is_double_punching = True
+            self.frame_index = 0
+            self.frame_counter = 0
+        elif action == "KICK":
+            self.is_kicking = True
+            self.frame_index = 0
+            self.frame_counter = 0
+    
+    def is_busy(self) -> bool:
+        """
+        Check if the villain is locked into an animation.
+        
+        Returns:
+            bool: True while attacking, reacting to a hit, falling or getting up.
+        """
+        return (self.is_double_punching or self.is_kicking or self.is_hit or
+                self.is_falling_down or self.is_getting_up)
     
     def get_current_action(self) -> str:
         """
@@ -321,5 +347,7 @@ class Villain(Character):
             return "getting_up"
         elif self.state == "WALK":
             return "walking"
+        elif self.is_blocking:
+            return "blocking"
         else:
             return "idle"
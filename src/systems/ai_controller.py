@@ -0,0 +1,248 @@
+"""
+AI controller system.
+
+This module drives the villain every simulation tick under a fixed CPU
+budget, with difficulty expressed as reaction time.
+"""
+
+import random
+import time
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional
+
+from src.systems.search_ai import SearchAI
+
+
+class AIFeatures(NamedTuple):
+    """Cheap per-tick observations the AI decides on."""
+    distance: float
+    facing_right: bool
+    opponent_action: str
+    opponent_attacking: bool
+    opponent_vulnerable: bool
+    opponent_blocking: bool
+
+
+# Reaction time and play style per difficulty. Per-tick CPU cost is the same
+# for all; "search" levels also run look-ahead search in a worker process.
+DIFFICULTY_LEVELS: Dict[str, dict] = {
+    "easy": {"reaction_ms": 500, "aggression": 0.3, "noise": 0.5, "search": False},
+    "normal": {"reaction_ms": 250, "aggression": 0.5, "noise": 0.3, "search": False},
+    "hard": {"reaction_ms": 100, "aggression": 0.7, "noise": 0.1, "search": True},
+}
+
+ATTACK_ACTIONS = ("punching", "double_punching", "kicking", "und_kicking")
+
+
+class AIController:
+    """
+    Per-tick villain controller with a microsecond budget.
+
+    Every tick the controller computes a small feature snapshot of the fight
+    (distance, facing, opponent action) once and pushes it into a delay line;
+    decisions are made on the snapshot from ``reaction_ms`` ago, which is how
+    difficulty changes reaction time without changing the work done per tick.
+
+    Scoring the candidate actions is the expensive part, so it is split into
+    one work item per action and spread across ticks: each tick evaluates
+    items until ``budget_us`` is spent (always at least one), and the best
+    action is applied once every candidate has been scored. A new
+    evaluation starts at most every ``decision_interval_ms`` and only while
+    the villain is free to act.
+
+    Difficulties with look-ahead search keep a request running in a
+    ``SearchAI`` worker process. When a decision is due and a search result
+    has arrived, its action is used; otherwise the heuristic scoring above
+    decides, so the game never waits on the worker.
+
+    Attributes:
+        villain: The villain entity being controlled.
+        difficulty (str): Key into ``DIFFICULTY_LEVELS``.
+        budget_us (float): CPU budget per tick in microseconds.
+        last_tick_us (float): Time spent in the most recent ``update``.
+        over_budget_ticks (int): Ticks that exceeded the budget.
+        decisions (int): Number of actions chosen so far.
+        search (Optional[SearchAI]): Look-ahead search client, when enabled.
+    """
+
+    def __init__(self, villain, difficulty: str = "normal", budget_us: float = 200,
+                 tick_rate: int = 30, decision_interval_ms: float = 200,
+                 attack_range: Optional[float] = None):
+        """
+        Initialize the AI controller.
+
+        Args:
+            villain: The villain entity to control.
+            difficulty (str): Key into ``DIFFICULTY_LEVELS``.
+            budget_us (float): CPU budget per tick in microseconds.
+            tick_rate (int): Simulation ticks per second.
+            decision_interval_ms (float): Minimum time between decisions.
+            attack_range (Optional[float]): Distance considered in range; the
+                villain's ``ATTACK_RANGE`` if omitted.
+        """
+        self.villain = villain
+        self.budget_us = budget_us
+        self.tick_rate = tick_rate
+        self.attack_range = attack_range if attack_range is not None else villain.ATTACK_RANGE
+        self.decision_interval_ticks = max(1, round(decision_interval_ms * tick_rate / 1000))
+
+        self.last_tick_us = 0.0
+        self.over_budget_ticks = 0
+        self.decisions = 0
+
+        self._perception: deque = deque()
+        self._pending: List[str] = []
+        self._scores: Dict[str, float] = {}
+        self._decision_features: Optional[AIFeatures] = None
+        self._ticks_since_decision = self.decision_interval_ticks
+        self._search_action: Optional[str] = None
+        self.search: Optional[SearchAI] = None
+        self.set_difficulty(difficulty)
+
+    def set_difficulty(self, difficulty: str) -> None:
+        """
+        Change difficulty, resizing the perception delay line.
+
+        Args:
+            difficulty (str): Key into ``DIFFICULTY_LEVELS``.
+
+        Raises:
+            ValueError: If the difficulty is unknown.
+        """
+        if difficulty not in DIFFICULTY_LEVELS:
+            raise ValueError(f"Unknown AI difficulty: {difficulty}")
+
+        settings = DIFFICULTY_LEVELS[difficulty]
+        self.difficulty = difficulty
+        self.aggression = settings["aggression"]
+        self.noise = settings["noise"]
+        delay_ticks = max(0, round(settings["reaction_ms"] * self.tick_rate / 1000))
+        self._perception = deque(self._perception, maxlen=delay_ticks + 1)
+
+        if settings["search"] and self.search is None:
+            self.search = SearchAI(tick_rate=self.tick_rate)
+        elif not settings["search"] and self.search is not None:
+            self.shutdown()
+
+    def reset(self) -> None:
+        """Forget perceived history and any half-finished evaluation."""
+        self._perception.clear()
+        self._pending = []
+        self._scores = {}
+        self._ticks_since_decision = self.decision_interval_ticks
+        self._search_action = None
+
+    def shutdown(self) -> None:
+        """Stop the search worker, if one is running."""
+        if self.search is not None:
+            self.search.close()
+            self.search = None
+
+    @property
+    def rollouts_per_second(self) -> float:
+        """Look-ahead search throughput, or 0 when search is disabled."""
+        return self.search.rollouts_per_second if self.search is not None else 0.0
+
+    def update(self, opponent) -> None:
+        """
+        Run one tick of perception and decision-making.
+
+        Args:
+            opponent: The player entity.
+        """
+        start = time.perf_counter_ns()
+        budget_ns = self.budget_us * 1000
+
+        self._perception.append(self._observe(opponent))
+        self._ticks_since_decision += 1
+        free = not self.villain.is_busy()
+
+        if self.search is not None:
+            result = self.search.poll()
+            if result is not None:
+                self._search_action = result.action
+            if free and not self.search.in_flight:
+                self.search.submit(opponent, self.villain)
+            if free and self._search_action is not None and \
+                    self._ticks_since_decision >= self.decision_interval_ticks:
+                self._pending = []
+                self._scores = {self._search_action: 1.0}
+                self._search_action = None
+                self._decide()
+
+        if free and (
+                self._pending or self._ticks_since_decision >= self.decision_interval_ticks):
+            if not self._pending:
+                # Start a new evaluation on the delayed snapshot
+                self._decision_features = self._perception[0]
+                self._pending = list(self.villain.ACTIONS)
+                self._scores = {}
+
+            while self._pending:
+                action = self._pending.pop()
+                self._scores[action] = self._score(action, self._decision_features)
+                if time.perf_counter_ns() - start >= budget_ns:
+                    break
+
+            if not self._pending:
+                self._decide()
+
+        self.last_tick_us = (time.perf_counter_ns() - start) / 1000
+        if self.last_tick_us > self.budget_us:
+            self.over_budget_ticks += 1
+
+    def _observe(self, opponent) -> AIFeatures:
+        """Compute this tick's feature snapshot."""
+        villain = self.villain
+        action = opponent.get_current_action()
+        return AIFeatures(
+            distance=abs(villain.x - opponent.x),
+            facing_right=villain.x < opponent.x,
+            opponent_action=action,
+            opponent_attacking=action in ATTACK_ACTIONS,
+            opponent_vulnerable=opponent.is_hit or opponent.is_falling,
+            opponent_blocking=opponent.is_blocking,
+        )
+
+    def _score(self, action: str, features: AIFeatures) -> float:
+        """
+        Score one candidate action against a feature snapshot.
+
+        Args:
+            action (str): Candidate action.
+            features (AIFeatures): Perceived state of the fight.
+
+        Returns:
+            float: Utility of the action; higher is better.
+        """
+        in_range = features.distance < self.attack_range
+        score = random.uniform(0, self.noise)
+
+        if action == "WALK":
+            return score + (0.9 if not in_range else 0.0)
+        if action == "IDLE":
+            return score + 0.2
+        if not in_range:
+            return score
+
+        if action == "BLOCK":
+            return score + (0.9 - 0.3 * self.aggression if features.opponent_attacking else 0.1)
+
+        # Attacks
+        attack = 0.4 + 0.5 * self.aggression
+        if features.opponent_vulnerable:
+            attack += 0.3
+        if features.opponent_attacking:
+            attack -= 0.3
+        if features.opponent_blocking:
+            attack -= 0.2
+        if action == "KICK":
+            attack += 0.05 if features.opponent_blocking else -0.05
+        return score + attack
+
+    def _decide(self) -> None:
+        """Apply the best scored action."""
+        action = max(self._scores, key=self._scores.get)
+        self.villain.perform_action(action)
+        self.decisions += 1
+        self._ticks_since_decision = 0
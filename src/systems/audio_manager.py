@@ -0,0 +1,202 @@
+"""
+Audio system.
+
+This module preloads sound effects into a sound bank, plays them on a fixed
+pool of mixer channels with priority-based voice stealing, and streams
+background music from disk.
+"""
+
+import math
+import os
+import random
+from array import array
+from typing import Dict, List, Optional
+
+import pygame
+
+
+# Effects that make up the sound bank, with their voice-stealing priority
+SOUND_PRIORITIES: Dict[str, int] = {
+    "whoosh": 1,
+    "block": 2,
+    "hit": 2,
+    "ko": 3,
+}
+
+
+class AudioManager:
+    """
+    Low-latency sound effect playback and streamed music.
+
+    Every effect is decoded once at startup, so ``play`` only hands an
+    already-decoded ``pygame.mixer.Sound`` to a channel. Effects play on a
+    fixed pool of channels: a free channel is used when there is one,
+    otherwise the channel playing the lowest-priority, oldest sound is
+    stolen as long as its priority does not exceed the new sound's. Sounds
+    that cannot get a channel are dropped rather than queued.
+
+    Effects whose file is missing or unreadable fall back to a synthesized
+    tone, so the game always has feedback. If the mixer cannot be opened
+    (e.g. no audio device), the manager is disabled and ``play`` does nothing.
+
+    Attributes:
+        enabled (bool): Whether the mixer opened successfully.
+        sounds (Dict[str, pygame.mixer.Sound]): The preloaded sound bank.
+        played (int): Sounds started.
+        stolen (int): Sounds cut off to make room for another.
+        dropped (int): Sounds not played because every channel was busy
+            with a higher-priority sound.
+    """
+
+    def __init__(self, sound_files: Dict[str, Optional[str]], music_file: Optional[str] = None,
+                 num_channels: int = 8, frequency: int = 44100, buffer_size: int = 256,
+                 volume: float = 1.0):
+        """
+        Open the mixer and preload the sound bank.
+
+        Args:
+            sound_files (Dict[str, Optional[str]]): Effect name to file path;
+                None or a missing file uses a synthesized fallback.
+            music_file (Optional[str]): Background music streamed from disk.
+            num_channels (int): Size of the channel pool.
+            frequency (int): Mixer sample rate, used if the mixer is not open yet.
+            buffer_size (int): Mixer buffer in samples, used if the mixer is
+                not open yet; smaller means lower latency.
+            volume (float): Effect volume from 0.0 to 1.0.
+        """
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.music_file = music_file
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency, -16, 2, buffer_size)
+            self.enabled = True
+        except pygame.error as e:
+            print(f"Warning: Could not open audio device: {e}")
+            self.enabled = False
+            return
+
+        pygame.mixer.set_num_channels(num_channels)
+        self._channels: List[pygame.mixer.Channel] = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        self._channel_priority = [0] * num_channels
+        self._channel_started = [0] * num_channels
+
+        for name in SOUND_PRIORITIES:
+            sound = self._load(sound_files.get(name)) or self._synthesize(name)
+            sound.set_volume(volume)
+            self.sounds[name] = sound
+
+    def _load(self, path: Optional[str]) -> Optional[pygame.mixer.Sound]:
+        """
+        Decode a sound file fully into memory.
+
+        Args:
+            path (Optional[str]): Sound file path.
+
+        Returns:
+            Optional[pygame.mixer.Sound]: The sound, or None if it cannot be loaded.
+        """
+        if path is None or not os.path.isfile(path):
+            return None
+        try:
+            return pygame.mixer.Sound(path)
+        except pygame.error as e:
+            print(f"Warning: Could not load sound {path}: {e}")
+            return None
+
+    def _synthesize(self, name: str) -> pygame.mixer.Sound:
+        """
+        Build a short fallback effect in the mixer's sample format.
+
+        Args:
+            name (str): Effect name.
+
+        Returns:
+            pygame.mixer.Sound: The synthesized sound.
+        """
+        frequency, _, channels = pygame.mixer.get_init()
+        rng = random.Random(name)
+
+        if name == "whoosh":
+            # Noise swelling in and out
+            duration = 0.18
+            def sample(t):
+                return rng.uniform(-1, 1) * math.sin(math.pi * t / duration) * 0.35
+        elif name == "ko":
+            # Falling tone with a long decay
+            duration = 0.6
+            def sample(t):
+                return math.sin(2 * math.pi * (220 - 150 * t) * t) * (1 - t / duration) * 0.6
+        else:
+            # Percussive thump for hits and blocks
+            duration = 0.08
+            pitch = 400 if name == "block" else 120
+            def sample(t):
+                return (math.sin(2 * math.pi * pitch * t) * 0.7 + rng.uniform(-0.3, 0.3)) * \
+                    math.exp(-t * 40)
+
+        samples = array("h")
+        for i in range(int(frequency * duration)):
+            value = int(max(-1.0, min(1.0, sample(i / frequency))) * 32767)
+            samples.extend([value] * channels)
+        return pygame.mixer.Sound(buffer=samples.tobytes())
+
+    def play(self, name: str) -> bool:
+        """
+        Play a preloaded effect on the channel pool.
+
+        Args:
+            name (str): Effect name in the sound bank.
+
+        Returns:
+            bool: True if the sound started.
+        """
+        if not self.enabled:
+            return False
+
+        priority = SOUND_PRIORITIES[name]
+        victim = -1
+        for index, channel in enumerate(self._channels):
+            if not channel.get_busy():
+                victim = index
+                break
+            if self._channel_priority[index] <= priority and (
+                    victim < 0 or
+                    (self._channel_priority[index], self._channel_started[index]) <
+                    (self._channel_priority[victim], self._channel_started[victim])):
+                victim = index
+        else:
+            if victim < 0:
+                self.dropped += 1
+                return False
+            self.stolen += 1
+
+        self._channels[victim].play(self.sounds[name])
+        self._channel_priority[victim] = priority
+        self._channel_started[victim] = self.played
+        self.played += 1
+        return True
+
+    def play_music(self, loops: int = -1) -> None:
+        """
+        Start streaming the background music from disk.
+
+        Args:
+            loops (int): Extra repetitions; -1 loops forever.
+        """
+        if not self.enabled or self.music_file is None:
+            return
+        try:
+            pygame.mixer.music.load(self.music_file)
+            pygame.mixer.music.play(loops)
+        except pygame.error as e:
+            print(f"Warning: Could not play music {self.music_file}: {e}")
+
+    def stop(self) -> None:
+        """Stop every effect and the music."""
+        if self.enabled:
+            pygame.mixer.stop()
+            pygame.mixer.music.stop()
@@ -5,7 +5,7 @@ This module handles collision detection and resolution for combat mechanics.
 """
 
 import pygame
-from typing import Tuple
+from typing import Callable, List, Tuple
 
 
 class CollisionHandler:
@@ -16,18 +16,43 @@ class CollisionHandler:
         last_fall_time (int): Timestamp of the last fall event.
         last_hit_time (int): Timestamp of the last hit event.
         collision_cooldown (int): Cooldown time in milliseconds between collisions.
+        hit_listeners (List[Callable]): Called as ``listener(kind, attacker,
+            defender, damage)`` whenever an attack lands.
     """
     
-    def __init__(self, collision_cooldown: int = 500):
+    def __init__(self, collision_cooldown: int = 500,
+                 clock: Callable[[], int] = pygame.time.get_ticks):
         """
         Initialize the collision handler.
         
         Args:
             collision_cooldown (int): Cooldown time in milliseconds. Default is 500ms.
+            clock (Callable[[], int]): Returns the current time in milliseconds.
+                Simulations that run faster than real time pass their own clock.
         """
         self.last_fall_time = 0
         self.last_hit_time = 0
         self.collision_cooldown = collision_cooldown
+        self.clock = clock
+        self.hit_listeners: List[Callable[[str, object, object, int], None]] = []
+    
+    def add_hit_listener(self, listener: Callable[[str, object, object, int], None]) -> None:
+        """
+        Register a callback for landed attacks.
+        
+        Listeners run inside the collision update, so they should only
+        record or trigger work and return quickly.
+        
+        Args:
+            listener (Callable): Called with the attack kind ("punch" or
+                "kick"), the attacker, the defender and the damage.
+        """
+        self.hit_listeners.append(listener)
+    
+    def _notify_hit(self, kind: str, attacker, defender, damage: int) -> None:
+        """Tell every hit listener that an attack landed."""
+        for listener in self.hit_listeners:
+            listener(kind, attacker, defender, damage)
     
     def handle_kicking_collision(self, player, villain) -> bool:
         """
@@ -42,19 +67,20 @@ class CollisionHandler:
         Returns:
             bool: True if collision occurred, False otherwise.
         """
-        if (hasattr(player, 'is_kicking') and player.is_kicking and 
+        if (self._is_kicking(player) and 
             self._rectangles_collide(player, villain)):
             
             if not villain.is_falling_down:
                 villain.is_falling_down = True
                 villain.is_hit = False
                 villain.frame_index = 0
-                self.last_fall_time = pygame.time.get_ticks()
+                self.last_fall_time = self.clock()
                 
                 # Apply damage and knockback
                 damage = 20  # Kick does more damage
                 knockback = -30 if villain.x > player.x else 30
                 villain.take_damage(damage, knockback)
+                self._notify_hit("kick", player, villain, damage)
                 
                 return True
         
@@ -74,7 +100,7 @@ class CollisionHandler:
         Returns:
             bool: True if collision occurred, False otherwise.
         """
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock()
         time_since_fall = current_time - self.last_fall_time
         
         # Check if enough time has passed since the last fall or hit
@@ -96,6 +122,7 @@ class CollisionHandler:
                     
                     knockback = -15 if villain.x > player.x else 15
                     villain.take_damage(damage, knockback)
+                    self._notify_hit("punch", player, villain, damage)
                     
                     return True
         
@@ -131,6 +158,7 @@ class CollisionHandler:
                 damage = 20
                 knockback = -30 if player.x > villain.x else 30
                 player.take_damage(damage, knockback)
+                self._notify_hit("kick", villain, player, damage)
                 
                 return True
         return False
@@ -148,6 +176,7 @@ class CollisionHandler:
                 damage = 12 if (hasattr(villain, 'is_double_punching') and villain.is_double_punching) else 8
                 knockback = -15 if player.x > villain.x else 15
                 player.take_damage(damage, knockback)
+                self._notify_hit("punch", villain, player, damage)
                 
                 return True
         return False
@@ -197,6 +226,20 @@ class CollisionHandler:
             (hasattr(player, 'is_double_punching') and player.is_double_punching)
         )
     
+    @staticmethod
+    def _is_kicking(player) -> bool:
+        """
+        Check if player is performing any kicking action.
+        
+        Args:
+            player: The player character entity.
+            
+        Returns:
+            bool: True if player is kicking or under kicking.
+        """
+        return (getattr(player, 'is_kicking', False) or 
+                getattr(player, 'is_und_kicking', False))
+    
     def reset_timers(self) -> None:
         """Reset all collision timers."""
         self.last_fall_time = 0
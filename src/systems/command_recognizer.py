@@ -0,0 +1,253 @@
+"""
+Command recognition system.
+
+This module turns a stream of key presses into named commands such as
+double taps, quarter-circle motions, charge moves and button chords.
+"""
+
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# Input symbols. Directions are relative to the way the fighter faces.
+FORWARD = "F"
+BACK = "B"
+UP = "U"
+DOWN = "D"
+PUNCH = "P"
+KICK = "K"
+BLOCK = "S"
+
+BUTTONS = frozenset((PUNCH, KICK, BLOCK))
+DIRECTIONS = frozenset((FORWARD, BACK, UP, DOWN))
+
+CHARGE_SUFFIX = "~"  # "B~" means back was held for the charge time
+
+
+def chord(*buttons: str) -> str:
+    """
+    Build the symbol for buttons pressed together.
+
+    Args:
+        *buttons (str): Button symbols.
+
+    Returns:
+        str: Chord symbol, e.g. "K+P".
+    """
+    return "+".join(sorted(buttons))
+
+
+def charged(direction: str) -> str:
+    """
+    Build the symbol for a direction held for the charge time.
+
+    Args:
+        direction (str): Direction symbol.
+
+    Returns:
+        str: Charge symbol, e.g. "B~".
+    """
+    return direction + CHARGE_SUFFIX
+
+
+class Command:
+    """
+    A named input sequence.
+
+    Attributes:
+        name (str): Command name, usually the method that performs it.
+        sequence (Tuple[str, ...]): Input symbols in order.
+        max_duration_ms (Optional[float]): Longest allowed time from the
+            first to the last input, or None for no limit.
+    """
+
+    def __init__(self, name: str, sequence: Sequence[str], max_duration_ms: Optional[float] = None):
+        """
+        Initialize a command.
+
+        Args:
+            name (str): Command name.
+            sequence (Sequence[str]): Input symbols in order.
+            max_duration_ms (Optional[float]): Longest allowed input duration.
+        """
+        if not sequence:
+            raise ValueError(f"Command '{name}' has an empty input sequence")
+        self.name = name
+        self.sequence = tuple(sequence)
+        self.max_duration_ms = max_duration_ms
+
+    def __repr__(self) -> str:
+        return f"Command({self.name!r}, {self.sequence!r})"
+
+
+class CommandRecognizer:
+    """
+    Recognizes commands over the input history with a compiled automaton.
+
+    All command sequences are compiled into one Aho-Corasick automaton whose
+    failure links are folded into a full transition table, so each input
+    symbol is a single dictionary lookup regardless of how many commands
+    are defined. When several commands end on the same input the longest
+    one wins. Inputs further apart than ``max_gap_ms`` start a new sequence.
+
+    ``press`` and ``release`` track held keys to derive two extra kinds of
+    symbol: a button pressed within ``chord_ms`` of another held button
+    produces a chord symbol in place of the second button, and a press
+    while a direction has been held for ``charge_ms`` is preceded by the
+    charge symbol for that direction.
+
+    Attributes:
+        commands (List[Command]): The compiled commands.
+        max_gap_ms (float): Longest allowed time between consecutive inputs.
+        charge_ms (float): Hold time that charges a direction.
+        chord_ms (float): Window for pressing buttons together.
+    """
+
+    def __init__(self, commands: Sequence[Command], max_gap_ms: float = 300,
+                 charge_ms: float = 800, chord_ms: float = 50):
+        """
+        Initialize and compile the recognizer.
+
+        Args:
+            commands (Sequence[Command]): Commands to recognize.
+            max_gap_ms (float): Longest allowed time between consecutive inputs.
+            charge_ms (float): Hold time that charges a direction.
+            chord_ms (float): Window for pressing buttons together.
+        """
+        self.commands = list(commands)
+        self.max_gap_ms = max_gap_ms
+        self.charge_ms = charge_ms
+        self.chord_ms = chord_ms
+
+        self._transitions: List[Dict[str, int]] = []
+        self._outputs: List[List[Command]] = []
+        self._compile()
+
+        depth = max((len(command.sequence) for command in self.commands), default=1)
+        self._times: deque = deque(maxlen=depth)
+        self._state = 0
+        self._last_time: Optional[float] = None
+        self._held: Dict[str, float] = {}
+
+    def _compile(self) -> None:
+        """Build the trie, failure links and full transition table."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[Command]] = [[]]
+        alphabet = set()
+
+        for command in self.commands:
+            state = 0
+            for symbol in command.sequence:
+                alphabet.add(symbol)
+                if symbol not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][symbol] = len(goto) - 1
+                state = goto[state][symbol]
+            outputs[state].append(command)
+
+        # Breadth-first pass: inherit outputs along failure links and fill
+        # in every missing transition so matching never follows a link
+        fail = [0] * len(goto)
+        transitions: List[Dict[str, int]] = [dict() for _ in goto]
+        queue = deque()
+        for symbol in alphabet:
+            target = goto[0].get(symbol, 0)
+            transitions[0][symbol] = target
+            if target:
+                queue.append(target)
+
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for symbol in alphabet:
+                target = goto[state].get(symbol)
+                if target is None:
+                    transitions[state][symbol] = transitions[fail[state]][symbol]
+                else:
+                    fail[target] = transitions[fail[state]][symbol]
+                    transitions[state][symbol] = target
+                    queue.append(target)
+
+        for state_outputs in outputs:
+            state_outputs.sort(key=lambda command: len(command.sequence), reverse=True)
+
+        self._transitions = transitions
+        self._outputs = outputs
+
+    def reset(self) -> None:
+        """Forget the input history and held keys."""
+        self._state = 0
+        self._last_time = None
+        self._times.clear()
+        self._held.clear()
+
+    def feed(self, symbol: str, time_ms: float) -> Optional[Command]:
+        """
+        Advance the automaton by one input symbol.
+
+        Args:
+            symbol (str): Input symbol.
+            time_ms (float): Time of the input in milliseconds.
+
+        Returns:
+            Optional[Command]: The longest command completed by this input.
+        """
+        if self._last_time is not None and time_ms - self._last_time > self.max_gap_ms:
+            self._state = 0
+            self._times.clear()
+        self._last_time = time_ms
+        self._times.append(time_ms)
+
+        # Symbols no command uses return to the start state
+        self._state = self._transitions[self._state].get(symbol, 0)
+
+        for command in self._outputs[self._state]:
+            length = len(command.sequence)
+            if command.max_duration_ms is not None and \
+                    time_ms - self._times[-length] > command.max_duration_ms:
+                continue
+            if length > 1:
+                # A completed motion consumes its inputs
+                self._state = 0
+                self._times.clear()
+            return command
+        return None
+
+    def press(self, symbol: str, time_ms: float) -> Optional[Command]:
+        """
+        Register a key press, deriving charge and chord symbols.
+
+        Args:
+            symbol (str): Input symbol of the pressed key.
+            time_ms (float): Time of the press in milliseconds.
+
+        Returns:
+            Optional[Command]: The command completed by this press, if any.
+        """
+        result = None
+        for held_symbol, since in list(self._held.items()):
+            if held_symbol in DIRECTIONS and held_symbol != symbol and \
+                    time_ms - since >= self.charge_ms:
+                # Charge is spent once used
+                self._held[held_symbol] = time_ms
+                result = self.feed(charged(held_symbol), time_ms) or result
+
+        fed = symbol
+        if symbol in BUTTONS:
+            partners = [held for held, since in self._held.items()
+                        if held in BUTTONS and time_ms - since <= self.chord_ms]
+            if partners:
+                fed = chord(symbol, *partners)
+
+        self._held[symbol] = time_ms
+        return self.feed(fed, time_ms) or result
+
+    def release(self, symbol: str) -> None:
+        """
+        Register a key release.
+
+        Args:
+            symbol (str): Input symbol of the released key.
+        """
+        self._held.pop(symbol, None)
@@ -0,0 +1,171 @@
+"""
+Input handling system.
+
+This module buffers keyboard events with timestamps, hands them to the
+simulation once per tick, and measures how long each key press takes to
+reach the screen. Events may be recorded on one thread and sampled on
+another.
+"""
+
+import threading
+import time
+from array import array
+from typing import List, Optional, Set, Tuple
+
+
+class InputHandler:
+    """
+    Timestamped input ring buffer with input-to-display latency tracking.
+
+    The event loop calls ``record`` for every key event as soon as it is
+    pumped from SDL. The game calls ``sample`` once per simulation tick,
+    right before updating, to take every event recorded since the previous
+    tick. After the frame that reflects those events is presented,
+    ``mark_presented`` turns each consumed key press into a latency sample.
+
+    Timestamps are taken when the event is pumped, so time the event spent
+    in SDL's queue before the pump is not included.
+
+    When the simulation runs on its own thread, the frame presented may be
+    older than the last tick; ``mark_presented`` then takes the number of
+    samples the frame reflects, and key presses from later samples keep
+    waiting. Recording, sampling and presenting hold a lock, so they can be
+    called from different threads.
+
+    Attributes:
+        capacity (int): Number of events kept in the ring buffer.
+        held (Set[int]): Key codes currently held down.
+        dropped_events (int): Events overwritten before they were sampled.
+        samples (int): Number of ``sample`` calls so far.
+    """
+
+    def __init__(self, capacity: int = 256, latency_capacity: int = 512):
+        """
+        Initialize the input handler.
+
+        Args:
+            capacity (int): Number of events kept in the ring buffer.
+            latency_capacity (int): Number of latency samples kept.
+        """
+        self.capacity = capacity
+        self.held: Set[int] = set()
+        self.dropped_events = 0
+        self.samples = 0
+        self._lock = threading.Lock()
+
+        self._times = array("d", [0.0]) * capacity
+        self._keys = array("l", [0]) * capacity
+        self._pressed = array("b", [0]) * capacity
+        self._write = 0  # total events recorded
+        self._read = 0  # total events sampled
+
+        self._awaiting_present: List[Tuple[int, float]] = []  # (sample, press time)
+        self._latency_capacity = latency_capacity
+        self._latencies = array("d", [0.0]) * latency_capacity
+        self._latency_count = 0
+
+    def record(self, key: int, pressed: bool, timestamp: Optional[float] = None) -> None:
+        """
+        Record a key event.
+
+        Args:
+            key (int): Key code.
+            pressed (bool): True for key down, False for key up.
+            timestamp (Optional[float]): ``time.perf_counter()`` time of the event; now if omitted.
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        with self._lock:
+            slot = self._write % self.capacity
+            self._times[slot] = timestamp
+            self._keys[slot] = key
+            self._pressed[slot] = pressed
+            self._write += 1
+
+            if self._write - self._read > self.capacity:
+                self.dropped_events += self._write - self._read - self.capacity
+                self._read = self._write - self.capacity
+
+    def release_all(self) -> None:
+        """Record a key up for every held key, e.g. when focus is lost."""
+        with self._lock:
+            keys = list(self.held)
+        for key in keys:
+            self.record(key, False)
+
+    def sample(self) -> List[Tuple[int, bool, float]]:
+        """
+        Take every event recorded since the previous sample.
+
+        Updates ``held`` and queues key presses for latency measurement.
+
+        Returns:
+            List[Tuple[int, bool, float]]: (key, pressed, timestamp) tuples, oldest first.
+        """
+        events = []
+        with self._lock:
+            self.samples += 1
+            for index in range(self._read, self._write):
+                slot = index % self.capacity
+                key = self._keys[slot]
+                pressed = bool(self._pressed[slot])
+                if pressed:
+                    self.held.add(key)
+                    self._awaiting_present.append((self.samples, self._times[slot]))
+                else:
+                    self.held.discard(key)
+                events.append((key, pressed, self._times[slot]))
+            self._read = self._write
+        return events
+
+    def is_held(self, key: int) -> bool:
+        """
+        Check whether a key is held as of the last sample.
+
+        Args:
+            key (int): Key code.
+
+        Returns:
+            bool: True if the key is held down.
+        """
+        return key in self.held
+
+    def mark_presented(self, timestamp: Optional[float] = None, samples: Optional[int] = None) -> None:
+        """
+        Record latencies for key presses whose tick has now been displayed.
+
+        Args:
+            timestamp (Optional[float]): ``time.perf_counter()`` time of the flip; now if omitted.
+            samples (Optional[int]): Samples reflected in the displayed frame; all if omitted.
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        with self._lock:
+            if not self._awaiting_present:
+                return
+            if samples is None:
+                samples = self.samples
+            waiting = []
+            for sample, pressed_at in self._awaiting_present:
+                if sample > samples:
+                    waiting.append((sample, pressed_at))
+                    continue
+                self._latencies[self._latency_count % self._latency_capacity] = timestamp - pressed_at
+                self._latency_count += 1
+            self._awaiting_present = waiting
+
+    def latency_percentiles(self) -> Tuple[float, float]:
+        """
+        Get input-to-display latency percentiles over recent key presses.
+
+        Returns:
+            Tuple[float, float]: p50 and p99 latency in milliseconds.
+        """
+        count = min(self._latency_count, self._latency_capacity)
+        if count == 0:
+            return (0.0, 0.0)
+        values = sorted(self._latencies[i] for i in range(count))
+        last = count - 1
+        return tuple(values[min(last, int(q * count))] * 1000 for q in (0.50, 0.99))
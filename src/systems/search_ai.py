@@ -0,0 +1,253 @@
+"""
+Look-ahead search AI.
+
+This module runs Monte Carlo rollouts of short fight futures in a worker
+process to pick the villain's next action, using the same movement,
+animation and collision rules as the game.
+"""
+
+import math
+import multiprocessing
+import queue
+import random
+import time
+from typing import Dict, NamedTuple, Optional
+
+from src.entities.main_character import MainCharacter
+from src.entities.villain import Villain
+from src.systems.collision_handler import CollisionHandler
+
+
+class SearchResult(NamedTuple):
+    """Outcome of one search request."""
+    request_id: int
+    action: str
+    values: Dict[str, float]
+    rollouts: int
+    rollouts_per_second: float
+
+
+class RolloutSimulator:
+    """
+    Simulates short fight futures from character snapshots.
+
+    Holds one player, one villain and one collision handler that are reset
+    from snapshots before every rollout, so no entities or sprites are
+    created during the search. Collision cooldowns run on a simulated clock.
+
+    Attributes:
+        horizon_ticks (int): Ticks simulated per rollout.
+        tick_ms (float): Simulated milliseconds per tick.
+    """
+
+    def __init__(self, horizon_ticks: int = 45, tick_rate: int = 30, policy_interval: int = 6):
+        """
+        Initialize the simulator.
+
+        Args:
+            horizon_ticks (int): Ticks simulated per rollout.
+            tick_rate (int): Simulation ticks per second.
+            policy_interval (int): Ticks between random policy decisions.
+        """
+        self.horizon_ticks = horizon_ticks
+        self.tick_ms = 1000 / tick_rate
+        self.policy_interval = policy_interval
+
+        self._now = 0.0
+        self.player = MainCharacter(0, 0)
+        self.villain = Villain(0, 0)
+        self.collision_handler = CollisionHandler(clock=lambda: int(self._now))
+
+    def rollout(self, player_state: Dict[str, object], villain_state: Dict[str, object],
+                player_max_x: Optional[float], action: str) -> float:
+        """
+        Simulate one future after the villain takes an action.
+
+        Args:
+            player_state (Dict[str, object]): Player snapshot.
+            villain_state (Dict[str, object]): Villain snapshot.
+            player_max_x (Optional[float]): Player's right boundary.
+            action (str): Villain action to evaluate.
+
+        Returns:
+            float: Damage dealt to the player minus damage taken.
+        """
+        player, villain = self.player, self.villain
+        player.restore(player_state)
+        villain.restore(villain_state)
+        player.MAX_X = player_max_x
+
+        # Start past any cooldown so the first hit in the future can land
+        self.collision_handler.reset_timers()
+        self._now = self.collision_handler.collision_cooldown + 1
+
+        player_health, villain_health = player.health, villain.health
+        villain.perform_action(action)
+
+        for tick in range(self.horizon_ticks):
+            if tick % self.policy_interval == 0:
+                player.perform_action(random.choice(MainCharacter.ACTIONS), villain.x)
+                if tick and not villain.is_busy():
+                    villain.perform_action(random.choice(Villain.ACTIONS))
+
+            player.update_position()
+            villain.update_position(player.x)
+            player.update_frame(villain.x)
+            villain.update_frame(player.x)
+            self.collision_handler.update(player, villain)
+            self._now += self.tick_ms
+
+            if player.health <= 0 or villain.health <= 0:
+                break
+
+        return (player_health - player.health) - (villain_health - villain.health)
+
+
+def search(simulator: RolloutSimulator, request: tuple, think_ms: float) -> SearchResult:
+    """
+    Pick the best villain action by UCB1 over Monte Carlo rollouts.
+
+    Args:
+        simulator (RolloutSimulator): Simulator to run rollouts on.
+        request (tuple): (request_id, player_state, villain_state, player_max_x).
+        think_ms (float): Time to search for.
+
+    Returns:
+        SearchResult: The best action and search statistics.
+    """
+    request_id, player_state, villain_state, player_max_x = request
+    visits = {action: 0 for action in Villain.ACTIONS}
+    totals = {action: 0.0 for action in Villain.ACTIONS}
+
+    start = time.perf_counter()
+    deadline = start + think_ms / 1000
+    rollouts = 0
+    while time.perf_counter() < deadline:
+        if rollouts < len(Villain.ACTIONS):
+            action = Villain.ACTIONS[rollouts]
+        else:
+            log_n = math.log(rollouts)
+            # Rewards are in health points, so explore on that scale
+            action = max(visits, key=lambda a: totals[a] / visits[a] + 20 * math.sqrt(log_n / visits[a]))
+
+        totals[action] += simulator.rollout(player_state, villain_state, player_max_x, action)
+        visits[action] += 1
+        rollouts += 1
+
+    elapsed = time.perf_counter() - start
+    values = {action: totals[action] / visits[action] for action in visits if visits[action]}
+    best = max(values, key=values.get) if values else "IDLE"
+    return SearchResult(request_id, best, values, rollouts, rollouts / elapsed if elapsed else 0.0)
+
+
+def run_search_worker(requests, results, horizon_ticks: int, tick_rate: int,
+                      think_ms: float, seed: Optional[int]) -> None:
+    """
+    Worker process loop: answer the newest request, skipping stale ones.
+
+    Args:
+        requests: Queue of search requests; None stops the worker.
+        results: Queue search results are put on.
+        horizon_ticks (int): Ticks simulated per rollout.
+        tick_rate (int): Simulation ticks per second.
+        think_ms (float): Time to search per request.
+        seed (Optional[int]): Random seed for the rollout policy.
+    """
+    random.seed(seed)
+    simulator = RolloutSimulator(horizon_ticks, tick_rate)
+
+    while True:
+        request = requests.get()
+        try:
+            while request is not None:
+                request = requests.get_nowait()
+        except queue.Empty:
+            pass
+        if request is None:
+            return
+        results.put(search(simulator, request, think_ms))
+
+
+class SearchAI:
+    """
+    Client for the look-ahead search worker process.
+
+    ``submit`` and ``poll`` never block: requests are queued for the worker,
+    which always searches the newest one, and results are collected when
+    they are ready. At most one request is in flight at a time.
+
+    Attributes:
+        latest (Optional[SearchResult]): Most recent result received.
+        rollouts_per_second (float): Worker throughput from the last result.
+        in_flight (bool): Whether a request is awaiting its result.
+    """
+
+    def __init__(self, horizon_ticks: int = 45, tick_rate: int = 30,
+                 think_ms: float = 60, seed: Optional[int] = None):
+        """
+        Start the search worker process.
+
+        Args:
+            horizon_ticks (int): Ticks simulated per rollout.
+            tick_rate (int): Simulation ticks per second.
+            think_ms (float): Time the worker searches per request.
+            seed (Optional[int]): Random seed for the rollout policy.
+        """
+        # Spawn rather than fork so the worker does not inherit SDL state
+        context = multiprocessing.get_context("spawn")
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        self._process = context.Process(
+            target=run_search_worker,
+            args=(self._requests, self._results, horizon_ticks, tick_rate, think_ms, seed),
+            name="search-ai",
+            daemon=True,
+        )
+        self._process.start()
+
+        self._next_request_id = 0
+        self.latest: Optional[SearchResult] = None
+        self.rollouts_per_second = 0.0
+        self.in_flight = False
+
+    def submit(self, player, villain) -> None:
+        """
+        Queue a search from the current fight state.
+
+        Args:
+            player: The player entity.
+            villain: The villain entity.
+        """
+        self._requests.put(
+            (self._next_request_id, player.snapshot(), villain.snapshot(), player.MAX_X)
+        )
+        self._next_request_id += 1
+        self.in_flight = True
+
+    def poll(self) -> Optional[SearchResult]:
+        """
+        Collect the newest finished result, if any.
+
+        Returns:
+            Optional[SearchResult]: A result received since the last poll.
+        """
+        result = None
+        try:
+            while True:
+                result = self._results.get_nowait()
+        except queue.Empty:
+            pass
+
+        if result is not None:
+            self.latest = result
+            self.rollouts_per_second = result.rollouts_per_second
+            self.in_flight = result.request_id < self._next_request_id - 1
+        return result
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        if self._process.is_alive():
+            self._requests.put(None)
+            self._process.join(timeout=1)
+            if self._process.is_alive():
+                self._process.terminate()
@@ -0,0 +1,289 @@
+"""
+Stage management system.
+
+This module keeps the stage backgrounds used between rounds, scaling and
+converting each one once and decoding the next stage on a worker thread
+while the current round is played. Backgrounds are stored as a grid of
+tiles so only the part under the camera is drawn.
+"""
+
+import os
+import pygame
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from src.utils import image_cache
+
+
+class Stage:
+    """
+    A single fighting stage.
+
+    Attributes:
+        name (str): Display name derived from the image file name.
+        image_path (str): Path to the background image.
+        available (bool): False once the image failed to load.
+    """
+
+    def __init__(self, image_path: str):
+        """
+        Initialize a stage.
+
+        Args:
+            image_path (str): Path to the background image.
+        """
+        self.image_path = image_path
+        self.name = os.path.splitext(os.path.basename(image_path))[0]
+        self.available = True
+
+
+class TiledBackground:
+    """
+    A stage background split into a grid of converted tiles.
+
+    Drawing looks up the tiles under the view by index, so the cost depends
+    on the view size, not on the stage size.
+
+    Attributes:
+        size (Tuple[int, int]): Full background size.
+        tile_size (int): Width and height of a tile (edge tiles may be smaller).
+        tiles (List[List[pygame.Surface]]): Tiles by row, then column.
+    """
+
+    def __init__(self, surface: pygame.Surface, tile_size: int):
+        """
+        Split a background into tiles.
+
+        Args:
+            surface (pygame.Surface): The full background, already converted.
+            tile_size (int): Width and height of a tile.
+        """
+        self.size = surface.get_size()
+        self.tile_size = tile_size
+        width, height = self.size
+        self.tiles = [
+            [surface.subsurface((x, y, min(tile_size, width - x), min(tile_size, height - y))).copy()
+             for x in range(0, width, tile_size)]
+            for y in range(0, height, tile_size)
+        ]
+
+    def get_width(self) -> int:
+        """Full background width."""
+        return self.size[0]
+
+    def get_height(self) -> int:
+        """Full background height."""
+        return self.size[1]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of pixel data held by the tiles."""
+        return sum(tile.get_pitch() * tile.get_height() for row in self.tiles for tile in row)
+
+    def visible(self, view: pygame.Rect):
+        """
+        Yield the tiles that intersect a view rectangle.
+
+        Args:
+            view (pygame.Rect): Area of the background being shown.
+
+        Yields:
+            Tuple[pygame.Surface, int, int]: Each tile with its position on the background.
+        """
+        size = self.tile_size
+        first_col = max(0, view.left // size)
+        last_col = min(len(self.tiles[0]) - 1, (view.right - 1) // size)
+        first_row = max(0, view.top // size)
+        last_row = min(len(self.tiles) - 1, (view.bottom - 1) // size)
+        for row in range(first_row, last_row + 1):
+            tiles = self.tiles[row]
+            for col in range(first_col, last_col + 1):
+                yield tiles[col], col * size, row * size
+
+
+class StageManager:
+    """
+    Holds several stages and streams their backgrounds in the background.
+
+    Decoding, scaling, converting and splitting into tiles all run on a
+    single worker thread. Converting targets a 1x1 surface created in the
+    display's pixel format when the manager is built, on the main thread,
+    so the worker never touches the display surface; ``poll`` and
+    ``select`` only move finished backgrounds into the cache and are safe
+    to call from a simulation thread. Decoded backgrounds are kept in an
+    LRU cache that is trimmed to the memory budget, never evicting the
+    current or the prefetched stage.
+
+    Images are scaled to the stage height. An image that would then be
+    narrower than the stage is repeated across it, every other copy
+    mirrored so the seams match; otherwise it is scaled to the stage size.
+
+    Attributes:
+        stages (List[Stage]): All registered stages in play order.
+        size (Tuple[int, int]): Size every background is scaled to.
+        tile_size (int): Size of the tiles backgrounds are split into.
+        memory_budget (int): Maximum bytes of cached background pixels.
+        current_index (int): Index of the stage currently shown.
+    """
+
+    def __init__(self, image_paths: List[str], size: Tuple[int, int], memory_budget: int,
+                 tile_size: int = 256):
+        """
+        Initialize the stage manager.
+
+        Args:
+            image_paths (List[str]): Background image paths in play order.
+            size (Tuple[int, int]): Size to scale each background to.
+            memory_budget (int): Maximum bytes of cached background pixels.
+            tile_size (int): Size of the tiles backgrounds are split into.
+        """
+        self.stages = [Stage(path) for path in image_paths]
+        self.size = size
+        self.tile_size = tile_size
+        self.memory_budget = memory_budget
+        self.current_index = 0
+
+        self._cache: "OrderedDict[int, TiledBackground]" = OrderedDict()
+        self._pending: Dict[int, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stage-loader")
+        # Pixel format backgrounds are converted to; None leaves them as decoded
+        display = pygame.display.get_surface()
+        self._pixel_format = pygame.Surface((1, 1), 0, display) if display is not None else None
+
+    @property
+    def current_background(self) -> Optional[TiledBackground]:
+        """Background surface of the current stage, or None if unavailable."""
+        return self._cache.get(self.current_index)
+
+    @property
+    def cached_bytes(self) -> int:
+        """Total pixel bytes held by cached backgrounds."""
+        return sum(background.nbytes for background in self._cache.values())
+
+    def select(self, index: int) -> Optional[TiledBackground]:
+        """
+        Switch to a stage and start prefetching the one after it.
+
+        The stage is normally already cached by the prefetch started on the
+        previous switch, so this returns without decoding anything.
+
+        Args:
+            index (int): Stage index; wraps around the number of stages.
+
+        Returns:
+            Optional[TiledBackground]: The stage background, or None.
+        """
+        if not self.stages:
+            return None
+
+        index = index % len(self.stages)
+        for _ in range(len(self.stages)):
+            index = self._next_available(index)
+            if index not in self._cache:
+                self._collect(index, wait=True)
+            if index in self._cache or not self.stages[index].available:
+                break
+
+        self.current_index = index
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            self._evict(keep=index)
+
+        self.prefetch(index + 1)
+        return self.current_background
+
+    def prefetch(self, index: int) -> None:
+        """
+        Start decoding a stage on the worker thread.
+
+        Args:
+            index (int): Stage index; wraps around the number of stages.
+        """
+        if not self.stages:
+            return
+
+        index = index % len(self.stages)
+        if index in self._cache or index in self._pending or not self.stages[index].available:
+            return
+
+        self._pending[index] = self._submit(index)
+
+    def poll(self) -> None:
+        """Move finished prefetches into the cache. Call once per frame."""
+        for index in [i for i, future in self._pending.items() if future.done()]:
+            self._collect(index, wait=False)
+
+    def shutdown(self) -> None:
+        """Stop the worker thread and drop all cached backgrounds."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False)
+        self._cache.clear()
+
+    def _collect(self, index: int, wait: bool) -> None:
+        """Finish loading a stage and cache the result."""
+        future = self._pending.pop(index, None)
+        if future is None:
+            if not wait:
+                return
+            future = self._submit(index)
+
+        try:
+            self._cache[index] = future.result()
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Warning: Could not load stage '{self.stages[index].name}': {e}")
+            self.stages[index].available = False
+            return
+        self._evict(keep=index)
+
+    def _submit(self, index: int) -> Future:
+        """Start loading a stage on the worker thread."""
+        stage = self.stages[index]
+        return self._executor.submit(self._decode, stage.image_path, self.size, self.tile_size,
+                                     self._pixel_format)
+
+    def _evict(self, keep: int) -> None:
+        """
+        Drop least recently used backgrounds until within the memory budget.
+
+        Args:
+            keep (int): Stage just loaded; never dropped, since ``select`` may
+                be about to switch to it.
+        """
+        protected = {keep, self.current_index, (self.current_index + 1) % len(self.stages)}
+        for index in list(self._cache):
+            if self.cached_bytes <= self.memory_budget:
+                break
+            if index not in protected:
+                del self._cache[index]
+
+    def _next_available(self, index: int) -> int:
+        """Return the first available stage index at or after ``index``."""
+        for offset in range(len(self.stages)):
+            candidate = (index + offset) % len(self.stages)
+            if self.stages[candidate].available:
+                return candidate
+        return index
+
+    @staticmethod
+    def _decode(image_path: str, size: Tuple[int, int], tile_size: int,
+                pixel_format: Optional[pygame.Surface]) -> TiledBackground:
+        """Load, scale, convert and tile a background image. Runs on the worker thread."""
+        image = image_cache.load(image_path)
+        width, height = size
+        scaled_width = max(1, round(image.get_width() * height / image.get_height()))
+        if scaled_width >= width:
+            background = pygame.transform.scale(image, size)
+        else:
+            # Repeat across the stage, mirroring every other copy
+            image = pygame.transform.scale(image, (scaled_width, height))
+            copies = (image, pygame.transform.flip(image, True, False))
+            background = pygame.Surface(size)
+            for count, x in enumerate(range(0, width, scaled_width)):
+                background.blit(copies[count % 2], (x, 0))
+
+        if pixel_format is not None:
+            background = background.convert(pixel_format)
+        return TiledBackground(background, tile_size)
@@ -0,0 +1,146 @@
+"""
+Combat telemetry system.
+
+This module records structured combat events from the frame loop and
+writes them to a size-rotated JSONL log on a background thread.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+
+class Telemetry:
+    """
+    Buffered, asynchronous event log.
+
+    ``record`` only appends a tuple to a ``collections.deque``, whose
+    ``append`` and ``popleft`` are atomic, so the frame loop never takes a
+    lock or touches the file. A writer thread wakes every
+    ``flush_interval`` seconds, drains the queue, serializes the batch as
+    compact JSON lines and writes it with a single call. When the log grows
+    past ``max_bytes`` it is rotated to ``<path>.1``, ``<path>.2`` and so on,
+    keeping ``backups`` old files.
+
+    If the queue already holds ``capacity`` events, new events are counted
+    in ``dropped`` and discarded rather than blocking the game.
+
+    Attributes:
+        path (Optional[str]): Log file path; None disables telemetry.
+        recorded (int): Events queued.
+        written (int): Events written to disk.
+        dropped (int): Events discarded because the queue was full.
+    """
+
+    def __init__(self, path: Optional[str], max_bytes: int = 1024 * 1024, backups: int = 3,
+                 flush_interval: float = 0.5, capacity: int = 65536):
+        """
+        Open the log and start the writer thread.
+
+        Args:
+            path (Optional[str]): Log file path; None disables telemetry.
+            max_bytes (int): Size at which the log is rotated.
+            backups (int): Number of rotated files kept.
+            flush_interval (float): Seconds between writer batches.
+            capacity (int): Most events queued at once.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self.capacity = capacity
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+
+        self._queue: deque = deque()
+        self._stop = threading.Event()
+        self._file = None
+        self._thread = None
+
+        if path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._file = open(path, "a", encoding="utf-8")
+        except OSError as e:
+            print(f"Warning: Could not open telemetry log {path}: {e}")
+            self.path = None
+            return
+
+        self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether events are being logged."""
+        return self.path is not None
+
+    def record(self, event: str, tick: int, **fields) -> None:
+        """
+        Queue an event for the writer thread.
+
+        Args:
+            event (str): Event type, e.g. "hit".
+            tick (int): Simulation tick the event happened on.
+            **fields: JSON-serializable event data.
+        """
+        if self.path is None:
+            return
+        if len(self._queue) >= self.capacity:
+            self.dropped += 1
+            return
+        self._queue.append((event, tick, time.time(), fields))
+        self.recorded += 1
+
+    def _run(self) -> None:
+        """Writer thread loop."""
+        while not self._stop.wait(self.flush_interval):
+            self._flush()
+        self._flush()
+
+    def _flush(self) -> None:
+        """Write every queued event in one batch, rotating if needed."""
+        queue = self._queue
+        lines = []
+        while queue:
+            event, tick, timestamp, fields = queue.popleft()
+            record = {"event": event, "tick": tick, "time": round(timestamp, 4)}
+            record.update(fields)
+            lines.append(json.dumps(record, separators=(",", ":")))
+        if not lines:
+            return
+
+        try:
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+            self.written += len(lines)
+            if self._file.tell() >= self.max_bytes:
+                self._rotate()
+        except OSError as e:
+            print(f"Warning: Could not write telemetry log {self.path}: {e}")
+
+    def _rotate(self) -> None:
+        """Shift ``path.N`` to ``path.N+1`` and start a new log."""
+        self._file.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        """Write any queued events and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._file.close()
@@ -0,0 +1,180 @@
+"""
+Frame pacing.
+
+This module keeps the simulation at a fixed tick rate under load by
+running extra updates in place of renders, waits out the rest of each
+frame with the chosen pacing method, and lowers render quality when the
+frame budget keeps being missed.
+"""
+
+import time
+from collections import deque
+from typing import Dict
+
+import pygame
+
+
+PACING_MODES = ("tick", "busy", "vsync")
+
+
+class FramePacer:
+    """
+    Fixed-rate simulation scheduler with render frame-skip.
+
+    Every simulation tick has a deadline ``1 / fps`` seconds after the
+    previous one. At the start of a frame ``ticks_due`` returns how many
+    deadlines have passed, and the game runs that many updates before
+    rendering once, so when a frame overruns, the renders in between are
+    skipped while the simulation keeps its rate. At most
+    ``max_frame_skip`` renders are skipped in a row; ticks beyond that are
+    dropped and the schedule restarts from now, so a long stall slows the
+    game down briefly instead of running a burst of catch-up updates.
+
+    Pacing modes:
+        "tick": ``Clock.tick``; sleeps, cheap on the CPU but only
+            millisecond-accurate.
+        "busy": ``Clock.tick_busy_loop``; spins for exact frame times.
+        "vsync": No waiting; presenting the frame blocks on the display
+            refresh, and frames with no tick due only re-render.
+
+    With dynamic quality on, a frame counts as missed when its update and
+    render work alone takes longer than the frame budget. When
+    ``miss_limit`` of the last ``window`` frames miss, ``high_quality``
+    turns off so the game can skip costly effects; it turns back on after
+    ``window`` frames in a row make the budget.
+
+    Attributes:
+        mode (str): One of ``PACING_MODES``.
+        fps (int): Simulation ticks per second.
+        max_frame_skip (int): Most renders skipped in a row.
+        high_quality (bool): Whether costly effects should be drawn.
+        ticks (int): Simulation ticks run.
+        rendered (int): Frames rendered.
+        skipped (int): Renders skipped to keep the simulation rate.
+        late (int): Frames whose work overran the budget.
+        dropped (int): Ticks given up when more than ``max_frame_skip``
+            renders would have been skipped.
+        quality_changes (int): Times ``high_quality`` flipped.
+    """
+
+    def __init__(self, fps: int, mode: str = "tick", max_frame_skip: int = 2,
+                 dynamic_quality: bool = True, miss_limit: int = 10, window: int = 60):
+        """
+        Initialize the pacer.
+
+        Args:
+            fps (int): Simulation ticks per second.
+            mode (str): "tick", "busy" or "vsync".
+            max_frame_skip (int): Most renders skipped in a row.
+            dynamic_quality (bool): Lower quality when frames keep missing the budget.
+            miss_limit (int): Missed frames within ``window`` that lower quality.
+            window (int): Frames the miss count covers.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in PACING_MODES:
+            raise ValueError(f"Unknown frame pacing mode: {mode}")
+        self.mode = mode
+        self.fps = fps
+        self.frame_time = 1.0 / fps
+        self.max_frame_skip = max_frame_skip
+        self.dynamic_quality = dynamic_quality
+        self.miss_limit = miss_limit
+        self.window = window
+
+        self.clock = pygame.time.Clock()
+        self.high_quality = True
+        self.ticks = 0
+        self.rendered = 0
+        self.skipped = 0
+        self.late = 0
+        self.dropped = 0
+        self.quality_changes = 0
+
+        self._next_tick = None
+        self._frame_start = 0.0
+        self._misses: deque = deque(maxlen=window)
+
+    def ticks_due(self) -> int:
+        """
+        Start a frame and count the simulation ticks to run in it.
+
+        Returns:
+            int: Updates to run before rendering, from 0 (vsync mode only)
+            to ``max_frame_skip + 1``.
+        """
+        now = time.perf_counter()
+        self._frame_start = now
+        if self._next_tick is None or (now < self._next_tick and self.mode != "vsync"):
+            # First frame, or the clock woke a little early: tick now
+            self._next_tick = now
+        if now < self._next_tick:
+            return 0
+
+        due = int((now - self._next_tick) / self.frame_time) + 1
+        limit = self.max_frame_skip + 1
+        if due > limit:
+            self.dropped += due - limit
+            due = limit
+            self._next_tick = now + self.frame_time
+        else:
+            self._next_tick += due * self.frame_time
+        self.ticks += due
+        self.skipped += due - 1
+        return due
+
+    def wait(self, rendered: bool = True) -> None:
+        """
+        End a frame: update the statistics and wait for the next one.
+
+        Args:
+            rendered (bool): Whether a frame was rendered.
+        """
+        if rendered:
+            self.rendered += 1
+        missed = time.perf_counter() - self._frame_start > self.frame_time
+        if missed:
+            self.late += 1
+        if self.dynamic_quality:
+            self._adjust_quality(missed)
+
+        if self.mode == "tick":
+            self.clock.tick(self.fps)
+        elif self.mode == "busy":
+            self.clock.tick_busy_loop(self.fps)
+        else:
+            self.clock.tick()
+
+    def _adjust_quality(self, missed: bool) -> None:
+        """Lower or restore quality from the recent miss history."""
+        misses = self._misses
+        misses.append(missed)
+        if self.high_quality and sum(misses) >= self.miss_limit:
+            self.high_quality = False
+        elif not self.high_quality and len(misses) == self.window and not any(misses):
+            self.high_quality = True
+        else:
+            return
+        self.quality_changes += 1
+        misses.clear()
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Get pacing statistics.
+
+        Returns:
+            Dict[str, object]: Tick, render, skip, late and drop counters,
+            the current quality and the measured frame rate.
+        """
+        return {
+            "mode": self.mode,
+            "ticks": self.ticks,
+            "rendered": self.rendered,
+            "skipped": self.skipped,
+            "late": self.late,
+            "dropped": self.dropped,
+            "high_quality": self.high_quality,
+            "quality_changes": self.quality_changes,
+            "fps": self.clock.get_fps(),
+        }
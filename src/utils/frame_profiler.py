@@ -0,0 +1,207 @@
+"""
+Frame-time profiler.
+
+This module records per-phase timings of the game loop into a fixed-size
+ring buffer and draws them as an in-game overlay with rolling percentiles
+and a frame-time graph.
+"""
+
+import csv
+import time
+import pygame
+from array import array
+from typing import Dict, List, Tuple
+
+
+class FrameProfiler:
+    """
+    Per-phase frame timer backed by a ring buffer.
+
+    The game loop calls ``begin_frame`` once, ``mark(phase)`` after each
+    phase and ``end_frame`` at the end of the frame. Each mark charges the
+    time since the previous mark to the named phase. While disabled every
+    call returns immediately, so leaving the calls in the loop costs only a
+    method call per phase.
+
+    Attributes:
+        PHASES (Tuple[str, ...]): Phase names in loop order.
+        enabled (bool): Whether timings are being recorded and drawn.
+        capacity (int): Number of frames kept in the ring buffer.
+    """
+
+    PHASES = ("events", "physics", "animation", "collision", "state", "render", "flip")
+
+    # Frames between percentile refreshes while the overlay is shown
+    STATS_INTERVAL = 15
+
+    def __init__(self, capacity: int = 300):
+        """
+        Initialize the profiler.
+
+        Args:
+            capacity (int): Number of frames kept in the ring buffer.
+        """
+        self.enabled = False
+        self.capacity = capacity
+
+        self._phase_index: Dict[str, int] = {name: i for i, name in enumerate(self.PHASES)}
+        self._samples: List[array] = [array("d", [0.0]) * capacity for _ in self.PHASES]
+        self._totals = array("d", [0.0]) * capacity
+        self._current = [0.0] * len(self.PHASES)
+        self._frame_start = 0.0
+        self._last_mark = 0.0
+        self._head = 0
+        self._count = 0
+
+        self._stats: Dict[str, Tuple[float, float, float]] = {}
+        self._frames_since_stats = 0
+        self._font = None
+
+    def toggle(self) -> None:
+        """Turn recording and the overlay on or off, clearing old samples."""
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.reset()
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        self._head = 0
+        self._count = 0
+        self._stats = {}
+        self._frames_since_stats = self.STATS_INTERVAL
+
+    def begin_frame(self) -> None:
+        """Start timing a new frame."""
+        if not self.enabled:
+            return
+        self._frame_start = self._last_mark = time.perf_counter()
+        for i in range(len(self._current)):
+            self._current[i] = 0.0
+
+    def mark(self, phase: str) -> None:
+        """
+        Charge the time since the previous mark to a phase.
+
+        Args:
+            phase (str): One of ``PHASES``.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current[self._phase_index[phase]] += now - self._last_mark
+        self._last_mark = now
+
+    def end_frame(self) -> None:
+        """Store the current frame's timings in the ring buffer."""
+        if not self.enabled:
+            return
+        head = self._head
+        for i, value in enumerate(self._current):
+            self._samples[i][head] = value
+        self._totals[head] = time.perf_counter() - self._frame_start
+        self._head = (head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def frame_times(self) -> List[float]:
+        """
+        Get recorded total frame times, oldest first.
+
+        Returns:
+            List[float]: Frame times in seconds.
+        """
+        return [self._totals[i] for i in self._ordered_indices()]
+
+    def percentiles(self, phase: str) -> Tuple[float, float, float]:
+        """
+        Compute rolling p50/p95/p99 for a phase, or for "frame" totals.
+
+        Args:
+            phase (str): One of ``PHASES`` or "frame".
+
+        Returns:
+            Tuple[float, float, float]: p50, p95 and p99 in milliseconds.
+        """
+        if self._count == 0:
+            return (0.0, 0.0, 0.0)
+        source = self._totals if phase == "frame" else self._samples[self._phase_index[phase]]
+        values = sorted(source[i] for i in range(self._count))
+        last = len(values) - 1
+        return tuple(values[min(last, int(q * len(values)))] * 1000 for q in (0.50, 0.95, 0.99))
+
+    def dump_csv(self, path: str) -> None:
+        """
+        Write the ring buffer to a CSV file, oldest frame first.
+
+        Args:
+            path (str): Output file path.
+        """
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", *[f"{name}_ms" for name in self.PHASES], "total_ms"])
+            for row, i in enumerate(self._ordered_indices()):
+                writer.writerow(
+                    [row]
+                    + [f"{samples[i] * 1000:.4f}" for samples in self._samples]
+                    + [f"{self._totals[i] * 1000:.4f}"]
+                )
+
+    def draw(self, screen: pygame.Surface, position: Tuple[int, int] = (10, 245)) -> None:
+        """
+        Draw the timing overlay.
+
+        Percentiles are refreshed every ``STATS_INTERVAL`` frames rather than
+        sorted on every frame.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+            position (Tuple[int, int]): Top-left corner of the overlay.
+        """
+        if not self.enabled:
+            return
+
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        self._frames_since_stats += 1
+        if self._frames_since_stats >= self.STATS_INTERVAL:
+            self._stats = {name: self.percentiles(name) for name in (*self.PHASES, "frame")}
+            self._frames_since_stats = 0
+
+        x, y = position
+        line_height = 16
+        width = 260
+        graph_height = 50
+        rows = len(self.PHASES) + 2
+        panel = pygame.Surface((width, rows * line_height + graph_height + 12))
+        panel.set_alpha(180)
+        panel.fill((0, 0, 0))
+        screen.blit(panel, (x, y))
+
+        header = self._font.render("phase       p50    p95    p99 ms", True, (255, 255, 0))
+        screen.blit(header, (x + 6, y + 4))
+        for row, name in enumerate((*self.PHASES, "frame"), start=1):
+            p50, p95, p99 = self._stats.get(name, (0.0, 0.0, 0.0))
+            text = self._font.render(f"{name:<10}{p50:6.2f} {p95:6.2f} {p99:6.2f}", True, (255, 255, 255))
+            screen.blit(text, (x + 6, y + 4 + row * line_height))
+
+        self._draw_graph(screen, pygame.Rect(x + 6, y + 8 + rows * line_height, width - 12, graph_height))
+
+    def _draw_graph(self, screen: pygame.Surface, rect: pygame.Rect) -> None:
+        """Draw recent frame times as a line graph scaled to the slowest frame."""
+        times = self.frame_times()[-rect.width:]
+        if len(times) < 2:
+            return
+
+        peak = max(times) or 1.0
+        step = rect.width / (len(times) - 1)
+        points = [
+            (rect.x + i * step, rect.bottom - (t / peak) * rect.height)
+            for i, t in enumerate(times)
+        ]
+        pygame.draw.rect(screen, (80, 80, 80), rect, 1)
+        pygame.draw.lines(screen, (0, 255, 0), False, points)
+
+    def _ordered_indices(self) -> List[int]:
+        """Ring buffer slots in chronological order."""
+        start = (self._head - self._count) % self.capacity
+        return [(start + i) % self.capacity for i in range(self._count)]
@@ -0,0 +1,159 @@
+"""
+Decoded image cache.
+
+This module keeps decoded images on disk as raw pixels behind a small
+header, so later launches memory-map them instead of decoding PNG and JPEG
+files again. Entries are named after the source path and stamped with the
+source file's modification time and size; a stale entry is decoded again
+and overwritten automatically.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from typing import Optional, Tuple
+
+import pygame
+
+MAGIC = b"SKRAW\x00\x00\x01"
+# magic, source mtime (ns), source size, width, height, pixel format
+_HEADER = struct.Struct("<8sqqII4s")
+HEADER_SIZE = 64  # pixels start here, aligned for the blitters
+
+Stamp = Tuple[int, int]  # source mtime in nanoseconds, source size in bytes
+
+# Directory decoded images are cached in; None disables the disk cache
+_cache_dir: Optional[str] = None
+
+
+def set_cache_dir(path: Optional[str]) -> None:
+    """
+    Set where decoded images are cached on disk.
+
+    Args:
+        path (Optional[str]): Cache directory, or None to disable the disk cache.
+    """
+    global _cache_dir
+    _cache_dir = path
+
+
+def write_raw(cache_path: str, surface: pygame.Surface, stamp: Stamp = (0, 0)) -> None:
+    """
+    Store a surface's pixels in a cache file.
+
+    The file is written under a temporary name and renamed into place, so a
+    crash never leaves a truncated entry.
+
+    Args:
+        cache_path (str): Cache file to write.
+        surface (pygame.Surface): Surface to store; RGBA if it has per-pixel
+            alpha or a colorkey, RGB otherwise.
+        stamp (Stamp): Source file stamp checked when the entry is read.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    has_alpha = surface.get_flags() & pygame.SRCALPHA or surface.get_colorkey() is not None
+    pixel_format = "RGBA" if has_alpha else "RGB"
+    width, height = surface.get_size()
+    header = _HEADER.pack(MAGIC, stamp[0], stamp[1], width, height, pixel_format.encode().ljust(4, b"\x00"))
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\x00"))
+        f.write(pygame.image.tobytes(surface, pixel_format))
+    os.replace(temp_path, cache_path)
+
+
+def map_raw(cache_path: str, stamp: Optional[Stamp] = None) -> Optional[pygame.Surface]:
+    """
+    Build a surface straight on a memory-mapped cache file.
+
+    The mapping is copy-on-write: pages are read from the file as they are
+    touched, and drawing onto the surface never changes the file. The
+    surface keeps the mapping alive.
+
+    Args:
+        cache_path (str): Cache file to read.
+        stamp (Optional[Stamp]): Source file stamp the entry must carry; not
+            checked if omitted.
+
+    Returns:
+        Optional[pygame.Surface]: The surface, or None if the entry is
+        missing, stale or damaged.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapped) < HEADER_SIZE:
+        return None
+    magic, mtime, size, width, height, pixel_format = _HEADER.unpack_from(mapped)
+    pixel_format = pixel_format.rstrip(b"\x00").decode("ascii", "replace")
+    if magic != MAGIC or (stamp is not None and (mtime, size) != tuple(stamp)) \
+            or pixel_format not in ("RGB", "RGBA") \
+            or len(mapped) != HEADER_SIZE + width * height * len(pixel_format):
+        return None
+    try:
+        return pygame.image.frombuffer(memoryview(mapped)[HEADER_SIZE:], (width, height), pixel_format)
+    except (ValueError, pygame.error):
+        return None
+
+
+def cache_path_for(path: str) -> Optional[str]:
+    """
+    Get the cache file a source image is stored in.
+
+    Args:
+        path (str): Source image path.
+
+    Returns:
+        Optional[str]: Cache file path, or None while the disk cache is disabled.
+    """
+    if _cache_dir is None:
+        return None
+    digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+    return os.path.join(_cache_dir, f"{digest}-{os.path.basename(path)}.raw")
+
+
+def load(path: str) -> pygame.Surface:
+    """
+    Load an image, memory-mapping its decoded pixels when they are cached.
+
+    A miss decodes the file with ``pygame.image.load`` and stores the
+    pixels for the next launch. The result has the same pixel layout on a
+    miss and a hit, so callers see no difference between cold and warm
+    starts.
+
+    Args:
+        path (str): Image file path.
+
+    Returns:
+        pygame.Surface: The decoded image.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        pygame.error: If the file cannot be decoded.
+    """
+    cache_path = cache_path_for(path)
+    if cache_path is None:
+        return pygame.image.load(path)
+
+    info = os.stat(path)
+    stamp = (info.st_mtime_ns, info.st_size)
+    surface = map_raw(cache_path, stamp)
+    if surface is not None:
+        return surface
+
+    surface = pygame.image.load(path)
+    try:
+        write_raw(cache_path, surface, stamp)
+    except OSError as e:
+        print(f"Warning: Could not cache decoded image {path}: {e}")
+        return surface
+    return map_raw(cache_path, stamp) or surface
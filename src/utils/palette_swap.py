@@ -0,0 +1,119 @@
+"""
+Palette swaps.
+
+This module recolors whole sprite sheets for alternate costumes. A palette
+is a list of rules, each replacing the colors near a source color with a
+target color shaded by the original brightness. Every rule is applied to
+the full sheet with a few whole-surface pygame operations (a threshold
+mask, a grayscale copy, a multiply fill and a masked composite), so no
+Python code runs per pixel. Recolored sheets can be kept on disk in the
+``image_cache`` format, keyed by the sheet hash and the palette, so later
+runs memory-map them instead of recoloring.
+"""
+
+import hashlib
+import json
+import os
+from typing import Optional, Sequence, Tuple
+
+import pygame
+
+from src.utils import image_cache
+
+Color = Tuple[int, int, int]
+Rule = Tuple[Color, Color, Color]  # source color, per-channel tolerance, target color
+
+# Directory recolored sheets are cached in; None disables the disk cache
+_cache_dir: Optional[str] = None
+
+
+def set_cache_dir(path: Optional[str]) -> None:
+    """
+    Set where recolored sheets are cached on disk.
+
+    Args:
+        path (Optional[str]): Cache directory, or None to disable the disk cache.
+    """
+    global _cache_dir
+    _cache_dir = path
+
+
+def palette_key(palette: Sequence[Rule]) -> str:
+    """
+    Get a short stable key for a palette.
+
+    Args:
+        palette (Sequence[Rule]): The palette rules.
+
+    Returns:
+        str: Hex digest identifying the palette.
+    """
+    rules = [[list(color) for color in rule] for rule in palette]
+    return hashlib.sha1(json.dumps(rules).encode()).hexdigest()[:12]
+
+
+def recolor(surface: pygame.Surface, palette: Sequence[Rule]) -> pygame.Surface:
+    """
+    Apply a palette to a surface.
+
+    Rules are matched against the original colors, so a later rule never
+    recolors pixels produced by an earlier one; where rules overlap, the
+    later one wins. Alpha is kept.
+
+    Args:
+        surface (pygame.Surface): Surface to recolor; not modified.
+        palette (Sequence[Rule]): The palette rules.
+
+    Returns:
+        pygame.Surface: A recolored copy.
+    """
+    result = surface.copy()
+    if not palette:
+        return result
+
+    shade = pygame.transform.grayscale(surface)
+    for source, tolerance, target in palette:
+        mask = pygame.mask.from_threshold(surface, (*source, 255), (*tolerance, 255))
+        if not mask.count():
+            continue
+        tinted = shade.copy()
+        # Multiply keeps the shading; alpha is multiplied by 255, i.e. kept
+        tinted.fill((*target, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        result = mask.to_surface(result, setsurface=tinted, unsetsurface=result)
+    return result
+
+
+def recolor_sheet(path: str, surface: pygame.Surface, palette: Sequence[Rule]) -> pygame.Surface:
+    """
+    Recolor a sprite sheet, reusing the disk cache when enabled.
+
+    Cached sheets are stored as raw pixels named after the sheet hash, the
+    palette key and the size, so an edited sheet or palette misses the
+    cache instead of loading stale pixels.
+
+    Args:
+        path (str): Sheet path; the file is hashed for the cache key.
+        surface (pygame.Surface): The decoded sheet.
+        palette (Sequence[Rule]): The palette rules.
+
+    Returns:
+        pygame.Surface: The recolored sheet.
+    """
+    if _cache_dir is None:
+        return recolor(surface, palette)
+
+    with open(path, "rb") as f:
+        sheet_digest = hashlib.sha1(f.read()).hexdigest()
+    width, height = surface.get_size()
+    cache_path = os.path.join(_cache_dir, f"{sheet_digest}-{palette_key(palette)}-{width}x{height}.raw")
+
+    cached = image_cache.map_raw(cache_path)
+    if cached is not None:
+        return cached
+
+    recolored = recolor(surface, palette)
+    try:
+        image_cache.write_raw(cache_path, recolored)
+    except OSError as e:
+        print(f"Warning: Could not cache recolored sheet {path}: {e}")
+    return recolored
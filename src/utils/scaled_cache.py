@@ -0,0 +1,94 @@
+"""
+Scaled surface cache.
+
+This module keeps smoothly scaled copies of sprite frames and background
+tiles for a small set of zoom levels, so zooming never rescales the same
+pixels twice while the copies stay within a memory budget.
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+
+class ScaledSurfaceCache:
+    """
+    LRU cache of scaled surfaces keyed by source surface and size.
+
+    Copies are built on first use. When the cached pixels exceed the
+    budget, the least recently used copies are dropped; a copy is rebuilt
+    the next time it is asked for.
+
+    Attributes:
+        memory_budget (int): Maximum bytes of cached pixels.
+        nbytes (int): Bytes of pixel data currently cached.
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups that had to scale a surface.
+    """
+
+    def __init__(self, memory_budget: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            memory_budget (int): Maximum bytes of cached pixels.
+        """
+        self.memory_budget = memory_budget
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Tuple[pygame.Surface, Tuple[int, int]], pygame.Surface]" = OrderedDict()
+
+    def get(self, source: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Get a copy of a surface scaled to a size, scaling it on first use.
+
+        Args:
+            source (pygame.Surface): Surface to scale.
+            size (Tuple[int, int]): Size of the scaled copy.
+
+        Returns:
+            pygame.Surface: The scaled copy.
+        """
+        key = (source, size)
+        scaled = self._cache.get(key)
+        if scaled is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return scaled
+
+        self.misses += 1
+        try:
+            scaled = pygame.transform.smoothscale(source, size)
+        except ValueError:
+            # smoothscale only handles 24 and 32 bit surfaces
+            scaled = pygame.transform.scale(source, size)
+        self._cache[key] = scaled
+        self.nbytes += scaled.get_pitch() * scaled.get_height()
+        self._evict()
+        return scaled
+
+    def clear(self) -> None:
+        """Drop every cached copy."""
+        self._cache.clear()
+        self.nbytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, int]: Entry count, cached bytes, hits and misses.
+        """
+        return {"entries": len(self._cache), "bytes": self.nbytes, "hits": self.hits, "misses": self.misses}
+
+    def _evict(self) -> None:
+        """Drop least recently used copies until within the memory budget."""
+        # Always keep the newest copy, even if it alone exceeds the budget
+        while self.nbytes > self.memory_budget and len(self._cache) > 1:
+            _, scaled = self._cache.popitem(last=False)
+            self.nbytes -= scaled.get_pitch() * scaled.get_height()
+
+    def __len__(self) -> int:
+        """Number of cached copies."""
+        return len(self._cache)
@@ -0,0 +1,131 @@
+"""
+Tick scheduler.
+
+This module runs callbacks after a number of simulation ticks, so timed
+game events (round pauses, round intros, timeouts) never block the loop.
+"""
+
+import heapq
+import itertools
+from typing import Callable, List
+
+
+class Timer:
+    """
+    A scheduled callback; returned by ``Scheduler.call_later``.
+
+    Attributes:
+        tick (int): Tick the callback runs on.
+        cancelled (bool): Whether the timer was cancelled or has already run.
+    """
+
+    __slots__ = ("tick", "seq", "callback", "args", "cancelled")
+
+    def __init__(self, tick: int, seq: int, callback: Callable, args: tuple):
+        self.tick = tick
+        self.seq = seq
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def __lt__(self, other: "Timer") -> bool:
+        return (self.tick, self.seq) < (other.tick, other.seq)
+
+    def cancel(self) -> None:
+        """Stop the callback from running."""
+        self.cancelled = True
+        self.callback = None
+        self.args = ()
+
+
+class Scheduler:
+    """
+    Binary-heap timer queue driven by simulation ticks.
+
+    Scheduling and running a timer cost O(log n) in the number of pending
+    timers, and ``advance`` only looks at the earliest one when nothing is
+    due. Cancelled timers stay in the heap until they reach the top and are
+    then discarded. Timers due on the same tick run in the order they were
+    scheduled; a callback may schedule further timers, and ones due on the
+    current tick still run before ``advance`` returns.
+
+    Attributes:
+        tick (int): Ticks advanced so far.
+    """
+
+    def __init__(self):
+        """Initialize an empty scheduler at tick 0."""
+        self.tick = 0
+        self._heap: List[Timer] = []
+        self._seq = itertools.count()
+
+    def call_later(self, ticks: int, callback: Callable, *args) -> Timer:
+        """
+        Run a callback after a number of ticks.
+
+        Args:
+            ticks (int): Ticks from now; 0 runs on the next ``advance``.
+            callback (Callable): Function to call.
+            *args: Arguments for the callback.
+
+        Returns:
+            Timer: Handle that can cancel the callback.
+        """
+        return self.call_at(self.tick + max(1, ticks), callback, *args)
+
+    def call_at(self, tick: int, callback: Callable, *args) -> Timer:
+        """
+        Run a callback on a given tick.
+
+        Args:
+            tick (int): Tick to run on; past ticks run on the next ``advance``.
+            callback (Callable): Function to call.
+            *args: Arguments for the callback.
+
+        Returns:
+            Timer: Handle that can cancel the callback.
+        """
+        timer = Timer(tick, next(self._seq), callback, args)
+        heapq.heappush(self._heap, timer)
+        return timer
+
+    def advance(self) -> int:
+        """
+        Move to the next tick and run every callback due by then.
+
+        Returns:
+            int: Number of callbacks run.
+        """
+        self.tick += 1
+        heap = self._heap
+        ran = 0
+        while heap and heap[0].tick <= self.tick:
+            timer = heapq.heappop(heap)
+            if not timer.cancelled:
+                callback, args = timer.callback, timer.args
+                timer.cancel()  # fired; drops the references
+                callback(*args)
+                ran += 1
+        return ran
+
+    def remaining(self, timer: Timer) -> int:
+        """
+        Ticks until a timer fires.
+
+        Args:
+            timer (Timer): A pending timer.
+
+        Returns:
+            int: Ticks left, 0 if due or already fired.
+        """
+        return max(0, timer.tick - self.tick)
+
+    def clear(self) -> None:
+        """Cancel every pending timer."""
+        for timer in self._heap:
+            timer.cancel()
+        self._heap = []
+
+    def __len__(self) -> int:
+        """Number of timers in the queue, including cancelled ones not yet discarded."""
+        return len(self._heap)
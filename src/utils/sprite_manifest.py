@@ -0,0 +1,351 @@
+"""
+Sprite sheet manifests.
+
+This module describes a character's animation clips in a JSON manifest
+(sheet, row, frame count and cell size per clip), loads every clip in one
+validated pass, and builds manifests by auto-slicing sheets on their
+transparent gutters.
+
+Build or refresh a manifest with:
+    python -m src.utils.sprite_manifest assets/sprites/sonya
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+from src.utils.palette_swap import Rule, palette_key, recolor_sheet
+from src.utils.sprite_utils import SpriteSheet, trim_frame
+
+
+MANIFEST_NAME = "manifest.json"
+
+Rect = Tuple[int, int, int, int]
+
+# Integer fields every clip entry needs besides its sheet name
+CLIP_FIELDS = ("row", "frames", "width", "height")
+
+# Loaded clips by (sprites directory, trim, palette key); frames are shared read-only
+_clip_cache: Dict[Tuple[str, bool, Optional[str]], Dict[str, List[pygame.Surface]]] = {}
+
+
+class ManifestError(ValueError):
+    """Raised when a manifest is malformed or does not match its sprite sheets."""
+
+
+def sheet_hash(path: str) -> str:
+    """
+    Hash a sprite sheet file.
+
+    Args:
+        path (str): Sheet path.
+
+    Returns:
+        str: SHA-1 hex digest of the file contents.
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _merge_spans(rects: List[pygame.Rect], axis: int, min_gap: int) -> List[List[pygame.Rect]]:
+    """
+    Group rectangles whose extents on one axis overlap or nearly touch.
+
+    Args:
+        rects (List[pygame.Rect]): Rectangles to group.
+        axis (int): 0 to group along x, 1 along y.
+        min_gap (int): Gaps narrower than this do not separate groups.
+
+    Returns:
+        List[List[pygame.Rect]]: Groups ordered along the axis.
+    """
+    groups: List[List[pygame.Rect]] = []
+    end = 0
+    for rect in sorted(rects, key=lambda r: (r.x, r.y)[axis]):
+        start, stop = ((rect.x, rect.right), (rect.y, rect.bottom))[axis]
+        if groups and start - end < min_gap:
+            groups[-1].append(rect)
+            end = max(end, stop)
+        else:
+            groups.append([rect])
+            end = stop
+    return groups
+
+
+def slice_sheet(surface: pygame.Surface, min_gap: int = 8, min_area: int = 64) -> List[List[Rect]]:
+    """
+    Find frames on a sheet by splitting it along fully transparent gutters.
+
+    Opaque regions are found as connected components; specks smaller than
+    ``min_area`` pixels are ignored. Components are grouped into rows
+    across horizontal gutters, then into frames across vertical gutters
+    within each row.
+
+    Args:
+        surface (pygame.Surface): The sprite sheet.
+        min_gap (int): Narrowest gutter, in pixels, that separates frames.
+        min_area (int): Smallest component, in pixels, that counts.
+
+    Returns:
+        List[List[Rect]]: Per row, the (x, y, width, height) of each frame.
+    """
+    mask = pygame.mask.from_surface(surface)
+    components = [rect for rect in mask.get_bounding_rects() if rect.w * rect.h >= min_area]
+
+    rows = []
+    for band in _merge_spans(components, 1, min_gap):
+        frames = []
+        for group in _merge_spans(band, 0, min_gap):
+            bounds = group[0].unionall(group[1:])
+            frames.append((bounds.x, bounds.y, bounds.w, bounds.h))
+        rows.append(frames)
+    return rows
+
+
+def infer_grid(rows: List[List[Rect]], sheet_size: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Infer the cell size of a fixed grid from sliced frames.
+
+    The cell height is the smallest spacing between row tops and the cell
+    width the median spacing between frame left edges, which tolerates
+    frames that do not fill their cells.
+
+    Args:
+        rows (List[List[Rect]]): Output of ``slice_sheet``.
+        sheet_size (Tuple[int, int]): Sheet width and height.
+
+    Returns:
+        Tuple[int, int]: Cell width and height.
+    """
+    tops = [min(frame[1] for frame in row) for row in rows]
+    spacings = [b - a for a, b in zip(tops, tops[1:])]
+    height = min(spacings) if spacings else sheet_size[1]
+
+    steps = sorted(b[0] - a[0] for row in rows for a, b in zip(row, row[1:]))
+    if steps:
+        width = steps[len(steps) // 2]
+    else:
+        width = max((frame[0] + frame[2] for row in rows for frame in row), default=sheet_size[0])
+    return width, height
+
+
+def load_manifest(path: str) -> dict:
+    """
+    Read a manifest file.
+
+    Args:
+        path (str): Manifest path.
+
+    Returns:
+        dict: The manifest.
+
+    Raises:
+        FileNotFoundError: If the manifest does not exist.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def manifest_sheets(manifest: dict) -> List[str]:
+    """
+    List the sheets a manifest's clips are sliced from.
+
+    Malformed entries are skipped here and reported by ``validate_manifest``.
+
+    Args:
+        manifest (dict): The manifest.
+
+    Returns:
+        List[str]: Sheet file names, each once, sorted.
+    """
+    clips = manifest.get("clips") if isinstance(manifest, dict) else None
+    if not isinstance(clips, dict):
+        return []
+    return sorted({clip["sheet"] for clip in clips.values()
+                   if isinstance(clip, dict) and isinstance(clip.get("sheet"), str)})
+
+
+def validate_manifest(manifest: dict, sheet_sizes: Dict[str, Tuple[int, int]]) -> None:
+    """
+    Check that every clip is complete and fits the real sheet sizes.
+
+    Args:
+        manifest (dict): The manifest.
+        sheet_sizes (Dict[str, Tuple[int, int]]): Loaded size of each sheet.
+
+    Raises:
+        ManifestError: Listing every clip that is missing a field or does
+            not fit its sheet.
+    """
+    clips = manifest.get("clips") if isinstance(manifest, dict) else None
+    if not isinstance(clips, dict):
+        raise ManifestError("Invalid sprite manifest: missing 'clips' object")
+
+    errors = []
+    for sheet, info in manifest.get("sheets", {}).items():
+        size = info.get("size") if isinstance(info, dict) else None
+        if size is None:
+            errors.append(f"{sheet}: missing 'size'")
+        elif sheet in sheet_sizes and tuple(size) != tuple(sheet_sizes[sheet]):
+            errors.append(f"{sheet}: size changed since the manifest was built; rebuild it")
+    for name, clip in clips.items():
+        if not isinstance(clip, dict):
+            errors.append(f"{name}: clip entry is not an object")
+            continue
+        missing = [key for key in ("sheet", *CLIP_FIELDS) if key not in clip]
+        if missing:
+            errors.append(f"{name}: missing {', '.join(repr(key) for key in missing)}")
+            continue
+        invalid = [key for key in CLIP_FIELDS if not isinstance(clip[key], int) or clip[key] < 0]
+        if invalid:
+            errors.append(f"{name}: not a non-negative integer: {', '.join(repr(key) for key in invalid)}")
+            continue
+        sheet = clip["sheet"]
+        if sheet not in sheet_sizes:
+            errors.append(f"{name}: unknown sheet '{sheet}'")
+            continue
+        sheet_width, sheet_height = sheet_sizes[sheet]
+        right = clip["frames"] * clip["width"]
+        bottom = (clip["row"] + 1) * clip["height"]
+        if clip["frames"] < 1 or right > sheet_width or bottom > sheet_height:
+            errors.append(
+                f"{name}: {clip['frames']} frames of {clip['width']}x{clip['height']} in row "
+                f"{clip['row']} do not fit {sheet} ({sheet_width}x{sheet_height})"
+            )
+    if errors:
+        raise ManifestError("Invalid sprite manifest:\n  " + "\n  ".join(errors))
+
+
+def load_clips(sprites_dir: str, trim: bool = True, cached: bool = True,
+               palette: Optional[Sequence[Rule]] = None) -> Dict[str, List[pygame.Surface]]:
+    """
+    Load every clip listed in a character's manifest.
+
+    Each sheet is decoded once and all clips are validated against it
+    before any frame is extracted. Loaded clips are kept for the rest of
+    the process, so every later character of the same kind shares the
+    same frame surfaces instead of decoding the sheets again; callers
+    must not draw onto returned frames. With a palette, each sheet is
+    recolored in one pass before slicing (see ``palette_swap``), and the
+    recolored clips are cached separately from the original ones.
+
+    Args:
+        sprites_dir (str): Directory holding the sheets and ``manifest.json``.
+        trim (bool): Crop frames to their opaque pixels (see ``trim_frame``).
+        cached (bool): Reuse clips loaded earlier in this process.
+        palette (Optional[Sequence[Rule]]): Costume palette to recolor the sheets with.
+
+    Returns:
+        Dict[str, List[pygame.Surface]]: Clip name to frames.
+
+    Raises:
+        FileNotFoundError: If the manifest or a sheet cannot be loaded.
+        ManifestError: If a clip is missing a field or does not fit its sheet.
+    """
+    key = (os.path.abspath(sprites_dir), trim, palette_key(palette) if palette else None)
+    if cached and key in _clip_cache:
+        return dict(_clip_cache[key])
+
+    manifest = load_manifest(os.path.join(sprites_dir, MANIFEST_NAME))
+    sheets = {name: SpriteSheet(os.path.join(sprites_dir, name)) for name in manifest_sheets(manifest)}
+    validate_manifest(manifest, {name: sheet.sheet_size for name, sheet in sheets.items()})
+    if palette:
+        for name, sheet in sheets.items():
+            sheet.image = recolor_sheet(os.path.join(sprites_dir, name), sheet.image, palette)
+
+    clips = {}
+    for name, clip in manifest["clips"].items():
+        sheet = sheets[clip["sheet"]]
+        frames = [sheet.get_frame(clip["row"], col, clip["width"], clip["height"])
+                  for col in range(clip["frames"])]
+        clips[name] = [trim_frame(frame) for frame in frames] if trim else frames
+    if cached:
+        _clip_cache[key] = clips
+    return dict(clips)
+
+
+def cached_clips() -> Dict[Tuple[str, bool, Optional[str]], Dict[str, List[pygame.Surface]]]:
+    """
+    Get every clip set kept by ``load_clips``.
+
+    Returns:
+        Dict[Tuple[str, bool, Optional[str]], Dict[str, List[pygame.Surface]]]:
+        Clips by (sprites directory, trim, palette key); do not modify.
+    """
+    return dict(_clip_cache)
+
+
+def clear_clip_cache() -> None:
+    """Forget clips loaded by ``load_clips`` so the next load decodes the sheets again."""
+    _clip_cache.clear()
+
+
+def build_manifest(sprites_dir: str, sheets: Optional[List[str]] = None,
+                   existing: Optional[dict] = None) -> dict:
+    """
+    Build or refresh a manifest by auto-slicing sheets.
+
+    Slicing results are cached in the manifest's ``sheets`` section keyed
+    by each sheet's hash, so unchanged sheets are not sliced again. Clips
+    already in ``existing`` are kept as they are; every row of a newly
+    sliced sheet becomes a clip named ``<sheet>_<row>`` on the inferred grid.
+
+    Args:
+        sprites_dir (str): Directory holding the sheets.
+        sheets (Optional[List[str]]): Sheet file names; every PNG if omitted.
+        existing (Optional[dict]): Previous manifest to refresh.
+
+    Returns:
+        dict: The manifest.
+    """
+    manifest = existing or {"clips": {}, "sheets": {}}
+    manifest.setdefault("sheets", {})
+    if sheets is None:
+        sheets = sorted(name for name in os.listdir(sprites_dir) if name.lower().endswith(".png"))
+
+    used = set(manifest_sheets(manifest))
+    for name in sheets:
+        path = os.path.join(sprites_dir, name)
+        digest = sheet_hash(path)
+        cached = manifest["sheets"].get(name)
+        if cached is None or cached["sha1"] != digest:
+            surface = pygame.image.load(path)
+            cached = {"sha1": digest, "size": list(surface.get_size()), "slices": slice_sheet(surface)}
+            manifest["sheets"][name] = cached
+
+        if name in used:
+            continue
+        width, height = infer_grid(cached["slices"], cached["size"])
+        stem = os.path.splitext(name)[0]
+        for row, frames in enumerate(cached["slices"]):
+            count = min(len(frames), cached["size"][0] // width)
+            if count and (row + 1) * height <= cached["size"][1]:
+                manifest["clips"][f"{stem}_{row}"] = {
+                    "sheet": name, "row": row, "frames": count, "width": width, "height": height,
+                }
+    return manifest
+
+
+def main() -> None:
+    """Command-line entry point: build or refresh a character manifest."""
+    parser = argparse.ArgumentParser(description="Build a sprite manifest by auto-slicing sheets")
+    parser.add_argument("sprites_dir", help="directory holding the sprite sheets")
+    parser.add_argument("sheets", nargs="*", help="sheet file names (default: every PNG)")
+    args = parser.parse_args()
+
+    path = os.path.join(args.sprites_dir, MANIFEST_NAME)
+    existing = load_manifest(path) if os.path.exists(path) else None
+    manifest = build_manifest(args.sprites_dir, args.sheets or None, existing)
+
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Wrote {len(manifest['clips'])} clips over {len(manifest['sheets'])} sheets to {path}")
+
+
+if __name__ == "__main__":
+    main()
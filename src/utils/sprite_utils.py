@@ -8,6 +8,65 @@ frames for animations.
 import pygame
 from typing import List, Tuple, Optional
 
+from src.utils import image_cache
+
+
+class TrimmedFrame(pygame.Surface):
+    """
+    An animation frame cropped to its opaque pixels.
+    
+    Attributes:
+        offset (Tuple[int, int]): Position of the cropped pixels inside the
+            original cell; add it to the draw position.
+        cell_size (Tuple[int, int]): Size of the original cell.
+    """
+    
+    def __init__(self, size: Tuple[int, int], offset: Tuple[int, int], cell_size: Tuple[int, int]):
+        """
+        Create an empty trimmed frame.
+        
+        Args:
+            size (Tuple[int, int]): Size of the cropped pixels.
+            offset (Tuple[int, int]): Position of the crop inside the cell.
+            cell_size (Tuple[int, int]): Size of the original cell.
+        """
+        super().__init__(size, pygame.SRCALPHA)
+        self.offset = offset
+        self.cell_size = cell_size
+
+
+def trim_frame(frame: pygame.Surface) -> TrimmedFrame:
+    """
+    Crop a frame to the bounding box of its non-transparent pixels.
+    
+    The pixels are copied, so the result does not keep the sprite sheet
+    alive.
+    
+    Args:
+        frame (pygame.Surface): A full sprite sheet cell.
+        
+    Returns:
+        TrimmedFrame: The cropped frame and its draw offset.
+    """
+    bounds = frame.get_bounding_rect()
+    trimmed = TrimmedFrame(bounds.size, bounds.topleft, frame.get_size())
+    # MAX against the zeroed surface copies RGBA exactly, with no blending
+    trimmed.blit(frame, (0, 0), bounds, special_flags=pygame.BLEND_RGBA_MAX)
+    return trimmed
+
+
+def frame_offset(frame: pygame.Surface) -> Tuple[int, int]:
+    """
+    Get the draw offset of a frame.
+    
+    Args:
+        frame (pygame.Surface): A trimmed or untrimmed frame.
+        
+    Returns:
+        Tuple[int, int]: The offset to add to the draw position.
+    """
+    return getattr(frame, "offset", (0, 0))
+
 
 class SpriteSheet:
     """
@@ -29,7 +88,7 @@ class SpriteSheet:
             FileNotFoundError: If the sprite sheet file is not found.
         """
         try:
-            self.image = pygame.image.load(file_path)
+            self.image = image_cache.load(file_path)
             self.sheet_size = self.image.get_size()
         except pygame.error as e:
             raise FileNotFoundError(f"Failed to load sprite sheet: {file_path}") from e
@@ -63,7 +122,8 @@ class SpriteSheet:
         frame_rect = pygame.Rect(col * width, row * height, width, height)
         return self.image.subsurface(frame_rect)
     
-    def get_frames(self, row: int, num_frames: int, width: int, height: int) -> List[pygame.Surface]:
+    def get_frames(self, row: int, num_frames: int, width: int, height: int,
+                   trim: bool = False) -> List[pygame.Surface]:
         """
         Extract multiple frames from a single row.
         
@@ -72,6 +132,8 @@ class SpriteSheet:
             num_frames (int): The number of frames to extract.
             width (int): The width of each frame.
             height (int): The height of each frame.
+            trim (bool): Crop each frame to its opaque pixels and return
+                ``TrimmedFrame`` copies instead of subsurfaces.
             
         Returns:
             List[pygame.Surface]: List of extracted frames.
@@ -80,7 +142,7 @@ class SpriteSheet:
         for col in range(num_frames):
             try:
                 frame = self.get_frame(row, col, width, height)
-                frames.append(frame)
+                frames.append(trim_frame(frame) if trim else frame)
             except ValueError:
                 # Stop if we exceed sprite sheet bounds
                 break
@@ -0,0 +1,305 @@
+"""
+Gameplay video capture.
+
+This module copies rendered frames into a preallocated ring of shared
+memory buffers and encodes them in a background process, to a video
+through ffmpeg when it is installed or to a PNG or raw image sequence
+otherwise.
+"""
+
+import json
+import multiprocessing
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from collections import deque
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import pygame
+
+
+# Memory layout of 32-bit surfaces by RGB masks, as (frombuffer format, ffmpeg pix_fmt).
+# The fourth byte is ignored: display surfaces usually leave it undefined.
+PIXEL_FORMATS = {
+    (0xFF0000, 0xFF00, 0xFF): ("BGRA", "bgr0"),
+    (0xFF, 0xFF00, 0xFF0000): ("RGBA", "rgb0"),
+}
+
+
+def run_encoder(buffer_names: List[str], size: Tuple[int, int], formats: Tuple[str, str],
+                output_format: str, output: str, fps: int, requests, done) -> None:
+    """
+    Encoder process loop: encode each requested ring buffer, then free it.
+
+    Args:
+        buffer_names (List[str]): Shared memory names of the ring buffers.
+        size (Tuple[int, int]): Frame width and height.
+        formats (Tuple[str, str]): Pixel format for ``frombuffer`` and ffmpeg.
+        output_format (str): "ffmpeg", "png" or "raw".
+        output (str): Video file or frame directory.
+        fps (int): Frame rate written to video output.
+        requests: Queue of (buffer index, frame number); None ends the recording.
+        done: Queue buffer indexes are returned on once encoded.
+    """
+    buffers = [shared_memory.SharedMemory(name=name) for name in buffer_names]
+    width, height = size
+    ffmpeg = raw_file = None
+    if output_format == "ffmpeg":
+        ffmpeg = subprocess.Popen(
+            ["ffmpeg", "-loglevel", "error", "-y", "-f", "rawvideo",
+             "-pix_fmt", formats[1], "-s", f"{width}x{height}", "-r", str(fps),
+             "-i", "-", "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p", output],
+            stdin=subprocess.PIPE,
+        )
+    elif output_format == "raw":
+        with open(os.path.join(output, "frames.json"), "w") as f:
+            json.dump({"width": width, "height": height, "format": formats[0], "fps": fps}, f)
+        raw_file = open(os.path.join(output, "frames.raw"), "wb")
+
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        index, number = request
+        pixels = buffers[index].buf
+        try:
+            if ffmpeg is not None:
+                ffmpeg.stdin.write(pixels)
+            elif raw_file is not None:
+                raw_file.write(pixels)
+            else:
+                image = pygame.image.frombuffer(pixels, size, formats[0])
+                image.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MAX)  # force opaque
+                pygame.image.save(image, os.path.join(output, f"frame_{number:06d}.png"))
+                del image
+            done.put(index)
+        except (OSError, pygame.error) as e:
+            print(f"Warning: Video capture frame {number} failed: {e}")
+            done.put(-1 - index)
+
+    if ffmpeg is not None:
+        ffmpeg.stdin.close()
+        ffmpeg.wait()
+    if raw_file is not None:
+        raw_file.close()
+    for buffer in buffers:
+        buffer.close()
+
+
+class VideoCapture:
+    """
+    Frame recorder with a bounded buffer ring and a background encoder.
+
+    The ring is a set of shared memory blocks. ``capture`` copies the
+    frame's pixels straight from the surface's buffer view into the next
+    free block (one ``memcpy``, no allocation) and sends its index to an
+    encoder process, which returns the index once the frame is written.
+    Encoding in a separate process keeps PNG compression and pipe writes
+    from competing with the game loop for the GIL. When the encoder falls
+    behind and no block is free, the captured frame is dropped and counted;
+    the game never waits for the encoder, not even when a recording stops:
+    a helper thread waits for the encoder to drain and frees the ring.
+
+    Output formats:
+        "ffmpeg": H.264 video piped through an ``ffmpeg`` process.
+        "png": One PNG file per frame.
+        "raw": All frames appended to one ``frames.raw`` file, described by
+            ``frames.json``.
+        "auto": "ffmpeg" if it is on the PATH, otherwise "png".
+
+    Attributes:
+        recording (bool): Whether frames are being captured.
+        captured (int): Frames copied into the ring this recording.
+        dropped (int): Frames dropped because the ring was full.
+        encoded (int): Frames written by the encoder.
+        output (Optional[str]): Video file or frame directory of the current recording.
+    """
+
+    def __init__(self, output_dir: str = "captures", output_format: str = "auto",
+                 buffers: int = 8, fps: int = 30):
+        """
+        Initialize the recorder.
+
+        Args:
+            output_dir (str): Directory recordings are written under.
+            output_format (str): "auto", "ffmpeg", "png" or "raw".
+            buffers (int): Number of frame buffers in the ring.
+            fps (int): Frame rate written to video output.
+        """
+        if output_format == "auto":
+            output_format = "ffmpeg" if shutil.which("ffmpeg") else "png"
+        if output_format not in ("ffmpeg", "png", "raw"):
+            raise ValueError(f"Unknown capture format: {output_format}")
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.num_buffers = buffers
+        self.fps = fps
+
+        self.recording = False
+        self.captured = 0
+        self.dropped = 0
+        self.encoded = 0
+        self.output: Optional[str] = None
+
+        self._buffers: List[shared_memory.SharedMemory] = []
+        self._zero_copy = True
+        self._free: deque = deque()
+        self._requests = None
+        self._done = None
+        self._process = None
+        self._finishers: List[threading.Thread] = []
+
+    def toggle(self, surface: pygame.Surface) -> None:
+        """
+        Start or stop recording.
+
+        Args:
+            surface (pygame.Surface): A frame with the size and format to record.
+        """
+        if self.recording:
+            self.stop()
+        else:
+            self.start(surface)
+
+    def start(self, surface: pygame.Surface) -> None:
+        """
+        Allocate the ring and start the encoder for a new recording.
+
+        Args:
+            surface (pygame.Surface): A frame with the size and format to record.
+        """
+        if self.recording:
+            return
+
+        size = surface.get_size()
+        masks = surface.get_masks()[:3]
+        # Copy the view directly when the layout is known and rows are unpadded
+        self._zero_copy = (surface.get_bytesize() == 4 and masks in PIXEL_FORMATS and
+                           surface.get_pitch() == size[0] * 4)
+        formats = PIXEL_FORMATS[masks] if self._zero_copy else ("RGBA", "rgb0")
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(self.output_dir, f"match-{stamp}")
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            if self.output_format == "ffmpeg":
+                self.output = f"{base}.mp4"
+            else:
+                self.output = base
+                os.makedirs(base, exist_ok=True)
+        except OSError as e:
+            print(f"Warning: Could not start video capture: {e}")
+            return
+
+        frame_bytes = size[0] * size[1] * 4
+        self._buffers = [shared_memory.SharedMemory(create=True, size=frame_bytes)
+                         for _ in range(self.num_buffers)]
+        self._free = deque(range(self.num_buffers))
+        self.captured = self.dropped = self.encoded = 0
+
+        # Spawn rather than fork so the encoder does not inherit SDL state
+        context = multiprocessing.get_context("spawn")
+        self._requests = context.Queue()
+        self._done = context.Queue()
+        self._process = context.Process(
+            target=run_encoder,
+            args=([buffer.name for buffer in self._buffers], size, formats, self.output_format,
+                  self.output, self.fps, self._requests, self._done),
+            name="video-encoder",
+            daemon=True,
+        )
+        self._process.start()
+        self.recording = True
+
+    def _collect(self) -> None:
+        """Return buffers the encoder has finished with to the free list."""
+        try:
+            while True:
+                index = self._done.get_nowait()
+                if index >= 0:
+                    self.encoded += 1
+                else:
+                    index = -1 - index
+                self._free.append(index)
+        except queue.Empty:
+            pass
+
+    def capture(self, surface: pygame.Surface) -> bool:
+        """
+        Copy a finished frame into the ring for encoding.
+
+        Args:
+            surface (pygame.Surface): The frame; must match the recording's size.
+
+        Returns:
+            bool: True if the frame was queued, False if it was dropped.
+        """
+        if not self.recording:
+            return False
+        self._collect()
+        if not self._free:
+            self.dropped += 1
+            return False
+
+        index = self._free.popleft()
+        if self._zero_copy:
+            self._buffers[index].buf[:] = memoryview(surface.get_view("0")).cast("B")
+        else:
+            self._buffers[index].buf[:] = pygame.image.tobytes(surface, "RGBA")
+        self._requests.put_nowait((index, self.captured))
+        self.captured += 1
+        return True
+
+    def stop(self) -> None:
+        """
+        End the recording without waiting for the encoder.
+
+        Queued frames are still encoded; a helper thread waits for the
+        encoder to exit, then frees the ring and reports the result.
+        """
+        if not self.recording:
+            return
+        self.recording = False
+        self._requests.put(None)
+
+        finisher = threading.Thread(
+            target=self._finish,
+            args=(self._process, self._done, self._buffers, self.output, self.encoded, self.dropped),
+            name="video-capture-finish", daemon=True
+        )
+        self._process = None
+        self._buffers = []
+        self._finishers = [thread for thread in self._finishers if thread.is_alive()] + [finisher]
+        finisher.start()
+
+    @staticmethod
+    def _finish(process, done, buffers: List[shared_memory.SharedMemory], output: str,
+                encoded: int, dropped: int) -> None:
+        """Wait for an encoder to exit, then free its ring; runs on a helper thread."""
+        process.join()
+        try:
+            while True:
+                if done.get_nowait() >= 0:
+                    encoded += 1
+        except queue.Empty:
+            pass
+
+        for buffer in buffers:
+            buffer.close()
+            buffer.unlink()
+        print(f"Recorded {encoded} frames ({dropped} dropped) to {output}")
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until every stopped recording is fully written.
+
+        Args:
+            timeout (Optional[float]): Most seconds to wait for each; None waits until done.
+        """
+        for thread in self._finishers:
+            thread.join(timeout)
+        self._finishers = [thread for thread in self._finishers if thread.is_alive()]